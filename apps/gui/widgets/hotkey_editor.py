@@ -19,6 +19,16 @@ from PySide6.QtWidgets import (
 
 from crates.profile_schema import HotkeyBinding, ProfileLoader, SettingsManager
 
+# Keys that only change modifier state and never complete a hotkey
+_MODIFIER_ONLY_KEYS = frozenset(
+    {
+        Qt.Key.Key_Control,
+        Qt.Key.Key_Shift,
+        Qt.Key.Key_Alt,
+        Qt.Key.Key_Meta,
+    }
+)
+
 
 class HotkeyCapture(QLineEdit):
     """Line edit that captures key combinations."""
@@ -89,12 +99,7 @@ class HotkeyCapture(QLineEdit):
             self.setStyleSheet("")
             self._update_display()
             return
-        elif key in (
-            Qt.Key.Key_Control,
-            Qt.Key.Key_Shift,
-            Qt.Key.Key_Alt,
-            Qt.Key.Key_Meta,
-        ):
+        elif key in _MODIFIER_ONLY_KEYS:
             # Just modifiers, keep capturing
             return
 
@@ -1,6 +1,6 @@
 """Razer device controls widget for lighting and DPI."""
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QColorDialog,
@@ -69,10 +69,20 @@ class RazerControlsWidget(QWidget):
 
     device_selected = Signal(object)  # Emits RazerDevice when selected
 
+    # Quiet period after the last slider move before the preview is sent
+    PREVIEW_DEBOUNCE_MS = 33
+
     def __init__(self, bridge: OpenRazerBridge, parent=None):
         super().__init__(parent)
         self.bridge = bridge
         self.current_device: RazerDevice | None = None
+
+        # Slider previews are queued on the bridge and flushed from the Qt thread
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self.PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._flush_preview)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -252,6 +262,16 @@ class RazerControlsWidget(QWidget):
         """Handle brightness slider change."""
         self.brightness_label.setText(f"{value}%")
 
+        # Live preview while dragging; only the latest value reaches the device
+        device = self.current_device
+        if device and device.has_brightness and value != device.brightness:
+            self.bridge.queue_brightness(device.serial, value)
+            self._preview_timer.start()
+
+    def _flush_preview(self):
+        """Send the latest queued slider preview."""
+        self.bridge.flush_pending()
+
     def _on_effect_changed(self, effect: str):
         """Handle effect selection change."""
         # Enable/disable color button based on effect
@@ -269,6 +289,10 @@ class RazerControlsWidget(QWidget):
 
         serial = self.current_device.serial
 
+        # Land any queued slider preview before applying the final state
+        self._preview_timer.stop()
+        self._flush_preview()
+
         # Apply brightness
         brightness = self.brightness_slider.value()
         self.bridge.set_brightness(serial, brightness)
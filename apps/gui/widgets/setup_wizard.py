@@ -442,8 +442,7 @@ class SetupWizard(QDialog):
             is_default=self.default_check.isChecked(),
         )
 
-        self.profile_loader.save_profile(profile)
-        self.profile_loader.set_active_profile(profile.id)
+        self.profile_loader.save_and_activate(profile)
 
         # Daemon setup
         if self.autostart_check.isChecked():
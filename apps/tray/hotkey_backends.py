@@ -5,6 +5,7 @@ Provides platform-specific implementations for global hotkey handling:
 - X11Hotkeys: pynput-based for X11 sessions
 """
 
+import functools
 import logging
 import os
 import threading
@@ -15,6 +16,51 @@ from crates.profile_schema import HotkeyBinding
 
 logger = logging.getLogger(__name__)
 
+# One bit per modifier so held-modifier state is a single small int
+_MODIFIER_BITS: dict[str, int] = {"ctrl": 1, "shift": 2, "alt": 4, "meta": 8}
+
+# Normalized modifier names that can participate in a hotkey binding
+MODIFIER_KEYS = frozenset(_MODIFIER_BITS)
+
+# X11 virtual key codes for the number row (48-57) and letters (65-90)
+_VK_TO_NAME: dict[int, str] = {vk: str(vk - 48) for vk in range(48, 58)} | {
+    vk: chr(vk).lower() for vk in range(65, 91)
+}
+
+
+@functools.cache
+def _pynput_key_table() -> tuple[type, type, dict]:
+    """Build the pynput Key -> normalized name table on first use.
+
+    pynput is imported lazily because importing it fails without a display.
+
+    Returns:
+        Tuple of (Key class, KeyCode class, {Key member: name})
+    """
+    from pynput import keyboard
+
+    aliases = {
+        "ctrl": "ctrl",
+        "ctrl_l": "ctrl",
+        "ctrl_r": "ctrl",
+        "shift": "shift",
+        "shift_l": "shift",
+        "shift_r": "shift",
+        "alt": "alt",
+        "alt_l": "alt",
+        "alt_r": "alt",
+    }
+    aliases.update({f"f{i}": f"f{i}" for i in range(1, 13)})
+
+    names = {}
+    for attr, name in aliases.items():
+        # Not every pynput backend defines every key, and some alias members;
+        # setdefault keeps modifiers taking precedence like the old checks
+        member = getattr(keyboard.Key, attr, None)
+        if member is not None:
+            names.setdefault(member, name)
+    return keyboard.Key, keyboard.KeyCode, names
+
 
 def to_portal_format(binding: HotkeyBinding) -> str:
     """Convert HotkeyBinding to GTK accelerator format for portal.
@@ -286,7 +332,10 @@ class X11Hotkeys(HotkeyBackend):
         """
         self.on_activated = on_activated
         self._shortcuts: list[tuple[str, HotkeyBinding]] = []
+        self._bindings: dict[str, HotkeyBinding] = {}
+        self._binding_index: dict[tuple[int, str], str] = {}
         self._current_keys: set[str] = set()
+        self._mod_mask = 0
         self._triggered: set[str] = set()
         self._listener = None
 
@@ -305,8 +354,26 @@ class X11Hotkeys(HotkeyBackend):
         return False
 
     def register_shortcuts(self, shortcuts: list[tuple[str, HotkeyBinding]]) -> bool:
-        """Store shortcuts for matching."""
+        """Store shortcuts and build the (modifiers, key) lookup index."""
         self._shortcuts = shortcuts
+        self._bindings = dict(shortcuts)
+        self._binding_index = {}
+        for action_id, binding in shortcuts:
+            if not binding.enabled or not binding.key:
+                continue
+            unknown = [mod for mod in binding.modifiers if mod not in _MODIFIER_BITS]
+            if unknown:
+                # Folding these to no bit would fire on a weaker chord
+                logger.warning(
+                    "Skipping hotkey %s: unsupported modifiers %s", action_id, ", ".join(unknown)
+                )
+                continue
+            mod_mask = 0
+            for mod in binding.modifiers:
+                mod_mask |= _MODIFIER_BITS[mod]
+            index_key = (mod_mask, binding.key.lower())
+            # First registration wins, matching the old scan order
+            self._binding_index.setdefault(index_key, action_id)
         return True
 
     def start(self) -> None:
@@ -333,40 +400,28 @@ class X11Hotkeys(HotkeyBackend):
             self._listener.stop()
             self._listener = None
             self._current_keys.clear()
+            self._mod_mask = 0
             self._triggered.clear()
             logger.info("X11 hotkey backend stopped")
 
-    def _normalize_key(self, key) -> str | None:
-        """Normalize a pynput key to a comparable string."""
-        from pynput import keyboard
-
-        if isinstance(key, keyboard.Key):
-            # Handle modifier keys
-            if key in (keyboard.Key.ctrl, keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
-                return "ctrl"
-            if key in (keyboard.Key.shift, keyboard.Key.shift_l, keyboard.Key.shift_r):
-                return "shift"
-            if key in (keyboard.Key.alt, keyboard.Key.alt_l, keyboard.Key.alt_r):
-                return "alt"
-            # Handle function keys
-            for i in range(1, 13):
-                if key == getattr(keyboard.Key, f"f{i}", None):
-                    return f"f{i}"
-            return None
-        elif isinstance(key, keyboard.KeyCode):
+    def _normalize_key(self, key, *, chars: bool = True) -> str | None:
+        """Normalize a pynput key to a comparable string.
+
+        Args:
+            key: pynput Key or KeyCode
+            chars: When False, plain KeyCode keys return None without decoding
+        """
+        key_cls, keycode_cls, key_names = _pynput_key_table()
+
+        if isinstance(key, key_cls):
+            return key_names.get(key)
+        if isinstance(key, keycode_cls):
+            if not chars:
+                return None
             if key.char:
                 return key.char.lower()
-            # Handle numpad and other special keys
-            if key.vk is not None:
-                # Number keys 1-9 have vk codes 49-57
-                if 49 <= key.vk <= 57:
-                    return str(key.vk - 48)
-                # Number key 0 has vk code 48
-                if key.vk == 48:
-                    return "0"
-                # Letter keys A-Z have vk codes 65-90
-                if 65 <= key.vk <= 90:
-                    return chr(key.vk).lower()
+            # Handle number and letter keys reported without a char
+            return _VK_TO_NAME.get(key.vk)
         return None
 
     def _check_binding(self, binding: HotkeyBinding) -> bool:
@@ -384,24 +439,33 @@ class X11Hotkeys(HotkeyBackend):
 
     def _on_press(self, key) -> None:
         """Handle key press event."""
-        normalized = self._normalize_key(key)
-        if normalized:
-            self._current_keys.add(normalized)
+        # Modifiers always arrive as Key members, so a plain KeyCode with no
+        # modifier held can never complete a hotkey; skip decoding it
+        normalized = self._normalize_key(key, chars=bool(self._mod_mask))
+        if not normalized:
+            return
+        self._mod_mask |= _MODIFIER_BITS.get(normalized, 0)
+        self._current_keys.add(normalized)
+
+        # Every hotkey needs a modifier, so plain typing stops here
+        if not self._mod_mask:
+            return
 
-        # Check each shortcut
-        for action_id, binding in self._shortcuts:
-            if action_id not in self._triggered and self._check_binding(binding):
-                self._triggered.add(action_id)
-                self.on_activated(action_id)
-                break
+        # Single lookup keyed by the exact mask of held modifiers
+        action_id = self._binding_index.get((self._mod_mask, normalized))
+        if action_id and action_id not in self._triggered:
+            self._triggered.add(action_id)
+            self.on_activated(action_id)
 
     def _on_release(self, key) -> None:
         """Handle key release event."""
         normalized = self._normalize_key(key)
         if normalized:
+            self._mod_mask &= ~_MODIFIER_BITS.get(normalized, 0)
             self._current_keys.discard(normalized)
 
             # Clear triggered state for shortcuts no longer active
-            for action_id, binding in self._shortcuts:
-                if action_id in self._triggered and not self._check_binding(binding):
+            for action_id in tuple(self._triggered):
+                binding = self._bindings.get(action_id)
+                if binding is None or not self._check_binding(binding):
                     self._triggered.discard(action_id)
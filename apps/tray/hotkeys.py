@@ -5,6 +5,8 @@ Supports both Wayland (via xdg-desktop-portal) and X11 (via pynput).
 """
 
 import logging
+import queue
+import threading
 from collections.abc import Callable
 
 from crates.profile_schema import HotkeyBinding, SettingsManager
@@ -37,7 +39,17 @@ class HotkeyListener:
         """
         self.on_profile_switch = on_profile_switch
         self.settings_manager = settings_manager or SettingsManager()
+        self._cached_bindings: tuple[HotkeyBinding, ...] = ()
+        # action_id -> profile index, so activation never parses the id
+        self._action_index: dict[str, int] = {}
+        self._set_bindings(self.settings_manager.settings.hotkeys.profile_hotkeys)
         self._backend: HotkeyBackend | None = None
+        # Profile indexes waiting to be dispatched; None stops the worker
+        self._switch_queue: queue.SimpleQueue[int | None] = queue.SimpleQueue()
+        # Guards _worker and _stopping; the worker clears _worker itself on exit
+        self._worker_lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._stopping = False
         self._init_backend()
 
     def _init_backend(self) -> None:
@@ -58,16 +70,33 @@ class HotkeyListener:
     def _on_shortcut_activated(self, action_id: str) -> None:
         """Handle shortcut activation from backend.
 
+        Called on the backend's listener thread, so this only queues the
+        profile index; the switch itself runs on the dispatch worker.
+
         Args:
             action_id: The action ID (e.g., "profile_0", "profile_1")
         """
-        try:
-            # Extract profile index from action_id
-            if action_id.startswith("profile_"):
-                index = int(action_id.split("_")[1])
+        index = self._action_index.get(action_id)
+        if index is not None:
+            self._switch_queue.put(index)
+        elif action_id.startswith("profile_"):
+            logger.error("Invalid action_id: %s", action_id)
+
+    def _dispatch_switches(self) -> None:
+        """Worker loop that runs queued profile switches."""
+        while True:
+            index = self._switch_queue.get()
+            if index is None:
+                with self._worker_lock:
+                    # A start() since the stop() keeps this worker serving
+                    if self._stopping:
+                        self._worker = None
+                        return
+                continue
+            try:
                 self.on_profile_switch(index)
-        except (ValueError, IndexError) as e:
-            logger.error("Invalid action_id: %s (%s)", action_id, e)
+            except Exception:
+                logger.exception("Profile switch to index %d failed", index)
 
     def _build_shortcuts(self) -> list[tuple[str, HotkeyBinding]]:
         """Build shortcuts list from settings.
@@ -75,17 +104,20 @@ class HotkeyListener:
         Returns:
             List of (action_id, binding) tuples
         """
-        bindings = self.get_bindings()
-        shortcuts = []
-        for i, binding in enumerate(bindings):
-            if binding.enabled and binding.key:
-                action_id = f"profile_{i}"
-                shortcuts.append((action_id, binding))
-        return shortcuts
-
-    def get_bindings(self) -> list[HotkeyBinding]:
-        """Get current hotkey bindings from settings."""
-        return self.settings_manager.settings.hotkeys.profile_hotkeys
+        return [
+            (f"profile_{i}", binding)
+            for i, binding in enumerate(self.get_bindings())
+            if binding.enabled and binding.key
+        ]
+
+    def _set_bindings(self, bindings: list[HotkeyBinding]) -> None:
+        """Cache bindings and their precomputed action IDs."""
+        self._cached_bindings = tuple(bindings)
+        self._action_index = {f"profile_{i}": i for i in range(len(self._cached_bindings))}
+
+    def get_bindings(self) -> tuple[HotkeyBinding, ...]:
+        """Get current hotkey bindings (cached until reload_bindings())."""
+        return self._cached_bindings
 
     def reload_bindings(self) -> None:
         """Reload bindings from settings (call after settings change).
@@ -95,6 +127,7 @@ class HotkeyListener:
         # Force reload settings from disk
         self.settings_manager._settings = None
         self.settings_manager.load()
+        self._set_bindings(self.settings_manager.settings.hotkeys.profile_hotkeys)
 
         # Re-register shortcuts if backend is running
         if self._backend:
@@ -108,6 +141,15 @@ class HotkeyListener:
             logger.warning("No backend available, hotkeys disabled")
             return
 
+        # A worker still finishing a switch from before stop() is reused
+        with self._worker_lock:
+            self._stopping = False
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._dispatch_switches, name="hotkey-dispatch", daemon=True
+                )
+                self._worker.start()
+
         # Register shortcuts and start backend
         shortcuts = self._build_shortcuts()
         self._backend.register_shortcuts(shortcuts)
@@ -120,6 +162,15 @@ class HotkeyListener:
             self._backend.stop()
             logger.info("Hotkey listener stopped")
 
+        with self._worker_lock:
+            worker = self._worker
+            self._stopping = True
+        if worker is not None:
+            self._switch_queue.put(None)
+            worker.join(timeout=1.0)
+            if worker.is_alive():
+                logger.warning("Hotkey dispatch worker still busy; it exits after this switch")
+
     @property
     def backend_name(self) -> str | None:
         """Return the name of the active backend."""
@@ -6,7 +6,10 @@ Provides comprehensive mapping between:
 - uinput codes (integer values for emitting events)
 """
 
-from evdev import ecodes
+import sys
+from collections.abc import Callable, Mapping
+from functools import cache, lru_cache
+from types import MappingProxyType
 
 # =============================================================================
 # EVDEV TO SCHEMA MAPPING
@@ -14,7 +17,7 @@ from evdev import ecodes
 # Maps evdev code names to human-friendly schema names.
 # Schema names are what users see in profiles and the GUI.
 
-EVDEV_TO_SCHEMA: dict[str, str] = {
+_named_evdev_to_schema: dict[str, str] = {
     # -------------------------------------------------------------------------
     # Mouse Buttons
     # -------------------------------------------------------------------------
@@ -196,41 +199,97 @@ EVDEV_TO_SCHEMA: dict[str, str] = {
     "KEY_KPRIGHTPAREN": "NUM_RPAREN",
 }
 
-# Add letter keys (A-Z)
-for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-    EVDEV_TO_SCHEMA[f"KEY_{letter}"] = letter
-
-# Add number keys (0-9)
-for i in range(10):
-    EVDEV_TO_SCHEMA[f"KEY_{i}"] = str(i)
+# Full table built in one allocation: named keys, then letters (A-Z) and
+# numbers (0-9). Built names are interned like the literals above so lookups
+# and compares against them short-circuit on identity.
+_evdev_to_schema: dict[str, str] = {
+    **_named_evdev_to_schema,
+    **{sys.intern(f"KEY_{letter}"): letter for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+    **{sys.intern(f"KEY_{i}"): sys.intern(str(i)) for i in range(10)},
+}
 
 
 # =============================================================================
 # REVERSE MAPPINGS
 # =============================================================================
 
-# Schema name -> evdev code name
-SCHEMA_TO_EVDEV: dict[str, str] = {v: k for k, v in EVDEV_TO_SCHEMA.items()}
 
-# Also allow evdev names directly in schema (for power users)
-for evdev_name in list(EVDEV_TO_SCHEMA.keys()):
-    if evdev_name not in SCHEMA_TO_EVDEV:
-        SCHEMA_TO_EVDEV[evdev_name] = evdev_name
+@cache
+def _ecodes():
+    """Import evdev's ecodes on first use so GUI-only processes skip it."""
+    from evdev import ecodes
+
+    return ecodes
+
 
-# Schema name -> uinput code (integer)
-SCHEMA_TO_UINPUT: dict[str, int] = {}
+def _build_schema_to_evdev() -> dict[str, str]:
+    """Build the schema -> evdev name map."""
+    schema_to_evdev: dict[str, str] = {}
+    for evdev_name, schema_name in _evdev_to_schema.items():
+        schema_to_evdev[schema_name] = evdev_name
+        # Also allow evdev names directly in schema (for power users)
+        schema_to_evdev.setdefault(evdev_name, evdev_name)
+    return schema_to_evdev
 
 
-def _build_uinput_map():
-    """Build the schema -> uinput code mapping."""
-    for evdev_name, schema_name in EVDEV_TO_SCHEMA.items():
-        code = getattr(ecodes, evdev_name, None)
+@cache
+def _build_uinput_maps() -> tuple[dict[str, int], dict[int, str]]:
+    """Build the schema -> uinput code and EV_KEY code -> schema maps on first use.
+
+    Codes are resolved through the ecodes module dict rather than getattr().
+    Mapped evdev names win over evdev's own aliases for the same code
+    (e.g. BTN_LEFT/BTN_MOUSE); unmapped codes fall back to their first
+    evdev name, matching evdev_code_to_schema().
+    """
+    ecodes = _ecodes()
+    ecodes_vars = vars(ecodes)
+    schema_to_uinput: dict[str, int] = {}
+    code_to_schema: dict[int, str] = {}
+    for evdev_name, schema_name in _evdev_to_schema.items():
+        code = ecodes_vars.get(evdev_name)
         if code is not None:
-            SCHEMA_TO_UINPUT[schema_name] = code
-            SCHEMA_TO_UINPUT[evdev_name] = code
+            schema_to_uinput[schema_name] = code
+            schema_to_uinput[evdev_name] = code
+            code_to_schema.setdefault(code, schema_name)
+    for names in (ecodes.KEY, ecodes.BTN):
+        for code, name in names.items():
+            if isinstance(name, (list, tuple)):
+                name = name[0]
+            code_to_schema.setdefault(code, sys.intern(name))
+    return schema_to_uinput, code_to_schema
+
+
+class _LazyMapping(Mapping):
+    """Read-only view of a table that is only built on first access."""
+
+    __slots__ = ("_build",)
 
+    def __init__(self, build: Callable[[], Mapping]):
+        self._build = build
 
-_build_uinput_map()
+    def __getitem__(self, key):
+        return self._build()[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._build()
+
+    def __iter__(self):
+        return iter(self._build())
+
+    def __len__(self) -> int:
+        return len(self._build())
+
+
+_schema_to_evdev = _build_schema_to_evdev()
+
+# Read-only views of the tables; the underlying dicts are never copied
+EVDEV_TO_SCHEMA: Mapping[str, str] = MappingProxyType(_evdev_to_schema)
+
+# Schema name -> evdev code name
+SCHEMA_TO_EVDEV: Mapping[str, str] = MappingProxyType(_schema_to_evdev)
+
+# Schema name -> uinput code (integer); needs evdev, so built on first use
+SCHEMA_TO_UINPUT: Mapping[str, int] = _LazyMapping(lambda: _build_uinput_maps()[0])
 
 
 # =============================================================================
@@ -347,6 +406,7 @@ KEY_CATEGORIES = {
 # =============================================================================
 
 
+@lru_cache(maxsize=512)
 def evdev_code_to_schema(evdev_name: str) -> str:
     """Convert an evdev code name to schema key name.
 
@@ -356,9 +416,11 @@ def evdev_code_to_schema(evdev_name: str) -> str:
     Returns:
         Schema key name (e.g., 'A', 'MOUSE_LEFT')
     """
-    return EVDEV_TO_SCHEMA.get(evdev_name, evdev_name)
+    schema_name = EVDEV_TO_SCHEMA.get(evdev_name)
+    return schema_name if schema_name is not None else sys.intern(evdev_name)
 
 
+@lru_cache(maxsize=512)
 def schema_to_evdev_code(schema_name: str) -> int | None:
     """Convert a schema key name to evdev/uinput code.
 
@@ -380,6 +442,7 @@ def schema_to_evdev_code(schema_name: str) -> int | None:
         return SCHEMA_TO_UINPUT[schema_name]
 
     # Try reverse lookup
+    ecodes = _ecodes()
     evdev_name = SCHEMA_TO_EVDEV.get(normalized, normalized)
     code = getattr(ecodes, evdev_name, None)
     if code is not None:
@@ -431,11 +494,11 @@ def is_valid_key(key_name: str) -> bool:
     Returns:
         True if the key is recognized
     """
-    if key_name in SCHEMA_TO_UINPUT:
-        return True
+    # SCHEMA_TO_EVDEV covers every SCHEMA_TO_UINPUT key without loading evdev
     if key_name in SCHEMA_TO_EVDEV:
         return True
     # Try with prefixes
+    ecodes = _ecodes()
     if getattr(ecodes, key_name, None) is not None:
         return True
     if getattr(ecodes, f"KEY_{key_name}", None) is not None:
@@ -485,12 +548,8 @@ def evdev_event_to_schema(event_type: int, event_code: int) -> str | None:
     Returns:
         Schema key name, or None if not a key event
     """
-    if event_type == ecodes.EV_KEY:
-        code_name = ecodes.KEY.get(event_code) or ecodes.BTN.get(event_code)
-        if code_name:
-            if isinstance(code_name, list):
-                code_name = code_name[0]
-            return evdev_code_to_schema(str(code_name))
+    if event_type == _ecodes().EV_KEY:
+        return _build_uinput_maps()[1].get(event_code)
     return None
 
 
@@ -97,6 +97,13 @@ class ProfileLoader:
         path = self.get_active_profile_path()
         path.write_text(profile_id)
 
+    def save_and_activate(self, profile: Profile) -> bool:
+        """Save a profile and make it active, only if the save succeeded."""
+        if not self.save_profile(profile):
+            return False
+        self.set_active_profile(profile.id)
+        return True
+
     def load_active_profile(self) -> Profile | None:
         """Load the currently active profile."""
         profile_id = self.get_active_profile_id()
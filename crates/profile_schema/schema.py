@@ -41,7 +41,7 @@ class MacroStep(BaseModel):
 
     type: MacroStepType
     key: str | None = None  # For key actions
-    delay_ms: int | None = None  # For delay actions
+    delay_ms: int | None = None  # For delay actions (per-character pacing for text)
     text: str | None = None  # For text actions
 
 
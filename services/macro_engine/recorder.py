@@ -1,20 +1,32 @@
 """Macro recorder - captures key events with timing."""
 
+import select
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from functools import cache
 
 from evdev import InputDevice, InputEvent, ecodes
 
-from crates.keycode_map import evdev_code_to_schema
-from crates.profile_schema import MacroAction, MacroStep, MacroStepType
+from crates.keycode_map import evdev_event_to_schema, schema_to_evdev_code
+from crates.profile_schema import MacroAction, MacroStepType
 
+# Hoisted so the per-event filter is a global load, not a module attribute
+_EV_KEY = ecodes.EV_KEY
+_KEY_REPEAT = 2
 
-@dataclass
+
+@cache
+def _key_names() -> tuple[str | None, ...]:
+    """Schema key name for every EV_KEY code, indexed by code."""
+    return tuple(evdev_event_to_schema(_EV_KEY, code) for code in range(ecodes.KEY_MAX + 1))
+
+
+@dataclass(slots=True)
 class RecordedEvent:
     """A single recorded event with timestamp."""
 
-    timestamp: float
+    timestamp: float  # Seconds since recording started (monotonic clock)
     code: int
     value: int  # 0=up, 1=down, 2=repeat
     key_name: str
@@ -53,13 +65,16 @@ class MacroRecorder:
         self._recording = False
         self._events: list[RecordedEvent] = []
         self._start_time: float = 0
+        # Device clock -> recording timeline, fixed by the first recorded event
+        self._clock_offset: float | None = None
         self._on_event: Callable[[RecordedEvent], None] | None = None
 
     def start(self) -> None:
         """Start recording."""
         self._recording = True
         self._events = []
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
+        self._clock_offset = None
 
     def stop(self) -> MacroAction:
         """Stop recording and return the macro."""
@@ -79,39 +94,60 @@ class MacroRecorder:
         Returns:
             True if event was recorded, False if ignored
         """
-        if not self._recording:
-            return False
-
-        # Only record key events (not repeats by default)
-        if event.type != ecodes.EV_KEY:
-            return False
-
-        if event.value == 2:  # Repeat - ignore
-            return False
+        return self.record_events((event,)) == 1
 
-        # Get key name
-        code_name = ecodes.KEY.get(event.code) or ecodes.BTN.get(event.code)
-        if not code_name:
-            return False
+    def record_events(self, events: Iterable[InputEvent]) -> int:
+        """Record a burst of input events read from a device together.
 
-        if isinstance(code_name, list):
-            code_name = code_name[0]
+        Non-key events, auto-repeats and codes without a name are skipped.
+        Each event keeps its own kernel timestamp, so gaps inside one burst
+        survive; the first recorded event anchors the device clock to the
+        recording start.
 
-        schema_name = evdev_code_to_schema(str(code_name))
-
-        recorded = RecordedEvent(
-            timestamp=time.time(),
-            code=event.code,
-            value=event.value,
-            key_name=schema_name,
-        )
+        Args:
+            events: evdev InputEvents in arrival order
 
-        self._events.append(recorded)
+        Returns:
+            Number of events recorded
+        """
+        if not self._recording:
+            return 0
+
+        offset = self._clock_offset
+        key_names = _key_names()
+        code_limit = len(key_names)
+        append = self._events.append
+        on_event = self._on_event
+        count = 0
+
+        for event in events:
+            # Only record key events (not repeats by default)
+            if event.type != _EV_KEY or event.value == _KEY_REPEAT:
+                continue
+
+            code = event.code
+            key_name = key_names[code] if code < code_limit else None
+            if key_name is None:
+                continue
+
+            stamp = event.timestamp()
+            if offset is None:
+                offset = time.monotonic() - self._start_time - stamp
+                self._clock_offset = offset
+
+            recorded = RecordedEvent(
+                timestamp=stamp + offset,
+                code=code,
+                value=event.value,
+                key_name=key_name,
+            )
+            append(recorded)
+            count += 1
 
-        if self._on_event:
-            self._on_event(recorded)
+            if on_event:
+                on_event(recorded)
 
-        return True
+        return count
 
     def set_event_callback(self, callback: Callable[[RecordedEvent], None]) -> None:
         """Set callback for when events are recorded."""
@@ -124,83 +160,69 @@ class MacroRecorder:
     def clear(self) -> None:
         """Clear recorded events without stopping."""
         self._events = []
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
+        self._clock_offset = None
 
     def _build_macro(self) -> MacroAction:
-        """Build a MacroAction from recorded events."""
-        steps: list[MacroStep] = []
-
-        if not self._events:
-            return MacroAction(
-                id="recorded_macro",
-                name="Recorded Macro",
-                steps=[],
-            )
+        """Build a MacroAction from recorded events in a single pass.
 
-        # Process events into steps
+        Steps are collected as plain dicts and validated together with the
+        macro, instead of constructing each MacroStep model separately.
+        """
+        events = self._events
+        count = len(events)
+        record_delays = self.record_delays
+        merge_press_release = self.merge_press_release
+        min_delay_ms = self.min_delay_ms
+        max_delay_ms = self.max_delay_ms
+        # Step types bound once rather than looked up on the enum per step
+        delay_type = MacroStepType.DELAY
+        press_type = MacroStepType.KEY_PRESS
+        down_type = MacroStepType.KEY_DOWN
+        up_type = MacroStepType.KEY_UP
+
+        steps: list[dict] = []
+        append = steps.append
+        last_time = events[0].timestamp if events else 0
+        pending_delay = 0.0
         i = 0
-        last_time = self._events[0].timestamp if self._events else 0
-
-        while i < len(self._events):
-            event = self._events[i]
-
-            # Add delay if significant
-            if self.record_delays and i > 0:
-                delay_ms = int((event.timestamp - last_time) * 1000)
-                if delay_ms >= self.min_delay_ms:
-                    delay_ms = min(delay_ms, self.max_delay_ms)
-                    steps.append(
-                        MacroStep(
-                            type=MacroStepType.DELAY,
-                            delay_ms=delay_ms,
-                        )
-                    )
-
-            # Check for quick press+release (merge into KEY_PRESS)
-            if (
-                self.merge_press_release
-                and event.value == 1  # Key down
-                and i + 1 < len(self._events)
-            ):
-                next_event = self._events[i + 1]
+
+        while i < count:
+            event = events[i]
+
+            # Gaps shorter than min_delay_ms accumulate until they add up to one
+            if record_delays and i > 0:
+                pending_delay += event.timestamp - last_time
+                delay_ms = int(pending_delay * 1000)
+                if delay_ms >= min_delay_ms:
+                    delay_ms = min(delay_ms, max_delay_ms)
+                    append({"type": delay_type, "delay_ms": delay_ms})
+                    pending_delay = 0.0
+
+            # Merge a quick down+up of the same key (within 100ms) into KEY_PRESS
+            if merge_press_release and event.value == 1 and i + 1 < count:
+                next_event = events[i + 1]
                 if (
                     next_event.code == event.code
-                    and next_event.value == 0  # Key up
+                    and next_event.value == 0
                     and (next_event.timestamp - event.timestamp) < 0.1
-                ):  # Within 100ms
-                    steps.append(
-                        MacroStep(
-                            type=MacroStepType.KEY_PRESS,
-                            key=event.key_name,
-                        )
-                    )
+                ):
+                    append({"type": press_type, "key": event.key_name})
                     last_time = next_event.timestamp
                     i += 2
                     continue
 
             # Regular key down/up
             if event.value == 1:
-                steps.append(
-                    MacroStep(
-                        type=MacroStepType.KEY_DOWN,
-                        key=event.key_name,
-                    )
-                )
+                append({"type": down_type, "key": event.key_name})
             elif event.value == 0:
-                steps.append(
-                    MacroStep(
-                        type=MacroStepType.KEY_UP,
-                        key=event.key_name,
-                    )
-                )
+                append({"type": up_type, "key": event.key_name})
 
             last_time = event.timestamp
             i += 1
 
-        return MacroAction(
-            id="recorded_macro",
-            name="Recorded Macro",
-            steps=steps,
+        return MacroAction.model_validate(
+            {"id": "recorded_macro", "name": "Recorded Macro", "steps": steps}
         )
 
 
@@ -222,6 +244,7 @@ class DeviceMacroRecorder(MacroRecorder):
         super().__init__(**kwargs)
         self.device_path = device_path
         self.stop_key = stop_key.upper()
+        self._stop_code = schema_to_evdev_code(self.stop_key)
         self._device: InputDevice | None = None
 
     def record_from_device(
@@ -247,35 +270,32 @@ class DeviceMacroRecorder(MacroRecorder):
             self._device.grab()
             self.start()
 
-            start = time.time()
+            deadline = time.monotonic() + timeout
+            stop_code = self._stop_code
 
             while self.is_recording():
-                # Check timeout
-                if time.time() - start > timeout:
+                # Wait for input until the deadline; an empty result means timeout
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                ready, _, _ = select.select([self._device.fd], [], [], remaining)
+                if not ready:
                     break
 
-                # Read events with timeout
-                try:
-                    self._device.read_one()  # Just to check if there's data
-                except BlockingIOError:
-                    time.sleep(0.01)
-                    continue
-
+                # Drain everything the kernel has buffered for this wakeup
+                burst: list[InputEvent] = []
                 for event in self._device.read():
-                    if event.type != ecodes.EV_KEY:
+                    if event.type != _EV_KEY:
                         continue
 
                     # Check for stop key
-                    if event.value == 1:  # Key down
-                        code_name = ecodes.KEY.get(event.code)
-                        if code_name:
-                            if isinstance(code_name, list):
-                                code_name = code_name[0]
-                            schema_name = evdev_code_to_schema(str(code_name))
-                            if schema_name == self.stop_key:
-                                return self.stop()
-
-                    self.record_event(event)
+                    if event.code == stop_code and event.value == 1:
+                        self.record_events(burst)
+                        return self.stop()
+
+                    burst.append(event)
+
+                self.record_events(burst)
 
         finally:
             if self._device:
@@ -1,9 +1,15 @@
 """OpenRazer bridge - discover and control Razer devices via DBus."""
 
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 
-from pydbus import SessionBus
+logger = logging.getLogger(__name__)
 
 
 class LightingEffect(Enum):
@@ -36,7 +42,37 @@ class ReactiveSpeed(Enum):
     LONG = 3
 
 
-@dataclass
+# Polling rates (Hz) accepted by set_poll_rate
+_VALID_POLL_RATES = frozenset({125, 500, 1000})
+
+# Effect setter methods mapped to the effect they provide; generic methods
+# come first so they set the display order
+_EFFECT_METHODS = (
+    # Generic effects
+    ("setStatic", "static"),
+    ("setSpectrum", "spectrum"),
+    ("setBreathSingle", "breathing"),
+    ("setBreathDual", "breathing_dual"),
+    ("setBreathRandom", "breathing_random"),
+    ("setWave", "wave"),
+    ("setReactive", "reactive"),
+    ("setStarlight", "starlight"),
+    ("setRipple", "ripple"),
+    ("setNone", "none"),
+    # Logo-specific effects (for mice)
+    ("setLogoStatic", "static"),
+    ("setLogoSpectrum", "spectrum"),
+    ("setLogoBreathSingle", "breathing"),
+    ("setLogoNone", "none"),
+    # Scroll-specific effects (for mice)
+    ("setScrollStatic", "static"),
+    ("setScrollSpectrum", "spectrum"),
+    ("setScrollBreathSingle", "breathing"),
+    ("setScrollNone", "none"),
+)
+
+
+@dataclass(slots=True)
 class RazerDevice:
     """Represents a Razer device discovered via OpenRazer."""
 
@@ -81,18 +117,49 @@ class OpenRazerBridge:
     DBUS_INTERFACE = "org.razer"
     DAEMON_PATH = "/org/razer"
 
+    # Upper bound on concurrent per-device discovery queries
+    MAX_DISCOVERY_WORKERS = 8
+
+    # One session bus connection shared by every bridge in the process
+    _shared_bus = None
+    _shared_bus_lock = threading.Lock()
+
     def __init__(self):
-        self._bus = SessionBus()
+        self._bus = self._get_bus()
         self._daemon = None
         self._devices: dict[str, RazerDevice] = {}
+        self._proxies: dict[str, object] = {}
+        self._pending: dict[tuple[str, str], tuple] = {}
+        self._pending_lock = threading.Lock()
+        self._batch_depth = 0
+
+    @classmethod
+    def _get_bus(cls):
+        """Get the process-wide session bus, connecting on first use."""
+        with cls._shared_bus_lock:
+            if cls._shared_bus is None:
+                # pydbus pulls in GLib, so defer it until a bridge is actually created
+                from pydbus import SessionBus
+
+                cls._shared_bus = SessionBus()
+            return cls._shared_bus
+
+    def _get_proxy(self, object_path: str):
+        """Get the DBus proxy for a device, creating it on first use."""
+        proxy = self._proxies.get(object_path)
+        if proxy is None:
+            proxy = self._bus.get(self.DBUS_INTERFACE, object_path)
+            self._proxies[object_path] = proxy
+        return proxy
 
     def connect(self) -> bool:
         """Connect to OpenRazer daemon."""
         try:
             self._daemon = self._bus.get(self.DBUS_INTERFACE, self.DAEMON_PATH)
+            self._proxies.clear()
             return True
         except Exception as e:
-            print(f"Failed to connect to OpenRazer daemon: {e}")
+            logger.warning("Failed to connect to OpenRazer daemon: %s", e)
             return False
 
     def is_connected(self) -> bool:
@@ -106,27 +173,41 @@ class OpenRazerBridge:
                 return []
 
         devices = []
+        # Devices may have been unplugged since the last scan
+        self._proxies.clear()
         try:
             # getDevices() returns serial numbers, not object paths
-            device_serials = self._daemon.getDevices()
-
-            for serial in device_serials:
-                # Construct the full object path
-                object_path = f"/org/razer/device/{serial}"
-                device = self._get_device_info(object_path, serial)
-                if device:
-                    devices.append(device)
-                    self._devices[device.serial] = device
+            device_serials = list(self._daemon.getDevices())
+
+            if device_serials:
+                # Each device needs several blocking DBus calls; query them
+                # concurrently so discovery takes max, not sum, of the latencies
+                workers = min(len(device_serials), self.MAX_DISCOVERY_WORKERS)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = list(
+                        pool.map(
+                            lambda serial: self._get_device_info(
+                                f"/org/razer/device/{serial}", serial
+                            ),
+                            device_serials,
+                        )
+                    )
+
+                # Update the cache here rather than from the worker threads
+                for device in results:
+                    if device:
+                        devices.append(device)
+                        self._devices[device.serial] = device
 
         except Exception as e:
-            print(f"Error discovering devices: {e}")
+            logger.warning("Error discovering devices: %s", e)
 
         return devices
 
     def _get_device_info(self, object_path: str, serial_hint: str = "") -> RazerDevice | None:
         """Get device info from a DBus object path."""
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, object_path)
+            dev = self._get_proxy(object_path)
 
             # Get basic info - some methods may not exist on all devices
             try:
@@ -157,133 +238,181 @@ class OpenRazerBridge:
             return device
 
         except Exception as e:
-            print(f"Error getting device info for {object_path}: {e}")
+            logger.warning("Error getting device info for %s: %s", object_path, e)
+            return None
+
+    @staticmethod
+    def _introspect_methods(dbus_dev) -> frozenset[str] | None:
+        """Return the method names a device exports, or None if unknown.
+
+        One Introspect round-trip replaces probing each getter and paying
+        for a failed DBus call plus exception on every missing method.
+        """
+        try:
+            root = ET.fromstring(dbus_dev.Introspect())
+        except Exception:
             return None
+        return frozenset(
+            name for method in root.iter("method") if (name := method.get("name")) is not None
+        )
 
     def _detect_capabilities(self, dbus_dev, device: RazerDevice) -> None:
         """Detect device capabilities via DBus introspection."""
+        methods = self._introspect_methods(dbus_dev)
+
+        def supports(method_name: str) -> bool:
+            # Without introspection data, fall back to probing every getter
+            return methods is None or method_name in methods
+
         # Check for brightness/lighting (try generic first, then zone-specific)
-        try:
-            device.brightness = dbus_dev.getBrightness()
-            device.has_brightness = True
-            device.has_lighting = True
-        except Exception:
-            # Try zone-specific brightness (mice often only have these)
+        for getter in ("getBrightness", "getLogoBrightness", "getScrollBrightness"):
+            if not supports(getter):
+                continue
             try:
-                device.brightness = int(dbus_dev.getLogoBrightness())
+                device.brightness = int(getattr(dbus_dev, getter)())
                 device.has_brightness = True
                 device.has_lighting = True
+                break
             except Exception:
-                try:
-                    device.brightness = int(dbus_dev.getScrollBrightness())
-                    device.has_brightness = True
-                    device.has_lighting = True
-                except Exception:
-                    pass
+                # Mice often only have the zone-specific getters
+                continue
 
         # Check for DPI
-        try:
-            dpi = dbus_dev.getDPI()
-            device.dpi = (dpi[0], dpi[1]) if len(dpi) >= 2 else (dpi[0], dpi[0])
-            device.has_dpi = True
-        except Exception:
-            pass
+        if supports("getDPI"):
+            try:
+                dpi = dbus_dev.getDPI()
+                device.dpi = (dpi[0], dpi[1]) if len(dpi) >= 2 else (dpi[0], dpi[0])
+                device.has_dpi = True
+            except Exception:
+                pass
 
         # Check for max DPI
-        try:
-            device.max_dpi = dbus_dev.maxDPI()
-        except Exception:
-            pass
+        if supports("maxDPI"):
+            try:
+                device.max_dpi = dbus_dev.maxDPI()
+            except Exception:
+                pass
 
         # Check for battery
-        try:
-            device.battery_level = dbus_dev.getBattery()
-            device.has_battery = True
-        except Exception:
-            pass
+        if supports("getBattery"):
+            try:
+                device.battery_level = dbus_dev.getBattery()
+                device.has_battery = True
+            except Exception:
+                pass
 
         # Check for charging status
-        try:
-            device.is_charging = dbus_dev.isCharging()
-        except Exception:
-            pass
+        if supports("isCharging"):
+            try:
+                device.is_charging = dbus_dev.isCharging()
+            except Exception:
+                pass
 
         # Check for poll rate
-        try:
-            device.poll_rate = dbus_dev.getPollRate()
-            device.has_poll_rate = True
-        except Exception:
-            pass
+        if supports("getPollRate"):
+            try:
+                device.poll_rate = dbus_dev.getPollRate()
+                device.has_poll_rate = True
+            except Exception:
+                pass
 
         # Check for firmware version
-        try:
-            device.firmware_version = dbus_dev.getFirmware()
-        except Exception:
-            pass
+        if supports("getFirmware"):
+            try:
+                device.firmware_version = dbus_dev.getFirmware()
+            except Exception:
+                pass
 
         # Detect supported effects by introspecting available methods
-        effects = []
-        # Check both generic and zone-specific effect methods
-        effect_checks = [
-            # Generic effects
-            ("setStatic", "static"),
-            ("setSpectrum", "spectrum"),
-            ("setBreathSingle", "breathing"),
-            ("setBreathDual", "breathing_dual"),
-            ("setBreathRandom", "breathing_random"),
-            ("setWave", "wave"),
-            ("setReactive", "reactive"),
-            ("setStarlight", "starlight"),
-            ("setRipple", "ripple"),
-            ("setNone", "none"),
-            # Logo-specific effects (for mice)
-            ("setLogoStatic", "static"),
-            ("setLogoSpectrum", "spectrum"),
-            ("setLogoBreathSingle", "breathing"),
-            ("setLogoNone", "none"),
-            # Scroll-specific effects (for mice)
-            ("setScrollStatic", "static"),
-            ("setScrollSpectrum", "spectrum"),
-            ("setScrollBreathSingle", "breathing"),
-            ("setScrollNone", "none"),
-        ]
-
-        for method_name, effect_name in effect_checks:
-            if hasattr(dbus_dev, method_name) and effect_name not in effects:
-                effects.append(effect_name)
-
-        device.supported_effects = effects
+        if methods is not None:
+            available = methods
+        else:
+            available = frozenset(m for m, _ in _EFFECT_METHODS if hasattr(dbus_dev, m))
+        # Ordered dict keys dedupe zone variants while keeping display order
+        device.supported_effects = list(
+            dict.fromkeys(effect for method, effect in _EFFECT_METHODS if method in available)
+        )
 
         # Check for logo/scroll lighting (use getBrightness as capability check)
-        try:
-            dbus_dev.getLogoBrightness()
-            device.has_logo = True
-        except Exception:
-            pass
+        if supports("getLogoBrightness"):
+            try:
+                dbus_dev.getLogoBrightness()
+                device.has_logo = True
+            except Exception:
+                pass
 
-        try:
-            dbus_dev.getScrollBrightness()
-            device.has_scroll = True
-        except Exception:
-            pass
+        if supports("getScrollBrightness"):
+            try:
+                dbus_dev.getScrollBrightness()
+                device.has_scroll = True
+            except Exception:
+                pass
 
         # Check for matrix (per-key RGB) support
-        try:
-            dims = dbus_dev.getMatrixDimensions()
-            if dims and len(dims) >= 2 and dims[0] > 0 and dims[1] > 0:
-                device.has_matrix = True
-                device.matrix_rows = int(dims[0])
-                device.matrix_cols = int(dims[1])
-        except Exception:
-            pass
+        if supports("getMatrixDimensions"):
+            try:
+                dims = dbus_dev.getMatrixDimensions()
+                if dims and len(dims) >= 2 and dims[0] > 0 and dims[1] > 0:
+                    device.has_matrix = True
+                    device.matrix_rows = int(dims[0])
+                    device.matrix_cols = int(dims[1])
+            except Exception:
+                pass
 
     def get_device(self, serial: str) -> RazerDevice | None:
         """Get a device by serial number."""
-        if serial in self._devices:
-            return self._devices[serial]
-        # Re-scan if not found
-        self.discover_devices()
-        return self._devices.get(serial)
+        device = self._devices.get(serial)
+        if device is None:
+            device = self._lookup_device(serial)
+        return device
+
+    def _lookup_device(self, serial: str) -> RazerDevice | None:
+        """Query a single device missing from the cache.
+
+        Asking the daemon whether the serial exists and introspecting just that
+        device avoids a full rescan every time the UI asks for an unknown serial.
+        """
+        if not self._daemon:
+            if not self.connect():
+                return None
+
+        try:
+            if serial not in self._daemon.getDevices():
+                return None
+        except Exception as e:
+            logger.warning("Error looking up device %s: %s", serial, e)
+            return None
+
+        object_path = f"/org/razer/device/{serial}"
+        # The device may have been re-plugged since its proxy was cached
+        self._proxies.pop(object_path, None)
+        device = self._get_device_info(object_path, serial)
+        if device:
+            self._devices[device.serial] = device
+        return device
+
+    def _call_device(self, serial: str, capability: str, method: str, *args) -> bool:
+        """Call a DBus method on a device if it has the given capability.
+
+        Args:
+            serial: Device serial number.
+            capability: RazerDevice flag that must be set, e.g. ``"has_lighting"``.
+            method: OpenRazer method to call, e.g. ``"setSpectrum"``.
+            *args: Arguments for the DBus method.
+
+        Returns:
+            True if the call succeeded.
+        """
+        device = self.get_device(serial)
+        if not device or not getattr(device, capability):
+            return False
+
+        try:
+            getattr(self._get_proxy(device.object_path), method)(*args)
+            return True
+        except Exception:
+            logger.debug("Error calling %s on %s", method, serial, exc_info=True)
+            return False
 
     def set_brightness(self, serial: str, brightness: int) -> bool:
         """Set device brightness (0-100)."""
@@ -292,7 +421,7 @@ class OpenRazerBridge:
             return False
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
             # Try generic first, then zone-specific
             try:
                 dev.setBrightness(brightness)
@@ -315,10 +444,117 @@ class OpenRazerBridge:
                     raise Exception("No brightness method available")
             device.brightness = brightness
             return True
-        except Exception as e:
-            print(f"Error setting brightness: {e}")
+        except Exception:
+            logger.debug("Error setting brightness", exc_info=True)
             return False
 
+    # --- Coalesced writes ---
+    #
+    # Nothing is sent until flush_pending() runs, and it runs on the caller's
+    # thread, so the proxy cache is never touched from a background timer. The
+    # lighting panel flushes from a debounced single-shot QTimer on the Qt thread.
+
+    def queue_brightness(self, serial: str, brightness: int) -> None:
+        """Queue a brightness write, keeping only the latest value per flush."""
+        self._queue_write(serial, "brightness", (brightness,))
+
+    def queue_static_color(self, serial: str, r: int, g: int, b: int) -> None:
+        """Queue a static color write, keeping only the latest value per flush."""
+        self._queue_write(serial, "static_color", (r, g, b))
+
+    def queue_dpi(self, serial: str, dpi_x: int, dpi_y: int | None = None) -> None:
+        """Queue a DPI write, keeping only the latest value per flush."""
+        self._queue_write(serial, "dpi", (dpi_x, dpi_y))
+
+    def _queue_write(self, serial: str, prop: str, args: tuple) -> None:
+        """Store the latest value for (serial, prop) until the next flush."""
+        with self._pending_lock:
+            self._pending[(serial, prop)] = args
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """Hold queued writes until the block exits, then flush them once.
+
+        flush_pending() calls made inside the block, such as a debounce timer
+        firing mid-batch, are deferred to the outermost exit. Only queue_*
+        writes are held; set_* calls still go straight to the device.
+
+        Example:
+            with bridge.batch_updates():
+                for value in slider_values:
+                    bridge.queue_brightness(serial, value)
+        """
+        with self._pending_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._pending_lock:
+                self._batch_depth -= 1
+                outermost = not self._batch_depth
+            if outermost:
+                self._send_pending()
+
+    def flush_pending(self) -> None:
+        """Send queued writes now, unless a batch_updates() block is open."""
+        with self._pending_lock:
+            if self._batch_depth:
+                return
+        self._send_pending()
+
+    def _send_pending(self) -> None:
+        """Send queued writes, one DBus call per (device, property)."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+
+        setters = {
+            "brightness": self.set_brightness,
+            "static_color": self.set_static_color,
+            "dpi": self.set_dpi,
+        }
+        for (serial, prop), args in pending.items():
+            setters[prop](serial, *args)
+
+    def apply_to_devices(self, serials: list[str], method: str, *args) -> dict[str, bool]:
+        """Call a bridge setter on several devices concurrently.
+
+        Args:
+            serials: Serial numbers of the target devices.
+            method: Name of a setter on this bridge, e.g. ``"set_static_color"``.
+            *args: Arguments passed to the setter after the serial.
+
+        Returns:
+            Mapping of serial to the setter's result, in input order. Serials
+            that cannot be resolved map to False without being submitted.
+        """
+        setter = getattr(self, method)
+        results: dict[str, bool] = {}
+
+        # Resolve devices and proxies on this thread; a cache miss can reconnect
+        # and rewrite _devices/_proxies, so workers must only see cache hits
+        ready: list[str] = []
+        for serial in serials:
+            results[serial] = False
+            device = self.get_device(serial)
+            if device is None:
+                continue
+            try:
+                self._get_proxy(device.object_path)
+            except Exception:
+                logger.debug("Error getting proxy for %s", serial, exc_info=True)
+                continue
+            ready.append(serial)
+
+        if not ready:
+            return results
+
+        # Each setter is a blocking DBus call, so pushing an effect to a keyboard,
+        # mouse and mousepad takes the slowest device's latency, not their sum
+        workers = min(len(ready), self.MAX_DISCOVERY_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results.update(zip(ready, pool.map(lambda serial: setter(serial, *args), ready)))
+        return results
+
     def set_static_color(self, serial: str, r: int, g: int, b: int) -> bool:
         """Set static lighting color."""
         device = self.get_device(serial)
@@ -326,7 +562,7 @@ class OpenRazerBridge:
             return False
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
             # Try generic first, then zone-specific
             try:
                 dev.setStatic(r, g, b)
@@ -348,8 +584,8 @@ class OpenRazerBridge:
                 if not success:
                     raise Exception("No static color method available")
             return True
-        except Exception as e:
-            print(f"Error setting color: {e}")
+        except Exception:
+            logger.debug("Error setting color", exc_info=True)
             return False
 
     def set_dpi(self, serial: str, dpi_x: int, dpi_y: int | None = None) -> bool:
@@ -362,101 +598,41 @@ class OpenRazerBridge:
             return False
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
             dev.setDPI(dpi_x, dpi_y)
             device.dpi = (dpi_x, dpi_y)
             return True
-        except Exception as e:
-            print(f"Error setting DPI: {e}")
+        except Exception:
+            logger.debug("Error setting DPI", exc_info=True)
             return False
 
     def set_spectrum_effect(self, serial: str) -> bool:
         """Set spectrum cycling effect."""
-        device = self.get_device(serial)
-        if not device or not device.has_lighting:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setSpectrum()
-            return True
-        except Exception as e:
-            print(f"Error setting spectrum: {e}")
-            return False
+        return self._call_device(serial, "has_lighting", "setSpectrum")
 
     def set_breathing_effect(self, serial: str, r: int, g: int, b: int) -> bool:
         """Set breathing effect with single color."""
-        device = self.get_device(serial)
-        if not device or not device.has_lighting:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setBreathSingle(r, g, b)
-            return True
-        except Exception as e:
-            print(f"Error setting breathing: {e}")
-            return False
+        return self._call_device(serial, "has_lighting", "setBreathSingle", r, g, b)
 
     def set_breathing_dual(
         self, serial: str, r1: int, g1: int, b1: int, r2: int, g2: int, b2: int
     ) -> bool:
         """Set breathing effect with two colors."""
-        device = self.get_device(serial)
-        if not device or not device.has_lighting:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setBreathDual(r1, g1, b1, r2, g2, b2)
-            return True
-        except Exception as e:
-            print(f"Error setting breathing dual: {e}")
-            return False
+        return self._call_device(serial, "has_lighting", "setBreathDual", r1, g1, b1, r2, g2, b2)
 
     def set_breathing_random(self, serial: str) -> bool:
         """Set breathing effect with random colors."""
-        device = self.get_device(serial)
-        if not device or not device.has_lighting:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setBreathRandom()
-            return True
-        except Exception as e:
-            print(f"Error setting breathing random: {e}")
-            return False
+        return self._call_device(serial, "has_lighting", "setBreathRandom")
 
     def set_wave_effect(self, serial: str, direction: WaveDirection = WaveDirection.RIGHT) -> bool:
         """Set wave effect with direction."""
-        device = self.get_device(serial)
-        if not device or not device.has_lighting:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setWave(direction.value)
-            return True
-        except Exception as e:
-            print(f"Error setting wave: {e}")
-            return False
+        return self._call_device(serial, "has_lighting", "setWave", direction.value)
 
     def set_reactive_effect(
         self, serial: str, r: int, g: int, b: int, speed: ReactiveSpeed = ReactiveSpeed.MEDIUM
     ) -> bool:
         """Set reactive effect - lights up on keypress."""
-        device = self.get_device(serial)
-        if not device or not device.has_lighting:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setReactive(r, g, b, speed.value)
-            return True
-        except Exception as e:
-            print(f"Error setting reactive: {e}")
-            return False
+        return self._call_device(serial, "has_lighting", "setReactive", r, g, b, speed.value)
 
     def set_starlight_effect(
         self,
@@ -467,31 +643,11 @@ class OpenRazerBridge:
         speed: ReactiveSpeed = ReactiveSpeed.MEDIUM,
     ) -> bool:
         """Set starlight effect - random twinkling."""
-        device = self.get_device(serial)
-        if not device or not device.has_lighting:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setStarlight(r, g, b, speed.value)
-            return True
-        except Exception as e:
-            print(f"Error setting starlight: {e}")
-            return False
+        return self._call_device(serial, "has_lighting", "setStarlight", r, g, b, speed.value)
 
     def set_none_effect(self, serial: str) -> bool:
         """Turn off lighting."""
-        device = self.get_device(serial)
-        if not device or not device.has_lighting:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setNone()
-            return True
-        except Exception as e:
-            print(f"Error turning off lighting: {e}")
-            return False
+        return self._call_device(serial, "has_lighting", "setNone")
 
     def set_poll_rate(self, serial: str, poll_rate: int) -> bool:
         """Set device polling rate (125, 500, or 1000 Hz)."""
@@ -499,17 +655,17 @@ class OpenRazerBridge:
         if not device or not device.has_poll_rate:
             return False
 
-        if poll_rate not in [125, 500, 1000]:
-            print(f"Invalid poll rate: {poll_rate}. Use 125, 500, or 1000.")
+        if poll_rate not in _VALID_POLL_RATES:
+            logger.warning("Invalid poll rate: %s. Use 125, 500, or 1000.", poll_rate)
             return False
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
             dev.setPollRate(poll_rate)
             device.poll_rate = poll_rate
             return True
-        except Exception as e:
-            print(f"Error setting poll rate: {e}")
+        except Exception:
+            logger.debug("Error setting poll rate", exc_info=True)
             return False
 
     def get_poll_rate(self, serial: str) -> int | None:
@@ -519,12 +675,12 @@ class OpenRazerBridge:
             return None
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
             rate: int = dev.getPollRate()
             device.poll_rate = rate
             return rate
-        except Exception as e:
-            print(f"Error getting poll rate: {e}")
+        except Exception:
+            logger.debug("Error getting poll rate", exc_info=True)
             return None
 
     def get_dpi(self, serial: str) -> tuple[int, int] | None:
@@ -534,12 +690,12 @@ class OpenRazerBridge:
             return None
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
             dpi = dev.getDPI()
             device.dpi = (dpi[0], dpi[1]) if len(dpi) >= 2 else (dpi[0], dpi[0])
             return device.dpi
-        except Exception as e:
-            print(f"Error getting DPI: {e}")
+        except Exception:
+            logger.debug("Error getting DPI", exc_info=True)
             return None
 
     def get_brightness(self, serial: str) -> int | None:
@@ -549,12 +705,12 @@ class OpenRazerBridge:
             return None
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
             brightness: int = dev.getBrightness()
             device.brightness = brightness
             return brightness
-        except Exception as e:
-            print(f"Error getting brightness: {e}")
+        except Exception:
+            logger.debug("Error getting brightness", exc_info=True)
             return None
 
     def get_battery(self, serial: str) -> dict | None:
@@ -564,7 +720,7 @@ class OpenRazerBridge:
             return None
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
             level = dev.getBattery()
             device.battery_level = level
 
@@ -575,65 +731,25 @@ class OpenRazerBridge:
                 charging = False
 
             return {"level": level, "charging": charging}
-        except Exception as e:
-            print(f"Error getting battery: {e}")
+        except Exception:
+            logger.debug("Error getting battery", exc_info=True)
             return None
 
     def set_logo_brightness(self, serial: str, brightness: int) -> bool:
         """Set logo brightness (0-100)."""
-        device = self.get_device(serial)
-        if not device or not device.has_logo:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setLogoBrightness(brightness)
-            return True
-        except Exception as e:
-            print(f"Error setting logo brightness: {e}")
-            return False
+        return self._call_device(serial, "has_logo", "setLogoBrightness", brightness)
 
     def set_scroll_brightness(self, serial: str, brightness: int) -> bool:
         """Set scroll wheel brightness (0-100)."""
-        device = self.get_device(serial)
-        if not device or not device.has_scroll:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setScrollBrightness(brightness)
-            return True
-        except Exception as e:
-            print(f"Error setting scroll brightness: {e}")
-            return False
+        return self._call_device(serial, "has_scroll", "setScrollBrightness", brightness)
 
     def set_logo_static(self, serial: str, r: int, g: int, b: int) -> bool:
         """Set logo to static color."""
-        device = self.get_device(serial)
-        if not device or not device.has_logo:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setLogoStatic(r, g, b)
-            return True
-        except Exception as e:
-            print(f"Error setting logo color: {e}")
-            return False
+        return self._call_device(serial, "has_logo", "setLogoStatic", r, g, b)
 
     def set_scroll_static(self, serial: str, r: int, g: int, b: int) -> bool:
         """Set scroll wheel to static color."""
-        device = self.get_device(serial)
-        if not device or not device.has_scroll:
-            return False
-
-        try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
-            dev.setScrollStatic(r, g, b)
-            return True
-        except Exception as e:
-            print(f"Error setting scroll color: {e}")
-            return False
+        return self._call_device(serial, "has_scroll", "setScrollStatic", r, g, b)
 
     # --- Matrix (Per-Key RGB) Methods ---
 
@@ -656,18 +772,18 @@ class OpenRazerBridge:
             return False
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
 
             # Build payload: row_index followed by RGB triplets
             # Format: [row, R1, G1, B1, R2, G2, B2, ...]
-            payload = bytes([row])
-            for r, g, b in colors:
-                payload += bytes([r & 0xFF, g & 0xFF, b & 0xFF])
+            # One bytes() call instead of concatenating a new object per key
+            # Unpacking three values makes a malformed color fail instead of shifting
+            payload = bytes([row, *(c & 0xFF for r, g, b in colors for c in (r, g, b))])
 
             dev.setKeyRow(payload)
             return True
-        except Exception as e:
-            print(f"Error setting key row: {e}")
+        except Exception:
+            logger.debug("Error setting key row", exc_info=True)
             return False
 
     def set_custom_frame(self, serial: str) -> bool:
@@ -680,11 +796,11 @@ class OpenRazerBridge:
             return False
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
             dev.setCustom()
             return True
-        except Exception as e:
-            print(f"Error setting custom frame: {e}")
+        except Exception:
+            logger.debug("Error setting custom frame", exc_info=True)
             return False
 
     def set_matrix_colors(self, serial: str, matrix: list[list[tuple[int, int, int]]]) -> bool:
@@ -733,11 +849,13 @@ class OpenRazerBridge:
             return None
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            # Drop any cached proxy so a restarted daemon is picked up
+            self._proxies.pop(device.object_path, None)
+            dev = self._get_proxy(device.object_path)
             self._detect_capabilities(dev, device)
             return device
-        except Exception as e:
-            print(f"Error refreshing device: {e}")
+        except Exception:
+            logger.debug("Error refreshing device", exc_info=True)
             return None
 
     def get_device_mode(self, serial: str) -> str | None:
@@ -751,10 +869,10 @@ class OpenRazerBridge:
             return None
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
             return dev.getDeviceMode()
-        except Exception as e:
-            print(f"Error getting device mode: {e}")
+        except Exception:
+            logger.debug("Error getting device mode", exc_info=True)
             return None
 
     def set_device_mode(self, serial: str, mode1: int = 0, mode2: int = 0) -> bool:
@@ -777,11 +895,11 @@ class OpenRazerBridge:
             return False
 
         try:
-            dev = self._bus.get(self.DBUS_INTERFACE, device.object_path)
+            dev = self._get_proxy(device.object_path)
             dev.setDeviceMode(mode1, mode2)
             return True
-        except Exception as e:
-            print(f"Error setting device mode: {e}")
+        except Exception:
+            logger.debug("Error setting device mode", exc_info=True)
             return False
 
     def set_driver_mode(self, serial: str) -> bool:
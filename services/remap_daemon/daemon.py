@@ -1,21 +1,41 @@
 """Remap daemon - main daemon that grabs devices and runs the remap engine."""
 
 import logging
+import os
 import selectors
 import signal
 import sys
+import threading
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from evdev import InputDevice, UInput, ecodes
 
 from crates.device_registry import DeviceRegistry
 from crates.profile_schema import Profile, ProfileLoader
-from services.app_watcher import AppWatcher
 
 from .engine import RemapEngine
 
+if TYPE_CHECKING:
+    from services.app_watcher import AppWatcher
+
 logger = logging.getLogger(__name__)
 
+# Selector key data marking the signal wakeup pipe (devices use their stable id)
+_WAKEUP = object()
+
+# Byte written to the wakeup pipe for a queued profile switch (no signal is 0)
+_SWITCH_REQUEST = 0
+
+
+@cache
+def _appwatcher_cls() -> type["AppWatcher"]:
+    """Import AppWatcher on first use; most daemons run without it."""
+    from services.app_watcher import AppWatcher
+
+    return AppWatcher
+
 
 class RemapDaemon:
     """Main remap daemon - grabs input devices and remaps events."""
@@ -29,6 +49,10 @@ class RemapDaemon:
         self.grabbed_devices: dict[str, InputDevice] = {}
         self.selector = selectors.DefaultSelector()
         self.running = False
+        self._wakeup_fds: tuple[int, int] | None = None
+        # Profile switch requested from another thread, applied by the loop
+        self._pending_profile: Profile | None = None
+        self._pending_lock = threading.Lock()
         self.enable_app_watcher = enable_app_watcher
         self.app_watcher: AppWatcher | None = None
 
@@ -42,8 +66,7 @@ class RemapDaemon:
         if not profile:
             logger.info("No active profile found. Creating default profile...")
             profile = self._create_default_profile()
-            self.profile_loader.save_profile(profile)
-            self.profile_loader.set_active_profile(profile.id)
+            self.profile_loader.save_and_activate(profile)
 
         # Create remap engine
         self.engine = RemapEngine(profile)
@@ -142,15 +165,28 @@ class RemapDaemon:
             try:
                 dev = InputDevice(event_path)
                 dev.grab()
-                self.grabbed_devices[stable_id] = dev
-                self.selector.register(dev, selectors.EVENT_READ)
-                logger.info("Grabbed device: %s (%s)", dev.name, stable_id)
-                grabbed_any = True
             except PermissionError:
                 logger.error("Permission denied for %s", event_path)
                 logger.error("Add yourself to the 'input' group or run with sudo")
+                continue
             except OSError as e:
                 logger.error("Failed to grab %s: %s", stable_id, e)
+                continue
+
+            try:
+                self.selector.register(dev, selectors.EVENT_READ, data=stable_id)
+            except (OSError, ValueError) as e:
+                # A grabbed device nobody reads would swallow all its input
+                logger.error("Failed to watch %s: %s", stable_id, e)
+                try:
+                    dev.ungrab()
+                except OSError:
+                    pass
+                continue
+
+            self.grabbed_devices[stable_id] = dev
+            logger.info("Grabbed device: %s (%s)", dev.name, stable_id)
+            grabbed_any = True
 
         return grabbed_any
 
@@ -167,6 +203,7 @@ class RemapDaemon:
 
         signal.signal(signal.SIGINT, handle_signal)
         signal.signal(signal.SIGTERM, handle_signal)
+        self._open_wakeup_pipe()
 
         self.running = True
 
@@ -175,28 +212,75 @@ class RemapDaemon:
 
         logger.info("Remap daemon running. Press Ctrl+C to stop.")
 
+        # This thread is the engine's only caller; other threads (the app
+        # watcher) hand work to it through the wakeup pipe
+        process_events = self.engine.process_events
+
         try:
             while self.running:
                 events = self.selector.select(timeout=0.1)
                 for key, _ in events:
+                    if key.data is _WAKEUP:
+                        self._handle_wakeup(key.fd)
+                        continue
                     device = key.fileobj
                     try:
-                        for event in device.read():  # type: ignore[union-attr]
-                            handled = self.engine.process_event(event)
-                            if not handled:
-                                # Pass through unhandled events
-                                self._passthrough_event(event)
+                        # Unhandled events are passed through
+                        process_events(device.read())  # type: ignore[union-attr]
                     except OSError as e:
-                        logger.error("Error reading device: %s", e)
+                        logger.error("Error reading device %s: %s", key.data, e)
         finally:
+            # Stop the watcher first so no switch request races the pipe closing
+            self._stop_app_watcher()
+            self._close_wakeup_pipe()
             self.cleanup()
 
+    def _open_wakeup_pipe(self) -> None:
+        """Deliver SIGHUP through the selector instead of interrupting it.
+
+        Python writes each caught signal's number to the wakeup fd, so a
+        reload request is just another readable fd in the select loop.
+        """
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        # The handler itself does nothing; the loop acts on the pipe
+        signal.signal(signal.SIGHUP, lambda signum, frame: None)
+        signal.set_wakeup_fd(write_fd)
+        self.selector.register(read_fd, selectors.EVENT_READ, data=_WAKEUP)
+        self._wakeup_fds = (read_fd, write_fd)
+
+    def _close_wakeup_pipe(self) -> None:
+        """Detach and close the signal wakeup pipe."""
+        if not self._wakeup_fds:
+            return
+        read_fd, write_fd = self._wakeup_fds
+        self._wakeup_fds = None
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGHUP, signal.SIG_DFL)
+        try:
+            self.selector.unregister(read_fd)
+        except (KeyError, ValueError):
+            pass
+        os.close(read_fd)
+        os.close(write_fd)
+
+    def _handle_wakeup(self, fd: int) -> None:
+        """Act on signals queued on the wakeup pipe."""
+        try:
+            signums = os.read(fd, 64)
+        except BlockingIOError:
+            return
+        if _SWITCH_REQUEST in signums:
+            self._apply_pending_switch()
+        if signal.SIGHUP in signums:
+            logger.info("Received SIGHUP, reloading profile...")
+            self.reload_profile()
+
     def _passthrough_event(self, event) -> None:
         """Pass through an event to the virtual device."""
-        if self.uinput:
-            self.uinput.write_event(event)
-            if event.type != ecodes.EV_SYN:
-                self.uinput.syn()
+        if self.engine:
+            self.engine.passthrough_event(event)
 
     def cleanup(self) -> None:
         """Clean up resources."""
@@ -241,23 +325,52 @@ class RemapDaemon:
             logger.info("Reloaded profile: %s", profile.name)
 
     def switch_profile(self, profile: Profile) -> None:
-        """Switch to a different profile."""
+        """Switch to a different profile.
+
+        Called from the app watcher thread. While the main loop runs, the
+        engine reload is handed to it through the wakeup pipe, so only the
+        loop thread ever touches engine state and the uinput frame buffer.
+        """
         if not self.engine:
             return
 
         # Update the active profile
         self.profile_loader.set_active_profile(profile.id)
 
-        # Reload the engine with new profile
-        self.engine.reload_profile(profile)
-        logger.info("Switched to profile: %s", profile.name)
+        wakeup_fds = self._wakeup_fds
+        if wakeup_fds is None:
+            # No loop running; nothing else is using the engine
+            self._reload_engine(profile)
+            return
+
+        # Only the latest request matters if several arrive before the loop wakes
+        with self._pending_lock:
+            self._pending_profile = profile
+        try:
+            os.write(wakeup_fds[1], bytes((_SWITCH_REQUEST,)))
+        except BlockingIOError:
+            # Pipe full: the loop already has wakeups to read
+            pass
+
+    def _apply_pending_switch(self) -> None:
+        """Apply the most recent switch queued by switch_profile()."""
+        with self._pending_lock:
+            profile, self._pending_profile = self._pending_profile, None
+        if profile:
+            self._reload_engine(profile)
+
+    def _reload_engine(self, profile: Profile) -> None:
+        """Reload the engine with a new profile."""
+        if self.engine:
+            self.engine.reload_profile(profile)
+            logger.info("Switched to profile: %s", profile.name)
 
     def _start_app_watcher(self) -> None:
         """Start the app watcher if enabled."""
         if not self.enable_app_watcher:
             return
 
-        self.app_watcher = AppWatcher(self.config_dir)
+        self.app_watcher = _appwatcher_cls()(self.config_dir)
         self.app_watcher.on_profile_change = self.switch_profile
 
         if self.app_watcher.start():
@@ -1,30 +1,142 @@
 """Remap engine - core remapping logic with multi-layer support."""
 
+import os
+import struct
 import time
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
+from functools import cache
+from types import MappingProxyType
 
 from evdev import InputEvent, UInput, ecodes
 
 from crates.keycode_map import schema_to_evdev_code
 from crates.profile_schema import ActionType, Binding, MacroAction, MacroStepType, Profile
 
+# Hoisted so the per-event type check is a global load, not a module attribute
+_EV_KEY = ecodes.EV_KEY
+_EV_SYN = ecodes.EV_SYN
+_SYN_REPORT = ecodes.SYN_REPORT
 
-@dataclass
+# Bytes in a bitmap with one bit for every EV_KEY code (0..KEY_MAX)
+_PRESSED_BITMAP_SIZE = ecodes.KEY_MAX // 8 + 1
+
+
+# Compiled macro ops are (op, code or delay seconds, value)
+_OP_WRITE = 0
+_OP_SYN = 1
+_OP_SLEEP = 2
+MacroOp = tuple[int, int | float, int]
+
+
+def _no_output(*_args) -> None:
+    """Stand-in for uinput write/syn until an output device is set."""
+
+
+class _EventBatch:
+    """Packs input_events for one frame and writes them in a single syscall.
+
+    UInput.write() makes a syscall per event (and syn() another); uinput
+    accepts any number of events per write(), so a chord or macro frame
+    goes out as one write.
+
+    Not thread-safe: the frame buffer is unlocked, so every write and syn
+    must come from one thread (the daemon's event loop).
+    """
+
+    # struct input_event: struct timeval, __u16 type, __u16 code, __s32 value
+    EVENT = struct.Struct("llHHi")
+
+    def __init__(self, fd: int, capacity: int = 64):
+        self._fd = fd
+        self._buf = bytearray(self.EVENT.size * capacity)
+        self._len = 0
+
+    def write(self, etype: int, code: int, value: int) -> None:
+        """Queue an event; the kernel stamps the time, so timeval stays zero."""
+        end = self._len + self.EVENT.size
+        if end > len(self._buf):
+            self._buf.extend(bytes(len(self._buf)))
+        self.EVENT.pack_into(self._buf, self._len, 0, 0, etype, code, value)
+        self._len = end
+
+    def syn(self) -> None:
+        """Append SYN_REPORT and write the whole frame; empty frames are dropped."""
+        if not self._len:
+            return
+        self.write(_EV_SYN, _SYN_REPORT, 0)
+        try:
+            os.write(self._fd, memoryview(self._buf)[: self._len])
+        finally:
+            # A failed write drops the frame rather than resending it next syn
+            self._len = 0
+
+
+def _sleep_until(deadline: float, clock: Callable[[], float]) -> float:
+    """Sleep off whatever remains until ``deadline`` and return it."""
+    remaining = deadline - clock()
+    if remaining > 0:
+        time.sleep(remaining)
+    return deadline
+
+
+@cache
+def _text_key_codes() -> Mapping[str, tuple[int, int]]:
+    """Resolve the characters TEXT macro steps can type.
+
+    Returns:
+        Read-only {char: (evdev code, SHIFT code or 0)}
+    """
+    char_to_key = {" ": "SPACE", "\n": "ENTER", "\t": "TAB"}
+    char_to_key.update({str(i): str(i) for i in range(10)})
+    for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+        char_to_key[letter.lower()] = letter
+        char_to_key[letter] = letter
+
+    shift_code = schema_to_evdev_code("SHIFT") or 0
+    text_codes = {}
+    for char, key in char_to_key.items():
+        code = schema_to_evdev_code(key)
+        if code:
+            text_codes[char] = (code, shift_code if char.isupper() else 0)
+    return MappingProxyType(text_codes)
+
+
+@dataclass(slots=True)
+class ResolvedBinding:
+    """A binding with its evdev output codes resolved once at profile load.
+
+    PASSTHROUGH, KEY and CHORD all reduce to "press output_codes in order";
+    MACRO carries the macro to run and DISABLED has neither.
+    """
+
+    binding: Binding
+    output_codes: tuple[int, ...] = ()
+    macro: MacroAction | None = None
+    # output_codes in release order (reversed), precomputed for key up
+    release_codes: tuple[int, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.release_codes = self.output_codes[::-1]
+
+
+@dataclass(slots=True)
 class ActiveBinding:
     """Tracks an active (pressed) binding and its output state."""
 
     input_code: int
     binding: Binding
     layer_id: str
-    output_codes: list[int] = field(default_factory=list)  # Keys we're holding down
+    output_codes: tuple[int, ...] = ()  # Keys we're holding down
+    release_codes: tuple[int, ...] = ()  # output_codes in release order
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyState:
     """Tracks the complete state of pressed keys and active bindings."""
 
-    # Physical keys currently pressed (input codes)
-    physical_pressed: set[int] = field(default_factory=set)
+    # Physical keys currently pressed, one bit per input code
+    pressed_bits: bytearray = field(default_factory=lambda: bytearray(_PRESSED_BITMAP_SIZE))
 
     # Currently active layer
     active_layer: str = "base"
@@ -39,6 +151,29 @@ class KeyState:
     # Layer modifier currently held (if any)
     layer_modifier_held: int | None = None
 
+    def reset(self) -> None:
+        """Return to the initial state, reusing the existing containers."""
+        self.pressed_bits[:] = bytes(len(self.pressed_bits))
+        self.active_layer = "base"
+        self.active_bindings.clear()
+        self.output_held.clear()
+        self.layer_modifier_held = None
+
+    def is_pressed(self, code: int) -> bool:
+        """Check whether an input code is physically held."""
+        return bool(self.pressed_bits[code >> 3] & (1 << (code & 7)))
+
+    @property
+    def physical_pressed(self) -> set[int]:
+        """Input codes currently pressed, decoded from the bitmap."""
+        return {
+            index << 3 | bit
+            for index, byte in enumerate(self.pressed_bits)
+            if byte
+            for bit in range(8)
+            if byte & (1 << bit)
+        }
+
 
 class RemapEngine:
     """Core remapping engine - translates input events to output events.
@@ -47,34 +182,50 @@ class RemapEngine:
     - Multi-layer bindings with hold-modifier switching (Hypershift)
     - Stuck key prevention on layer changes
     - Proper key state tracking for clean up/down handling
+
+    The engine is single-threaded: process_events(), reload_profile() and
+    release_all_keys() share state and one output frame, so call them all
+    from the thread running the event loop.
     """
 
     def __init__(self, profile: Profile):
         self.profile = profile
         self.state = KeyState()
         self._uinput: UInput | None = None
-        self._bindings: dict[str, dict[int, Binding]] = {}  # layer_id -> code -> binding
+        # uinput.write/syn bound once in set_uinput(); no-ops until then
+        self._write: Callable[..., None] = _no_output
+        self._syn: Callable[[], None] = _no_output
+        # layer_id -> code -> binding, with base bindings merged into every layer
+        self._bindings: dict[str, dict[int, ResolvedBinding]] = {}
+        # Table for state.active_layer; updated by _set_active_layer()
+        self._active_table: dict[int, ResolvedBinding] = {}
+        # Codes with a binding on any layer or a layer-modifier role
+        self._interesting: frozenset[int] = frozenset()
         self._macros: dict[str, MacroAction] = {}
+        self._compiled_macros: dict[str, tuple[MacroOp, ...]] = {}  # macro id -> ops
         self._layer_modifiers: dict[int, str] = {}  # input_code -> layer_id
         self._layer_by_id: dict[str, object] = {}  # layer_id -> Layer object
+        # char -> (code, shift code or 0) for TEXT macro steps
+        self._char_table = _text_key_codes()
 
         self._build_lookup_tables()
 
     def _build_lookup_tables(self) -> None:
         """Build fast lookup tables from profile."""
-        # Index macros by ID
+        # Index macros by ID and compile them to uinput ops up front
         for macro in self.profile.macros:
             self._macros[macro.id] = macro
+            self._compiled_macros[macro.id] = self._compile_macro(macro)
 
         # Index bindings by layer and input code
         for layer in self.profile.layers:
             self._layer_by_id[layer.id] = layer
-            layer_bindings: dict[int, Binding] = {}
+            layer_bindings: dict[int, ResolvedBinding] = {}
 
             for binding in layer.bindings:
                 code = schema_to_evdev_code(binding.input_code)
                 if code is not None:
-                    layer_bindings[code] = binding
+                    layer_bindings[code] = self._resolve_binding(binding, code)
 
             self._bindings[layer.id] = layer_bindings
 
@@ -84,22 +235,76 @@ class RemapEngine:
                 if mod_code is not None:
                     self._layer_modifiers[mod_code] = layer.id
 
+        # Merge base fallbacks into each layer so a lookup is one dict.get()
+        base = self._bindings.get("base")
+        if base:
+            for layer_id, layer_bindings in self._bindings.items():
+                if layer_id != "base":
+                    self._bindings[layer_id] = {**base, **layer_bindings}
+
+        self._interesting = frozenset(self._layer_modifiers).union(*self._bindings.values())
+        self._set_active_layer(self.state.active_layer)
+
+    def _set_active_layer(self, layer_id: str) -> None:
+        """Switch the active layer and its lookup table together."""
+        self.state.active_layer = layer_id
+        self._active_table = self._bindings.get(layer_id) or self._bindings.get("base", {})
+
+    def _resolve_binding(self, binding: Binding, input_code: int) -> ResolvedBinding:
+        """Resolve a binding's output keys to evdev codes."""
+        action = binding.action_type
+        if action == ActionType.PASSTHROUGH:
+            codes = [input_code]
+        elif action == ActionType.KEY:
+            codes = [schema_to_evdev_code(key) for key in binding.output_keys[:1]]
+        elif action == ActionType.CHORD:
+            codes = [schema_to_evdev_code(key) for key in binding.output_keys]
+        else:
+            codes = []
+
+        macro = None
+        if action == ActionType.MACRO and binding.macro_id:
+            macro = self._macros.get(binding.macro_id)
+
+        return ResolvedBinding(
+            binding=binding,
+            output_codes=tuple(code for code in codes if code),
+            macro=macro,
+        )
+
     def set_uinput(self, uinput: UInput) -> None:
         """Set the uinput device for output."""
         self._uinput = uinput
+        fd = getattr(uinput, "fd", None)
+        if isinstance(fd, int):
+            batch = _EventBatch(fd)
+            self._write = batch.write
+            self._syn = batch.syn
+        else:
+            # Not a real device node (e.g. a test double); use its methods
+            self._write = uinput.write
+            self._syn = uinput.syn
 
     def process_event(self, event: InputEvent) -> bool:
         """Process an input event and emit remapped output.
 
         Returns True if the event was handled (consumed), False if it should pass through.
         """
-        if event.type != ecodes.EV_KEY:
+        if event.type != _EV_KEY:
             # Pass through non-key events (mouse motion, scroll, etc.)
             return False
 
         code = event.code
         value = event.value  # 0=up, 1=down, 2=repeat
 
+        # Fast path: keys no layer remaps only need their pressed bit kept
+        if code not in self._interesting:
+            if value == 1:
+                self.state.pressed_bits[code >> 3] |= 1 << (code & 7)
+            elif value == 0:
+                self.state.pressed_bits[code >> 3] &= ~(1 << (code & 7))
+            return False
+
         # Handle layer modifier keys first
         if code in self._layer_modifiers:
             return self._handle_layer_modifier(code, value)
@@ -109,11 +314,44 @@ class RemapEngine:
             return self._handle_key_down(code)
         elif value == 0:  # Key up
             return self._handle_key_up(code)
-        elif value == 2:  # Repeat
-            return self._handle_key_repeat(code)
+        elif value == 2:  # Repeat: consume for bound keys, without a call
+            return code in self.state.active_bindings
 
         return False
 
+    def process_events(self, events: Iterable[InputEvent]) -> None:
+        """Process a batch read from one device, forwarding unhandled events.
+
+        Equivalent to process_event() and, when it returns False,
+        passthrough_event() per event; non-key events go straight to the
+        output frame without either call. The output callables are bound
+        once per batch, so nothing else may write through this engine
+        (e.g. a reload from another thread) until the batch returns.
+        """
+        process_event = self.process_event
+        write = self._write
+        syn = self._syn
+        for event in events:
+            etype = event.type
+            if etype == _EV_KEY:
+                if not process_event(event):
+                    write(etype, event.code, event.value)
+            elif etype == _EV_SYN and event.code == _SYN_REPORT:
+                syn()
+            else:
+                write(etype, event.code, event.value)
+
+    def passthrough_event(self, event: InputEvent) -> None:
+        """Forward an event the engine did not handle to the output device.
+
+        Events join the current output frame and the source device's own
+        SYN_REPORT flushes it, so a mouse report goes out in one write.
+        """
+        if event.type == _EV_SYN and event.code == _SYN_REPORT:
+            self._syn()
+        else:
+            self._write(event.type, event.code, event.value)
+
     def _handle_layer_modifier(self, code: int, value: int) -> bool:
         """Handle a layer modifier key (Hypershift-style)."""
         layer_id = self._layer_modifiers[code]
@@ -122,7 +360,7 @@ class RemapEngine:
             # Release any keys that would change behavior on the new layer
             self._release_conflicting_keys(layer_id)
 
-            self.state.active_layer = layer_id
+            self._set_active_layer(layer_id)
             self.state.layer_modifier_held = code
             # print(f"[Layer] Activated: {layer_id}")
 
@@ -131,7 +369,7 @@ class RemapEngine:
                 # Release any keys that were activated on this layer
                 self._release_layer_keys(layer_id)
 
-                self.state.active_layer = "base"
+                self._set_active_layer("base")
                 self.state.layer_modifier_held = None
                 # print(f"[Layer] Returned to: base")
 
@@ -151,7 +389,7 @@ class RemapEngine:
             old_binding = active.binding
 
             # If binding differs, release the old output
-            if new_binding != old_binding:
+            if new_binding is None or new_binding.binding != old_binding:
                 to_release.append(input_code)
 
         for input_code in to_release:
@@ -170,51 +408,49 @@ class RemapEngine:
 
     def _release_active_binding(self, input_code: int) -> None:
         """Release an active binding's output keys."""
-        if input_code not in self.state.active_bindings:
+        active = self.state.active_bindings.pop(input_code, None)
+        if active is None:
             return
 
-        active = self.state.active_bindings[input_code]
-
-        # Release output keys in reverse order
-        for output_code in reversed(active.output_codes):
-            self._emit_key(output_code, 0)
-            self.state.output_held.discard(output_code)
-
-        del self.state.active_bindings[input_code]
+        # Release output keys in reverse order as one input frame
+        if active.release_codes:
+            write = self._write
+            output_held = self.state.output_held
+            for output_code in active.release_codes:
+                write(_EV_KEY, output_code, 0)
+                output_held.discard(output_code)
+            self._syn()
 
     def _handle_key_down(self, code: int) -> bool:
         """Handle a key/button press."""
-        self.state.physical_pressed.add(code)
+        self.state.pressed_bits[code >> 3] |= 1 << (code & 7)
 
-        # Look up binding in current layer
-        binding = self._get_binding(code)
+        # Look up binding in current layer (base fallbacks are pre-merged)
+        binding = self._active_table.get(code)
 
         if binding is None:
             # No binding - pass through
             return False
 
-        # Track this as an active binding
-        active = ActiveBinding(
-            input_code=code,
-            binding=binding,
-            layer_id=self.state.active_layer,
-            output_codes=[],
-        )
-
         # Execute the binding
         output_codes = self._execute_binding_down(binding)
-        active.output_codes = output_codes
 
         # Track output keys as held
-        for oc in output_codes:
-            self.state.output_held.add(oc)
+        self.state.output_held.update(output_codes)
 
-        self.state.active_bindings[code] = active
+        # Track this as an active binding
+        self.state.active_bindings[code] = ActiveBinding(
+            input_code=code,
+            binding=binding.binding,
+            layer_id=self.state.active_layer,
+            output_codes=output_codes,
+            release_codes=binding.release_codes,
+        )
         return True
 
     def _handle_key_up(self, code: int) -> bool:
         """Handle a key/button release."""
-        self.state.physical_pressed.discard(code)
+        self.state.pressed_bits[code >> 3] &= ~(1 << (code & 7))
 
         # Check if we have an active binding for this key
         if code in self.state.active_bindings:
@@ -224,170 +460,149 @@ class RemapEngine:
         # No active binding - might have been passthrough
         return False
 
-    def _handle_key_repeat(self, code: int) -> bool:
-        """Handle a key repeat event."""
-        # For now, consume repeats for bound keys
-        if code in self.state.active_bindings:
-            return True
-        return False
-
-    def _get_binding(self, code: int) -> Binding | None:
-        """Get the binding for a key code in the current layer."""
-        return self._get_binding_for_layer(code, self.state.active_layer)
-
-    def _get_binding_for_layer(self, code: int, layer_id: str) -> Binding | None:
+    def _get_binding_for_layer(self, code: int, layer_id: str) -> ResolvedBinding | None:
         """Get the binding for a key code in a specific layer."""
-        # Check specified layer
-        if layer_id in self._bindings:
-            binding = self._bindings[layer_id].get(code)
-            if binding:
-                return binding
-
-        # Fall back to base layer (unless we're already checking base)
-        if layer_id != "base" and "base" in self._bindings:
-            return self._bindings["base"].get(code)
-
-        return None
-
-    def _execute_binding_down(self, binding: Binding) -> list[int]:
-        """Execute a binding on key down. Returns list of output codes held."""
-        output_codes = []
-
-        if binding.action_type == ActionType.PASSTHROUGH:
-            code = schema_to_evdev_code(binding.input_code)
-            if code:
-                self._emit_key(code, 1)
-                output_codes.append(code)
-
-        elif binding.action_type == ActionType.KEY:
-            if binding.output_keys:
-                code = schema_to_evdev_code(binding.output_keys[0])
-                if code:
-                    self._emit_key(code, 1)
-                    output_codes.append(code)
-
-        elif binding.action_type == ActionType.CHORD:
-            # Press all keys in order
-            for key in binding.output_keys:
-                code = schema_to_evdev_code(key)
-                if code:
-                    self._emit_key(code, 1)
-                    output_codes.append(code)
-
-        elif binding.action_type == ActionType.MACRO:
-            # Execute macro (fire-and-forget, no held keys)
-            if binding.macro_id and binding.macro_id in self._macros:
-                self._execute_macro(self._macros[binding.macro_id])
-
-        elif binding.action_type == ActionType.DISABLED:
-            # Consume the event, output nothing
-            pass
-
-        return output_codes
-
-    def _emit_key(self, code: int, value: int) -> None:
-        """Emit a key event through uinput."""
-        if self._uinput:
-            self._uinput.write(ecodes.EV_KEY, code, value)
-            self._uinput.syn()
-
-    def _execute_macro(self, macro: MacroAction) -> None:
-        """Execute a macro sequence."""
-        for repeat in range(macro.repeat_count):
-            for step in macro.steps:
-                self._execute_macro_step(step)
-
-            if macro.repeat_delay_ms > 0 and repeat < macro.repeat_count - 1:
-                time.sleep(macro.repeat_delay_ms / 1000.0)
-
-    def _execute_macro_step(self, step) -> None:
-        """Execute a single macro step."""
-        if step.type == MacroStepType.KEY_DOWN:
-            if step.key:
-                code = schema_to_evdev_code(step.key)
-                if code:
-                    self._emit_key(code, 1)
-
-        elif step.type == MacroStepType.KEY_UP:
-            if step.key:
-                code = schema_to_evdev_code(step.key)
-                if code:
-                    self._emit_key(code, 0)
+        # Layer tables already include base fallbacks
+        table = self._bindings.get(layer_id) or self._bindings.get("base", {})
+        return table.get(code)
+
+    def _execute_binding_down(self, binding: ResolvedBinding) -> tuple[int, ...]:
+        """Execute a binding on key down. Returns the output codes held."""
+        # PASSTHROUGH/KEY/CHORD press their resolved codes in order, one syn
+        if binding.output_codes:
+            write = self._write
+            for code in binding.output_codes:
+                write(_EV_KEY, code, 1)
+            self._syn()
+
+        # Macros are fire-and-forget, no held keys; DISABLED outputs nothing
+        if binding.macro is not None:
+            self._execute_macro(binding.macro)
+
+        return binding.output_codes
+
+    def _compile_macro(self, macro: MacroAction) -> tuple[MacroOp, ...]:
+        """Flatten a macro's steps into uinput write/syn/sleep ops.
+
+        Writes share one input frame until a code repeats (so a press and
+        its release stay in separate frames) or a delay follows, so
+        delay-free runs cost as few syns as possible.
+        """
+        ops: list[MacroOp] = []
+        frame: set[int] = set()
+
+        def sync() -> None:
+            if frame:
+                ops.append((_OP_SYN, 0, 0))
+                frame.clear()
+
+        def write(code: int, value: int) -> None:
+            if code in frame:
+                sync()
+            ops.append((_OP_WRITE, code, value))
+            frame.add(code)
+
+        def sleep(delay_ms: int) -> None:
+            sync()
+            if ops and ops[-1][0] == _OP_SLEEP:
+                # Back-to-back delays collapse into one sleep
+                ops[-1] = (_OP_SLEEP, ops[-1][1] + delay_ms / 1000.0, 0)
+            else:
+                ops.append((_OP_SLEEP, delay_ms / 1000.0, 0))
+
+        for step in macro.steps:
+            if step.type == MacroStepType.DELAY:
+                if step.delay_ms:
+                    sleep(step.delay_ms)
+
+            elif step.type == MacroStepType.TEXT:
+                for char in step.text or "":
+                    code, shift_code = self._char_table.get(char, (0, 0))
+                    if not code:
+                        continue
+                    if shift_code:
+                        write(shift_code, 1)
+                    write(code, 1)
+                    write(code, 0)
+                    if shift_code:
+                        write(shift_code, 0)
+                    # delay_ms on a TEXT step paces each character
+                    if step.delay_ms:
+                        sleep(step.delay_ms)
 
-        elif step.type == MacroStepType.KEY_PRESS:
-            if step.key:
+            elif step.key:
                 code = schema_to_evdev_code(step.key)
-                if code:
-                    self._emit_key(code, 1)
-                    time.sleep(0.01)
-                    self._emit_key(code, 0)
-
-        elif step.type == MacroStepType.DELAY:
-            if step.delay_ms:
-                time.sleep(step.delay_ms / 1000.0)
-
-        elif step.type == MacroStepType.TEXT:
-            if step.text:
-                self._type_text(step.text)
-
-    def _type_text(self, text: str) -> None:
-        """Type a text string by emitting key events."""
-        char_to_key = {
-            " ": "SPACE",
-            "\n": "ENTER",
-            "\t": "TAB",
-        }
+                if not code:
+                    continue
+                if step.type in (MacroStepType.KEY_DOWN, MacroStepType.KEY_PRESS):
+                    write(code, 1)
+                if step.type in (MacroStepType.KEY_UP, MacroStepType.KEY_PRESS):
+                    write(code, 0)
 
-        for char in text:
-            if char.isalpha():
-                key = char.upper()
-                needs_shift = char.isupper()
-            elif char.isdigit():
-                key = char
-                needs_shift = False
-            elif char in char_to_key:
-                key = char_to_key[char]
-                needs_shift = False
-            else:
-                continue
+        sync()
+        return tuple(ops)
 
-            code = schema_to_evdev_code(key)
-            if code:
-                if needs_shift:
-                    shift_code = schema_to_evdev_code("SHIFT")
-                    if shift_code:
-                        self._emit_key(shift_code, 1)
+    def _execute_macro(self, macro: MacroAction) -> None:
+        """Execute a macro sequence from its compiled ops.
 
-                self._emit_key(code, 1)
-                time.sleep(0.01)
-                self._emit_key(code, 0)
+        Delays are measured against a running deadline rather than slept
+        in full, so time spent writing events is absorbed into the next
+        delay instead of accumulating across the macro.
+        """
+        ops = self._compiled_macros.get(macro.id, ())
+        write = self._write
+        syn = self._syn
+        clock = time.perf_counter
+        repeat_delay = macro.repeat_delay_ms / 1000.0
+        deadline = clock()
 
-                if needs_shift and shift_code:
-                    self._emit_key(shift_code, 0)
+        for repeat in range(macro.repeat_count):
+            for op, arg, value in ops:
+                if op == _OP_WRITE:
+                    write(_EV_KEY, arg, value)
+                elif op == _OP_SYN:
+                    syn()
+                else:
+                    deadline = _sleep_until(deadline + arg, clock)
 
-                time.sleep(0.01)
+            if repeat_delay > 0 and repeat < macro.repeat_count - 1:
+                deadline = _sleep_until(deadline + repeat_delay, clock)
 
     def release_all_keys(self) -> None:
         """Release all currently held output keys. Call on shutdown."""
-        # Release all active bindings
-        for input_code in list(self.state.active_bindings.keys()):
-            self._release_active_binding(input_code)
+        # Each binding's keys in its release order, then any orphans still
+        # tracked (safety); dict keys drop codes two bindings share
+        active_bindings = self.state.active_bindings
+        output_held = self.state.output_held
+        release = dict.fromkeys(
+            code for active in active_bindings.values() for code in active.release_codes
+        )
+        release.update(dict.fromkeys(output_held))
+        active_bindings.clear()
+        output_held.clear()
 
-        # Safety: release any tracked output keys
-        for code in list(self.state.output_held):
-            self._emit_key(code, 0)
-        self.state.output_held.clear()
+        # Everything goes up in one input frame
+        if release:
+            write = self._write
+            for code in release:
+                write(_EV_KEY, code, 0)
+            self._syn()
 
     def reload_profile(self, profile: Profile) -> None:
-        """Reload with a new profile."""
+        """Reload with a new profile.
+
+        State is reset in place, so this must run on the thread that feeds
+        process_events(); RemapDaemon defers watcher-driven switches to it.
+        """
         # Release all held keys first
         self.release_all_keys()
 
-        # Reset state
+        # Reset state in place; release_all_keys() already emptied the held sets
         self.profile = profile
-        self.state = KeyState()
+        self.state.reset()
         self._bindings.clear()
         self._macros.clear()
+        self._compiled_macros.clear()
         self._layer_modifiers.clear()
         self._layer_by_id.clear()
 
@@ -0,0 +1,19 @@
+"""Shared pytest fixtures."""
+
+import os
+
+import pytest
+
+# Set offscreen platform before any Qt imports
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create the QApplication once for the whole test session."""
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
@@ -1,20 +1,25 @@
 """Tests for RemapDaemon - main daemon orchestration."""
 
+import os
+import selectors
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 from evdev import InputEvent, ecodes
 
 from crates.profile_schema import Binding, Layer, Profile
+from services.remap_daemon import daemon as daemon_module
 from services.remap_daemon.daemon import RemapDaemon
 
 # --- Fixtures ---
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_profile():
-    """Create a mock profile."""
+    """Create a mock profile, validated once and shared by the module."""
     return Profile(
         id="test",
         name="Test Profile",
@@ -31,7 +36,7 @@ def mock_profile():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_profile_loader(mock_profile):
     """Create a mock ProfileLoader."""
     loader = MagicMock()
@@ -41,7 +46,7 @@ def mock_profile_loader(mock_profile):
     return loader
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_device_registry():
     """Create a mock DeviceRegistry."""
     registry = MagicMock()
@@ -52,27 +57,97 @@ def mock_device_registry():
 
 
 @pytest.fixture
-def mock_input_device():
-    """Create a mock InputDevice."""
-    device = MagicMock()
-    device.name = "Razer Test Mouse"
-    device.grab = MagicMock()
-    device.ungrab = MagicMock()
-    device.read = MagicMock(return_value=[])
-    device.fileno = MagicMock(return_value=5)
-    return device
+def device_fd():
+    """Provide a real open fd for stub devices, so epoll accepts them."""
+    read_fd, write_fd = os.pipe()
+    yield read_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+@pytest.fixture
+def mock_input_device(device_fd):
+    """Create a stub InputDevice; only the asserted methods are mocks."""
+    return SimpleNamespace(
+        name="Razer Test Mouse",
+        fileno=lambda: device_fd,
+        read=lambda: [],
+        grab=MagicMock(),
+        ungrab=MagicMock(),
+    )
 
 
 @pytest.fixture
 def mock_uinput():
-    """Create a mock UInput."""
-    uinput = MagicMock()
-    uinput.name = "Razer Control Center Virtual Device"
-    uinput.write = MagicMock()
-    uinput.write_event = MagicMock()
-    uinput.syn = MagicMock()
-    uinput.close = MagicMock()
-    return uinput
+    """Create a stub UInput; only the asserted methods are mocks."""
+    return SimpleNamespace(
+        name="Razer Control Center Virtual Device",
+        write=MagicMock(),
+        syn=MagicMock(),
+        close=MagicMock(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def daemon_deps(
+    monkeypatch, mock_profile_loader, mock_device_registry, mock_input_device, mock_uinput
+):
+    """Replace the daemon's device and config classes for every test.
+
+    Each class is a MagicMock returning the matching fixture; tests that
+    need another return value or a side effect set it on the namespace.
+    The module-scoped loader and registry have their call history cleared
+    so assertions only see the current test.
+    """
+    mock_profile_loader.reset_mock()
+    mock_device_registry.reset_mock()
+    deps = SimpleNamespace(
+        UInput=MagicMock(return_value=mock_uinput),
+        InputDevice=MagicMock(return_value=mock_input_device),
+        ProfileLoader=MagicMock(return_value=mock_profile_loader),
+        DeviceRegistry=MagicMock(return_value=mock_device_registry),
+        AppWatcher=MagicMock(),
+    )
+    for name in ("UInput", "InputDevice", "ProfileLoader", "DeviceRegistry"):
+        monkeypatch.setattr(daemon_module, name, getattr(deps, name))
+    monkeypatch.setattr(daemon_module, "_appwatcher_cls", lambda: deps.AppWatcher)
+    return deps
+
+
+class FakeEngine:
+    """Stand-in for RemapEngine in tests that only check delegation."""
+
+    __slots__ = (
+        "set_uinput",
+        "process_event",
+        "process_events",
+        "passthrough_event",
+        "release_all_keys",
+        "reload_profile",
+    )
+
+    def __init__(self, profile=None):
+        self.set_uinput = MagicMock()
+        self.process_event = MagicMock(return_value=False)
+        self.process_events = MagicMock()
+        self.passthrough_event = MagicMock()
+        self.release_all_keys = MagicMock()
+        self.reload_profile = MagicMock()
+
+
+@pytest.fixture
+def fake_engine(monkeypatch):
+    """Build FakeEngines instead of real engines during daemon setup."""
+    monkeypatch.setattr(daemon_module, "RemapEngine", FakeEngine)
+
+
+@pytest.fixture
+def setup_daemon():
+    """Provide a daemon that has run setup() against the patched dependencies."""
+    daemon = RemapDaemon()
+    daemon.setup()
+    yield daemon
+    daemon.cleanup()
 
 
 # --- Test Classes ---
@@ -110,28 +185,8 @@ class TestRemapDaemonInit:
 class TestSetup:
     """Tests for daemon setup."""
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_setup_success(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_input_device,
-        mock_uinput,
-    ):
+    def test_setup_success(self, mock_uinput):
         """Test successful setup."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.return_value = mock_input_device
-        mock_uinput_class.return_value = mock_uinput
-
         daemon = RemapDaemon()
         result = daemon.setup()
 
@@ -140,46 +195,21 @@ class TestSetup:
         assert daemon.uinput == mock_uinput
         assert "razer_mouse_001" in daemon.grabbed_devices
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_setup_creates_default_profile_if_none(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_uinput_class,
-        mock_device_registry,
-        mock_uinput,
-    ):
+    def test_setup_creates_default_profile_if_none(self, daemon_deps):
         """Test setup creates default profile when none exists."""
         mock_loader = MagicMock()
         mock_loader.load_active_profile.return_value = None
-        mock_loader_class.return_value = mock_loader
-
-        mock_registry_class.return_value = mock_device_registry
-        mock_uinput_class.return_value = mock_uinput
+        daemon_deps.ProfileLoader.return_value = mock_loader
 
         daemon = RemapDaemon()
         daemon.setup()
 
-        mock_loader.save_profile.assert_called_once()
-        mock_loader.set_active_profile.assert_called_once()
-
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_setup_fails_on_uinput_error(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_uinput_class,
-        mock_profile_loader,
-        mock_device_registry,
-    ):
+        mock_loader.save_and_activate.assert_called_once()
+        assert mock_loader.save_and_activate.call_args[0][0].id == "default"
+
+    def test_setup_fails_on_uinput_error(self, daemon_deps):
         """Test setup fails when UInput creation fails."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_uinput_class.side_effect = PermissionError("No permission")
+        daemon_deps.UInput.side_effect = PermissionError("No permission")
 
         daemon = RemapDaemon()
         result = daemon.setup()
@@ -190,54 +220,21 @@ class TestSetup:
 class TestGrabDevices:
     """Tests for device grabbing."""
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_grab_devices_success(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_input_device,
-        mock_uinput,
-    ):
+    def test_grab_devices_success(self, mock_input_device):
         """Test successful device grabbing."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.return_value = mock_input_device
-        mock_uinput_class.return_value = mock_uinput
-
         daemon = RemapDaemon()
+        daemon.selector = MagicMock()
         daemon.setup()
 
         mock_input_device.grab.assert_called_once()
         assert "razer_mouse_001" in daemon.grabbed_devices
+        daemon.selector.register.assert_called_once_with(
+            mock_input_device, selectors.EVENT_READ, data="razer_mouse_001"
+        )
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_grab_devices_permission_denied(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_uinput,
-    ):
+    def test_grab_devices_permission_denied(self, daemon_deps):
         """Test handling permission denied on grab."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.side_effect = PermissionError("No permission")
-        mock_uinput_class.return_value = mock_uinput
+        daemon_deps.InputDevice.side_effect = PermissionError("No permission")
 
         daemon = RemapDaemon()
         result = daemon.setup()
@@ -245,42 +242,18 @@ class TestGrabDevices:
         assert result is False
         assert len(daemon.grabbed_devices) == 0
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_grab_devices_device_not_found(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_uinput_class,
-        mock_profile_loader,
-        mock_uinput,
-    ):
+    def test_grab_devices_device_not_found(self, daemon_deps):
         """Test handling device not found."""
-        mock_loader_class.return_value = mock_profile_loader
-
         mock_registry = MagicMock()
         mock_registry.get_event_path.return_value = None  # Device not found
-        mock_registry_class.return_value = mock_registry
-
-        mock_uinput_class.return_value = mock_uinput
+        daemon_deps.DeviceRegistry.return_value = mock_registry
 
         daemon = RemapDaemon()
         result = daemon.setup()
 
         assert result is False
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_grab_no_devices_configured(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_uinput_class,
-        mock_device_registry,
-        mock_uinput,
-    ):
+    def test_grab_no_devices_configured(self, daemon_deps):
         """Test handling no devices in profile."""
         mock_loader = MagicMock()
         mock_loader.load_active_profile.return_value = Profile(
@@ -289,9 +262,7 @@ class TestGrabDevices:
             input_devices=[],  # No devices
             layers=[Layer(id="base", name="Base", bindings=[])],
         )
-        mock_loader_class.return_value = mock_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_uinput_class.return_value = mock_uinput
+        daemon_deps.ProfileLoader.return_value = mock_loader
 
         daemon = RemapDaemon()
         result = daemon.setup()
@@ -302,30 +273,9 @@ class TestGrabDevices:
 class TestCleanup:
     """Tests for daemon cleanup."""
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_cleanup_releases_devices(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_input_device,
-        mock_uinput,
-    ):
+    def test_cleanup_releases_devices(self, mock_input_device, mock_uinput, setup_daemon):
         """Test cleanup releases grabbed devices."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.return_value = mock_input_device
-        mock_uinput_class.return_value = mock_uinput
-
-        daemon = RemapDaemon()
-        daemon.setup()
+        daemon = setup_daemon
         daemon.cleanup()
 
         mock_input_device.ungrab.assert_called_once()
@@ -333,33 +283,9 @@ class TestCleanup:
         assert len(daemon.grabbed_devices) == 0
         assert daemon.uinput is None
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_cleanup_releases_held_keys(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_input_device,
-        mock_uinput,
-    ):
+    def test_cleanup_releases_held_keys(self, fake_engine, setup_daemon):
         """Test cleanup releases held keys via engine."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.return_value = mock_input_device
-        mock_uinput_class.return_value = mock_uinput
-
-        daemon = RemapDaemon()
-        daemon.setup()
-
-        # Mock release_all_keys
-        daemon.engine.release_all_keys = MagicMock()
+        daemon = setup_daemon
 
         daemon.cleanup()
 
@@ -375,134 +301,44 @@ class TestCleanup:
 class TestPassthroughEvent:
     """Tests for event passthrough."""
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_passthrough_writes_event(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_input_device,
-        mock_uinput,
-    ):
+    def test_passthrough_writes_event(self, mock_uinput, setup_daemon):
         """Test passthrough writes event to uinput."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.return_value = mock_input_device
-        mock_uinput_class.return_value = mock_uinput
-
-        daemon = RemapDaemon()
-        daemon.setup()
+        daemon = setup_daemon
 
-        # Create a key event
+        # Create a key event; it joins the frame until the device's SYN
         event = InputEvent(0, 0, ecodes.EV_KEY, ecodes.KEY_Q, 1)
         daemon._passthrough_event(event)
 
-        mock_uinput.write_event.assert_called_with(event)
-        mock_uinput.syn.assert_called()
-
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_passthrough_no_syn_for_syn_event(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_input_device,
-        mock_uinput,
-    ):
-        """Test passthrough doesn't syn for EV_SYN events."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.return_value = mock_input_device
-        mock_uinput_class.return_value = mock_uinput
+        mock_uinput.write.assert_called_with(ecodes.EV_KEY, ecodes.KEY_Q, 1)
+        mock_uinput.syn.assert_not_called()
 
-        daemon = RemapDaemon()
-        daemon.setup()
+    def test_passthrough_no_syn_for_syn_event(self, mock_uinput, setup_daemon):
+        """Test passthrough flushes the frame on SYN_REPORT instead of writing it."""
+        daemon = setup_daemon
 
         # Create a SYN event
-        event = InputEvent(0, 0, ecodes.EV_SYN, 0, 0)
+        event = InputEvent(0, 0, ecodes.EV_SYN, ecodes.SYN_REPORT, 0)
         daemon._passthrough_event(event)
 
-        mock_uinput.write_event.assert_called_with(event)
-        mock_uinput.syn.assert_not_called()
+        mock_uinput.syn.assert_called_once_with()
+        mock_uinput.write.assert_not_called()
 
 
 class TestProfileManagement:
     """Tests for profile reload and switching."""
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_reload_profile(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_input_device,
-        mock_uinput,
-    ):
+    def test_reload_profile(self, fake_engine, mock_profile_loader, setup_daemon):
         """Test profile reloading."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.return_value = mock_input_device
-        mock_uinput_class.return_value = mock_uinput
-
-        daemon = RemapDaemon()
-        daemon.setup()
-
-        # Mock reload_profile on engine
-        daemon.engine.reload_profile = MagicMock()
+        daemon = setup_daemon
 
         daemon.reload_profile()
 
         mock_profile_loader.load_active_profile.assert_called()
         daemon.engine.reload_profile.assert_called_once()
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_switch_profile(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_input_device,
-        mock_uinput,
-    ):
+    def test_switch_profile(self, fake_engine, mock_profile_loader, setup_daemon):
         """Test switching to a different profile."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.return_value = mock_input_device
-        mock_uinput_class.return_value = mock_uinput
-
-        daemon = RemapDaemon()
-        daemon.setup()
-
-        # Mock reload_profile on engine
-        daemon.engine.reload_profile = MagicMock()
+        daemon = setup_daemon
 
         new_profile = Profile(
             id="new",
@@ -514,6 +350,62 @@ class TestProfileManagement:
         mock_profile_loader.set_active_profile.assert_called_with("new")
         daemon.engine.reload_profile.assert_called_with(new_profile)
 
+    def test_switch_profile_deferred_to_event_loop(
+        self, fake_engine, mock_profile_loader, setup_daemon
+    ):
+        """Test a switch from another thread is applied by the loop's wakeup handler."""
+        daemon = setup_daemon
+        first = Profile(id="first", name="First", layers=[Layer(id="base", name="Base")])
+        second = Profile(id="second", name="Second", layers=[Layer(id="base", name="Base")])
+
+        daemon._open_wakeup_pipe()
+        try:
+            for profile in (first, second):
+                watcher = threading.Thread(target=daemon.switch_profile, args=(profile,))
+                watcher.start()
+                watcher.join()
+
+            # The watcher thread never touches the engine itself
+            daemon.engine.reload_profile.assert_not_called()
+            mock_profile_loader.set_active_profile.assert_called_with("second")
+
+            daemon._handle_wakeup(daemon._wakeup_fds[0])
+        finally:
+            daemon._close_wakeup_pipe()
+
+        # Only the latest request is applied
+        daemon.engine.reload_profile.assert_called_once_with(second)
+        assert daemon._pending_profile is None
+
+    def test_watcher_stopped_before_wakeup_pipe_closes(
+        self, fake_engine, mock_profile_loader, setup_daemon
+    ):
+        """Test the watcher is stopped before the wakeup pipe closes on exit."""
+        daemon = setup_daemon
+        daemon.grabbed_devices = {"dev": MagicMock()}
+        order = []
+        watcher = MagicMock()
+        watcher.stop.side_effect = lambda: order.append("watcher")
+        daemon.app_watcher = watcher
+        close_pipe = daemon._close_wakeup_pipe
+
+        def close_after_watcher():
+            order.append("pipe")
+            close_pipe()
+
+        daemon._close_wakeup_pipe = close_after_watcher
+
+        def stop_loop(timeout):
+            daemon.running = False
+            return []
+
+        daemon.selector.select = stop_loop
+
+        with patch("services.remap_daemon.daemon.signal.signal"):
+            daemon.run()
+
+        assert order == ["watcher", "pipe"]
+
     def test_switch_profile_without_engine(self):
         """Test switch_profile does nothing without engine."""
         daemon = RemapDaemon()
@@ -524,71 +416,27 @@ class TestProfileManagement:
 class TestAppWatcher:
     """Tests for app watcher integration."""
 
-    @patch("services.remap_daemon.daemon.AppWatcher")
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_start_app_watcher(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_app_watcher_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_input_device,
-        mock_uinput,
-    ):
+    def test_start_app_watcher(self, daemon_deps):
         """Test starting app watcher."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.return_value = mock_input_device
-        mock_uinput_class.return_value = mock_uinput
-
         mock_watcher = MagicMock()
         mock_watcher.start.return_value = True
         mock_watcher.backend_name = "x11"
-        mock_app_watcher_class.return_value = mock_watcher
+        daemon_deps.AppWatcher.return_value = mock_watcher
 
         daemon = RemapDaemon(enable_app_watcher=True)
         daemon.setup()
         daemon._start_app_watcher()
 
-        mock_app_watcher_class.assert_called_once()
+        daemon_deps.AppWatcher.assert_called_once()
         mock_watcher.start.assert_called_once()
         assert daemon.app_watcher == mock_watcher
 
-    @patch("services.remap_daemon.daemon.AppWatcher")
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_stop_app_watcher(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_app_watcher_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_input_device,
-        mock_uinput,
-    ):
+    def test_stop_app_watcher(self, daemon_deps):
         """Test stopping app watcher."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.return_value = mock_input_device
-        mock_uinput_class.return_value = mock_uinput
-
         mock_watcher = MagicMock()
         mock_watcher.start.return_value = True
         mock_watcher.backend_name = "x11"
-        mock_app_watcher_class.return_value = mock_watcher
+        daemon_deps.AppWatcher.return_value = mock_watcher
 
         daemon = RemapDaemon(enable_app_watcher=True)
         daemon.setup()
@@ -609,17 +457,9 @@ class TestAppWatcher:
 class TestCreateDefaultProfile:
     """Tests for default profile creation."""
 
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_creates_valid_profile(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_device_registry,
-    ):
+    def test_creates_valid_profile(self, daemon_deps):
         """Test default profile is valid."""
-        mock_loader_class.return_value = MagicMock()
-        mock_registry_class.return_value = mock_device_registry
+        daemon_deps.ProfileLoader.return_value = MagicMock()
 
         daemon = RemapDaemon()
         profile = daemon._create_default_profile()
@@ -630,15 +470,9 @@ class TestCreateDefaultProfile:
         assert len(profile.layers) == 1
         assert profile.layers[0].id == "base"
 
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_includes_first_mouse(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-    ):
+    def test_includes_first_mouse(self, daemon_deps):
         """Test default profile includes first mouse device."""
-        mock_loader_class.return_value = MagicMock()
+        daemon_deps.ProfileLoader.return_value = MagicMock()
 
         mock_mouse = MagicMock()
         mock_mouse.stable_id = "razer_deathadder_001"
@@ -650,7 +484,7 @@ class TestCreateDefaultProfile:
 
         mock_registry = MagicMock()
         mock_registry.get_razer_devices.return_value = [mock_keyboard, mock_mouse]
-        mock_registry_class.return_value = mock_registry
+        daemon_deps.DeviceRegistry.return_value = mock_registry
 
         daemon = RemapDaemon()
         profile = daemon._create_default_profile()
@@ -661,21 +495,9 @@ class TestCreateDefaultProfile:
 class TestSetupErrorHandling:
     """Tests for error handling during setup."""
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_setup_fails_on_oserror(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_uinput_class,
-        mock_profile_loader,
-        mock_device_registry,
-    ):
+    def test_setup_fails_on_oserror(self, daemon_deps):
         """Test setup fails when UInput creation raises OSError (lines 66-69)."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_uinput_class.side_effect = OSError("Failed to open uinput")
+        daemon_deps.UInput.side_effect = OSError("Failed to open uinput")
 
         daemon = RemapDaemon()
         result = daemon.setup()
@@ -686,16 +508,7 @@ class TestSetupErrorHandling:
 class TestGrabDevicesListRazer:
     """Tests for grab_devices listing Razer devices."""
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_lists_available_razer_devices_when_none_configured(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_uinput_class,
-        mock_uinput,
-    ):
+    def test_lists_available_razer_devices_when_none_configured(self, daemon_deps):
         """Test lists available Razer devices when none configured (lines 101-105)."""
         # Profile with no input devices
         mock_loader = MagicMock()
@@ -705,7 +518,7 @@ class TestGrabDevicesListRazer:
             input_devices=[],
             layers=[Layer(id="base", name="Base", bindings=[])],
         )
-        mock_loader_class.return_value = mock_loader
+        daemon_deps.ProfileLoader.return_value = mock_loader
 
         # Registry has available Razer devices
         mock_razer_device = MagicMock()
@@ -715,9 +528,7 @@ class TestGrabDevicesListRazer:
 
         mock_registry = MagicMock()
         mock_registry.scan_devices.return_value = [mock_razer_device]
-        mock_registry_class.return_value = mock_registry
-
-        mock_uinput_class.return_value = mock_uinput
+        daemon_deps.DeviceRegistry.return_value = mock_registry
 
         daemon = RemapDaemon()
         result = daemon.setup()
@@ -731,30 +542,12 @@ class TestGrabDevicesListRazer:
 class TestGrabDevicesOSError:
     """Tests for OSError handling during device grab."""
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_grab_device_oserror(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_uinput,
-    ):
+    def test_grab_device_oserror(self, daemon_deps):
         """Test handling OSError when grabbing device (lines 125-126)."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_uinput_class.return_value = mock_uinput
-
         # InputDevice constructor succeeds, but grab() raises OSError
         mock_device = MagicMock()
         mock_device.grab.side_effect = OSError("Device busy")
-        mock_input_device_class.return_value = mock_device
+        daemon_deps.InputDevice.return_value = mock_device
 
         daemon = RemapDaemon()
         result = daemon.setup()
@@ -762,35 +555,28 @@ class TestGrabDevicesOSError:
         assert result is False
         assert len(daemon.grabbed_devices) == 0
 
+    def test_register_failure_releases_grab(self, mock_input_device):
+        """Test a device the selector can't watch is ungrabbed, not left dead."""
+        daemon = RemapDaemon()
+        daemon.selector = MagicMock()
+        daemon.selector.register.side_effect = ValueError("Invalid file descriptor")
+
+        assert daemon.setup() is False
+        mock_input_device.grab.assert_called_once()
+        mock_input_device.ungrab.assert_called_once()
+        assert daemon.grabbed_devices == {}
+
 
 class TestCleanupExceptionHandling:
     """Tests for exception handling during cleanup."""
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_cleanup_handles_ungrab_oserror(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_uinput,
-    ):
+    def test_cleanup_handles_ungrab_oserror(self, daemon_deps, device_fd):
         """Test cleanup handles OSError when ungrabbing (lines 190-191)."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_uinput_class.return_value = mock_uinput
-
         mock_device = MagicMock()
         mock_device.name = "Test Device"
-        mock_device.fileno.return_value = 5
+        mock_device.fileno.return_value = device_fd
         mock_device.ungrab.side_effect = OSError("Device not grabbed")
-        mock_input_device_class.return_value = mock_device
+        daemon_deps.InputDevice.return_value = mock_device
 
         daemon = RemapDaemon()
         daemon.setup()
@@ -798,30 +584,12 @@ class TestCleanupExceptionHandling:
         daemon.cleanup()
         assert len(daemon.grabbed_devices) == 0
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_cleanup_handles_unregister_keyerror(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_uinput,
-    ):
+    def test_cleanup_handles_unregister_keyerror(self, daemon_deps, device_fd):
         """Test cleanup handles KeyError when unregistering (lines 194-195)."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_uinput_class.return_value = mock_uinput
-
         mock_device = MagicMock()
         mock_device.name = "Test Device"
-        mock_device.fileno.return_value = 5
-        mock_input_device_class.return_value = mock_device
+        mock_device.fileno.return_value = device_fd
+        daemon_deps.InputDevice.return_value = mock_device
 
         daemon = RemapDaemon()
         daemon.setup()
@@ -831,33 +599,16 @@ class TestCleanupExceptionHandling:
         daemon.cleanup()
         assert len(daemon.grabbed_devices) == 0
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_cleanup_handles_uinput_close_oserror(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-    ):
+    def test_cleanup_handles_uinput_close_oserror(self, daemon_deps, device_fd):
         """Test cleanup handles OSError when closing uinput (lines 203-204)."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-
         mock_uinput = MagicMock()
         mock_uinput.name = "Test UInput"
         mock_uinput.close.side_effect = OSError("Already closed")
-        mock_uinput_class.return_value = mock_uinput
 
         mock_device = MagicMock()
         mock_device.name = "Test Device"
-        mock_device.fileno.return_value = 5
-        mock_input_device_class.return_value = mock_device
+        mock_device.fileno.return_value = device_fd
+        daemon_deps.InputDevice.return_value = mock_device
 
         daemon = RemapDaemon()
         daemon.setup()
@@ -869,33 +620,11 @@ class TestCleanupExceptionHandling:
 class TestAppWatcherFailure:
     """Tests for app watcher failure to start."""
 
-    @patch("services.remap_daemon.daemon.AppWatcher")
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_app_watcher_fails_to_start(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_app_watcher_class,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_input_device,
-        mock_uinput,
-    ):
+    def test_app_watcher_fails_to_start(self, daemon_deps):
         """Test handling when app watcher fails to start (lines 239-240)."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_input_device_class.return_value = mock_input_device
-        mock_uinput_class.return_value = mock_uinput
-
         mock_watcher = MagicMock()
         mock_watcher.start.return_value = False  # Fails to start
-        mock_app_watcher_class.return_value = mock_watcher
+        daemon_deps.AppWatcher.return_value = mock_watcher
 
         daemon = RemapDaemon(enable_app_watcher=True)
         daemon.setup()
@@ -908,17 +637,7 @@ class TestAppWatcherFailure:
 class TestRunMethod:
     """Tests for the run() method and main loop."""
 
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_run_without_setup(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-    ):
+    def test_run_without_setup(self):
         """Test run returns early without proper setup (lines 132-134)."""
         daemon = RemapDaemon()
         # Should return without error when not set up
@@ -926,34 +645,15 @@ class TestRunMethod:
         assert daemon.running is False
 
     @patch("services.remap_daemon.daemon.signal")
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_run_processes_events(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_signal,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_uinput,
-    ):
+    def test_run_processes_events(self, mock_signal, daemon_deps, device_fd):
         """Test run processes events from devices (lines 151-165)."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_uinput_class.return_value = mock_uinput
-
         # Create mock device with events
         key_event = InputEvent(0, 0, ecodes.EV_KEY, ecodes.KEY_A, 1)
         mock_device = MagicMock()
         mock_device.name = "Test Device"
-        mock_device.fileno.return_value = 5
+        mock_device.fileno.return_value = device_fd
         mock_device.read.return_value = [key_event]
-        mock_input_device_class.return_value = mock_device
+        daemon_deps.InputDevice.return_value = mock_device
 
         daemon = RemapDaemon()
         daemon.setup()
@@ -977,33 +677,14 @@ class TestRunMethod:
         mock_device.read.assert_called()
 
     @patch("services.remap_daemon.daemon.signal")
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_run_handles_read_oserror(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_signal,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_uinput,
-    ):
+    def test_run_handles_read_oserror(self, mock_signal, daemon_deps, device_fd):
         """Test run handles OSError during device read (lines 162-163)."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_uinput_class.return_value = mock_uinput
-
         # Create mock device that raises OSError on read
         mock_device = MagicMock()
         mock_device.name = "Test Device"
-        mock_device.fileno.return_value = 5
+        mock_device.fileno.return_value = device_fd
         mock_device.read.side_effect = OSError("Device disconnected")
-        mock_input_device_class.return_value = mock_device
+        daemon_deps.InputDevice.return_value = mock_device
 
         daemon = RemapDaemon()
         daemon.setup()
@@ -1025,32 +706,42 @@ class TestRunMethod:
         # Should not raise
         daemon.run()
 
+    def test_run_reloads_profile_on_sighup(self, fake_engine, setup_daemon):
+        """Test SIGHUP arrives through the selector and reloads the profile."""
+        import signal
+
+        daemon = setup_daemon
+        daemon.reload_profile = MagicMock()
+        select = daemon.selector.select
+        calls = []
+
+        def select_once_after_sighup(timeout):
+            calls.append(timeout)
+            if len(calls) == 1:
+                os.kill(os.getpid(), signal.SIGHUP)
+                return select(timeout)
+            daemon.running = False
+            return []
+
+        daemon.selector.select = select_once_after_sighup
+        saved = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            daemon.run()
+        finally:
+            for sig, handler in saved.items():
+                signal.signal(sig, handler)
+
+        daemon.reload_profile.assert_called_once_with()
+        assert daemon._wakeup_fds is None
+        assert signal.getsignal(signal.SIGHUP) == signal.SIG_DFL
+
     @patch("services.remap_daemon.daemon.signal")
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
-    def test_run_signal_handler(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_signal,
-        mock_profile,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_uinput,
-    ):
+    def test_run_signal_handler(self, mock_signal, daemon_deps, device_fd):
         """Test signal handler stops the daemon (lines 137-139, 141-142)."""
-        mock_loader_class.return_value = mock_profile_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_uinput_class.return_value = mock_uinput
-
         mock_device = MagicMock()
         mock_device.name = "Test Device"
-        mock_device.fileno.return_value = 5
-        mock_input_device_class.return_value = mock_device
+        mock_device.fileno.return_value = device_fd
+        daemon_deps.InputDevice.return_value = mock_device
 
         daemon = RemapDaemon()
         daemon.setup()
@@ -1083,20 +774,8 @@ class TestRunMethod:
         assert daemon.running is False
 
     @patch("services.remap_daemon.daemon.signal")
-    @patch("services.remap_daemon.daemon.UInput")
-    @patch("services.remap_daemon.daemon.InputDevice")
-    @patch("services.remap_daemon.daemon.ProfileLoader")
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
     def test_run_passthrough_unhandled_events(
-        self,
-        mock_registry_class,
-        mock_loader_class,
-        mock_input_device_class,
-        mock_uinput_class,
-        mock_signal,
-        mock_profile_loader,
-        mock_device_registry,
-        mock_uinput,
+        self, mock_signal, daemon_deps, mock_uinput, device_fd
     ):
         """Test run passes through unhandled events (lines 159-161)."""
         # Use profile with no bindings so events are unhandled
@@ -1107,17 +786,15 @@ class TestRunMethod:
             input_devices=["razer_mouse_001"],
             layers=[Layer(id="base", name="Base", bindings=[])],
         )
-        mock_loader_class.return_value = mock_loader
-        mock_registry_class.return_value = mock_device_registry
-        mock_uinput_class.return_value = mock_uinput
+        daemon_deps.ProfileLoader.return_value = mock_loader
 
         # Create mock device with an event that won't be handled
         rel_event = InputEvent(0, 0, ecodes.EV_REL, ecodes.REL_X, 10)
         mock_device = MagicMock()
         mock_device.name = "Test Device"
-        mock_device.fileno.return_value = 5
+        mock_device.fileno.return_value = device_fd
         mock_device.read.return_value = [rel_event]
-        mock_input_device_class.return_value = mock_device
+        daemon_deps.InputDevice.return_value = mock_device
 
         daemon = RemapDaemon()
         daemon.setup()
@@ -1138,16 +815,15 @@ class TestRunMethod:
         daemon.run()
 
         # Unhandled event should be passed through
-        mock_uinput.write_event.assert_called()
+        mock_uinput.write.assert_called_with(ecodes.EV_REL, ecodes.REL_X, 10)
 
 
 class TestMainFunction:
     """Tests for the main() entry point."""
 
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
     @patch("services.remap_daemon.daemon.logging")
     @patch("sys.argv", ["remap-daemon", "--list-devices"])
-    def test_main_list_devices(self, mock_logging, mock_registry_class, capsys):
+    def test_main_list_devices(self, mock_logging, daemon_deps, capsys):
         """Test main with --list-devices flag (lines 285-302)."""
         from services.remap_daemon.daemon import main
 
@@ -1160,7 +836,7 @@ class TestMainFunction:
 
         mock_registry = MagicMock()
         mock_registry.scan_devices.return_value = [mock_device]
-        mock_registry_class.return_value = mock_registry
+        daemon_deps.DeviceRegistry.return_value = mock_registry
 
         main()
 
@@ -1169,10 +845,9 @@ class TestMainFunction:
         assert "Razer Test Mouse" in captured.out
         assert "mouse" in captured.out
 
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
     @patch("services.remap_daemon.daemon.logging")
     @patch("sys.argv", ["remap-daemon", "--list-devices"])
-    def test_main_list_devices_keyboard(self, mock_logging, mock_registry_class, capsys):
+    def test_main_list_devices_keyboard(self, mock_logging, daemon_deps, capsys):
         """Test main with --list-devices shows keyboard type."""
         from services.remap_daemon.daemon import main
 
@@ -1185,17 +860,16 @@ class TestMainFunction:
 
         mock_registry = MagicMock()
         mock_registry.scan_devices.return_value = [mock_device]
-        mock_registry_class.return_value = mock_registry
+        daemon_deps.DeviceRegistry.return_value = mock_registry
 
         main()
 
         captured = capsys.readouterr()
         assert "keyboard" in captured.out
 
-    @patch("services.remap_daemon.daemon.DeviceRegistry")
     @patch("services.remap_daemon.daemon.logging")
     @patch("sys.argv", ["remap-daemon", "--list-devices"])
-    def test_main_list_devices_other_type(self, mock_logging, mock_registry_class, capsys):
+    def test_main_list_devices_other_type(self, mock_logging, daemon_deps, capsys):
         """Test main with --list-devices shows 'other' for unknown device type."""
         from services.remap_daemon.daemon import main
 
@@ -1208,7 +882,7 @@ class TestMainFunction:
 
         mock_registry = MagicMock()
         mock_registry.scan_devices.return_value = [mock_device]
-        mock_registry_class.return_value = mock_registry
+        daemon_deps.DeviceRegistry.return_value = mock_registry
 
         main()
 
@@ -8,9 +8,10 @@ import pytest
 # Set offscreen platform before any Qt imports
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
+pytest.importorskip("PySide6", reason="GUI tests need Qt")
+
 from PySide6.QtCore import QPointF, Qt
-from PySide6.QtGui import QColor, QKeyEvent, QMouseEvent
-from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QColor, QKeyEvent, QMouseEvent, QPaintEvent
 
 from apps.gui.widgets.device_visual import ButtonBindingDialog, DeviceVisualWidget
 from apps.gui.widgets.device_visual.button_binding_dialog import (
@@ -21,15 +22,6 @@ from apps.gui.widgets.device_visual.button_binding_dialog import (
 from crates.device_layouts.schema import ButtonShape, DeviceCategory, DeviceLayout, ShapeType
 
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 @pytest.fixture
 def sample_button():
     """Create a sample button for testing."""
@@ -1028,8 +1020,6 @@ class TestDeviceVisualWidgetPainting:
         widget.resize(200, 300)
 
         # Create a mock paint event
-        from PySide6.QtGui import QPaintEvent
-
         event = QPaintEvent(widget.rect())
         widget.paintEvent(event)  # Should return early
 
@@ -1039,8 +1029,6 @@ class TestDeviceVisualWidgetPainting:
         widget.resize(200, 300)
         widget.set_layout(sample_layout)
 
-        from PySide6.QtGui import QPaintEvent
-
         event = QPaintEvent(widget.rect())
         widget.paintEvent(event)
 
@@ -1050,8 +1038,6 @@ class TestDeviceVisualWidgetPainting:
         widget.resize(400, 200)  # Wide and short
         widget.set_layout(sample_layout)
 
-        from PySide6.QtGui import QPaintEvent
-
         event = QPaintEvent(widget.rect())
         widget.paintEvent(event)
 
@@ -1061,8 +1047,6 @@ class TestDeviceVisualWidgetPainting:
         widget.resize(200, 300)
         widget.set_layout(layout_no_outline)
 
-        from PySide6.QtGui import QPaintEvent
-
         event = QPaintEvent(widget.rect())
         widget.paintEvent(event)
 
@@ -1076,8 +1060,6 @@ class TestDeviceVisualWidgetPainting:
         widget._hovered_button = "left_click"
         widget._selected_button = "zone_logo"
 
-        from PySide6.QtGui import QPaintEvent
-
         event = QPaintEvent(widget.rect())
         widget.paintEvent(event)
 
@@ -1088,8 +1070,6 @@ class TestDeviceVisualWidgetPainting:
         widget.set_layout(sample_layout)
         widget.set_zone_color("zone_logo", QColor(128, 64, 255))
 
-        from PySide6.QtGui import QPaintEvent
-
         event = QPaintEvent(widget.rect())
         widget.paintEvent(event)
 
@@ -1117,8 +1097,6 @@ class TestDeviceVisualWidgetPainting:
         widget.resize(400, 400)
         widget.set_layout(layout)
 
-        from PySide6.QtGui import QPaintEvent
-
         event = QPaintEvent(widget.rect())
         widget.paintEvent(event)
 
@@ -1158,8 +1136,6 @@ class TestDeviceVisualWidgetPainting:
         widget.set_layout(layout)
         widget._selected_button = "physical_btn"  # Select the physical button
 
-        from PySide6.QtGui import QPaintEvent
-
         event = QPaintEvent(widget.rect())
         widget.paintEvent(event)
 
@@ -1187,8 +1163,6 @@ class TestDeviceVisualWidgetPainting:
         widget.resize(300, 300)  # Large widget to ensure button is big
         widget.set_layout(layout)
 
-        from PySide6.QtGui import QPaintEvent
-
         event = QPaintEvent(widget.rect())
         widget.paintEvent(event)
 
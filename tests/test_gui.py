@@ -1,6 +1,7 @@
 """Tests for GUI module imports and basic structure."""
 
 import ast
+import importlib
 import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -10,40 +11,37 @@ import pytest
 # Set offscreen platform before any Qt imports
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
+pytest.importorskip("PySide6", reason="GUI tests need Qt")
+
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QColor, QFocusEvent, QKeyEvent, QMouseEvent
+from PySide6.QtWidgets import QColorDialog, QDialog, QListWidgetItem, QMessageBox, QWidget
+
+_WIDGET_NAMES = (
+    "AppMatcherWidget",
+    "BatteryMonitorWidget",
+    "BindingEditorWidget",
+    "DeviceListWidget",
+    "DPIStageEditor",
+    "HotkeyEditorDialog",
+    "HotkeyEditorWidget",
+    "MacroEditorWidget",
+    "ProfilePanel",
+    "RazerControlsWidget",
+    "SetupWizard",
+    "ZoneEditorWidget",
+)
+
 
 class TestGUIImports:
     """Tests that GUI modules can be imported."""
 
     def test_widgets_init_imports(self):
         """Test that widgets __init__ exports the expected classes."""
-        from apps.gui.widgets import (
-            AppMatcherWidget,
-            BatteryMonitorWidget,
-            BindingEditorWidget,
-            DeviceListWidget,
-            DPIStageEditor,
-            HotkeyEditorDialog,
-            HotkeyEditorWidget,
-            MacroEditorWidget,
-            ProfilePanel,
-            RazerControlsWidget,
-            SetupWizard,
-            ZoneEditorWidget,
-        )
+        widgets = importlib.import_module("apps.gui.widgets")
 
-        # Verify these are classes
-        assert isinstance(AppMatcherWidget, type)
-        assert isinstance(BatteryMonitorWidget, type)
-        assert isinstance(BindingEditorWidget, type)
-        assert isinstance(DeviceListWidget, type)
-        assert isinstance(DPIStageEditor, type)
-        assert isinstance(HotkeyEditorDialog, type)
-        assert isinstance(HotkeyEditorWidget, type)
-        assert isinstance(MacroEditorWidget, type)
-        assert isinstance(ProfilePanel, type)
-        assert isinstance(RazerControlsWidget, type)
-        assert isinstance(SetupWizard, type)
-        assert isinstance(ZoneEditorWidget, type)
+        for name in _WIDGET_NAMES:
+            assert isinstance(getattr(widgets, name), type), name
 
     def test_main_window_import(self):
         """Test that MainWindow can be imported."""
@@ -66,16 +64,14 @@ class TestGUIMainGuard:
         source_path = Path(__file__).parent.parent / "apps" / "gui" / "main.py"
         tree = ast.parse(source_path.read_text())
 
-        has_main_guard = False
-        for node in ast.walk(tree):
-            if isinstance(node, ast.If):
-                if (
-                    isinstance(node.test, ast.Compare)
-                    and isinstance(node.test.left, ast.Name)
-                    and node.test.left.id == "__name__"
-                ):
-                    has_main_guard = True
-                    break
+        # A main guard is a module-level statement, so only the top level is checked
+        has_main_guard = any(
+            isinstance(node, ast.If)
+            and isinstance(node.test, ast.Compare)
+            and isinstance(node.test.left, ast.Name)
+            and node.test.left.id == "__name__"
+            for node in tree.body
+        )
 
         assert has_main_guard, "main guard not found in GUI main.py"
 
@@ -115,8 +111,6 @@ class TestGUIMainFunction:
             patch("apps.gui.main.sys.exit"),
             patch("apps.gui.widgets.setup_wizard.SetupWizard") as mock_wizard,
         ):
-            from PySide6.QtWidgets import QDialog
-
             # Setup: no profiles, wizard accepted
             mock_loader.return_value.list_profiles.return_value = []
             mock_wizard.return_value.exec.return_value = QDialog.DialogCode.Accepted
@@ -143,8 +137,6 @@ class TestGUIMainFunction:
             patch("apps.gui.main.sys.exit", side_effect=SystemExit(0)) as mock_exit,
             patch("apps.gui.widgets.setup_wizard.SetupWizard") as mock_wizard,
         ):
-            from PySide6.QtWidgets import QDialog
-
             # Setup: no profiles, wizard rejected
             mock_loader.return_value.list_profiles.return_value = []
             mock_wizard.return_value.exec.return_value = QDialog.DialogCode.Rejected
@@ -196,158 +188,86 @@ class TestGUIWidgetStructure:
     def test_binding_editor_structure(self):
         """Test binding_editor module structure."""
         # Verify it's a QWidget subclass
-        from PySide6.QtWidgets import QWidget
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
 
         assert issubclass(BindingEditorWidget, QWidget)
 
     def test_profile_panel_structure(self):
         """Test profile_panel module structure."""
-        from PySide6.QtWidgets import QWidget
-
         from apps.gui.widgets.profile_panel import ProfilePanel
 
         assert issubclass(ProfilePanel, QWidget)
 
     def test_setup_wizard_structure(self):
         """Test setup_wizard module structure."""
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.setup_wizard import SetupWizard
 
         assert issubclass(SetupWizard, QDialog)
 
 
-class TestWidgetInstantiation:
-    """Tests that widgets can be instantiated with mocked dependencies."""
+class _StubBridge:
+    """OpenRazer bridge with no devices, for widgets that only need to build."""
 
-    @pytest.fixture
-    def qapp(self):
-        """Create QApplication for widget tests."""
-        from PySide6.QtWidgets import QApplication
+    def discover_devices(self):
+        return []
 
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
 
-    @pytest.fixture
-    def mock_bridge(self):
-        """Mock OpenRazer bridge."""
-        bridge = MagicMock()
-        bridge.discover_devices.return_value = []
-        return bridge
+class _StubLoader:
+    """Profile loader with no profiles."""
 
-    @pytest.fixture
-    def mock_loader(self):
-        """Mock profile loader."""
-        loader = MagicMock()
-        loader.list_profiles.return_value = []
-        loader.get_active_profile.return_value = None
-        return loader
+    def list_profiles(self):
+        return []
 
-    def test_device_list_widget(self, qapp):
-        """Test DeviceListWidget instantiation."""
-        from apps.gui.widgets.device_list import DeviceListWidget
+    def get_active_profile_id(self):
+        return None
 
-        mock_registry = MagicMock()
-        mock_registry.scan_devices.return_value = []
-        widget = DeviceListWidget(registry=mock_registry)
-        assert widget is not None
-        widget.close()
 
-    def test_profile_panel_widget(self, qapp, mock_loader):
-        """Test ProfilePanel instantiation."""
-        from apps.gui.widgets.profile_panel import ProfilePanel
+class _StubRegistry:
+    """Device registry with no input devices."""
 
-        with patch("apps.gui.widgets.profile_panel.ProfileLoader", return_value=mock_loader):
-            widget = ProfilePanel()
-            assert widget is not None
-            widget.close()
+    def scan_devices(self):
+        return []
 
-    def test_hotkey_editor_widget(self, qapp):
-        """Test HotkeyEditorWidget instantiation."""
-        from apps.gui.widgets.hotkey_editor import HotkeyEditorWidget
 
-        widget = HotkeyEditorWidget()
-        assert widget is not None
-        widget.close()
+@pytest.fixture(scope="class")
+def widget_parent(qapp):
+    """Parent that owns instantiated widgets and disposes of them together."""
+    parent = QWidget()
+    yield parent
+    parent.deleteLater()
+    qapp.sendPostedEvents(None, QEvent.Type.DeferredDelete)
 
-    def test_battery_monitor_widget(self, qapp, mock_bridge):
-        """Test BatteryMonitorWidget instantiation."""
-        from apps.gui.widgets.battery_monitor import BatteryMonitorWidget
 
-        mock_bridge.discover_devices.return_value = []
-        widget = BatteryMonitorWidget(bridge=mock_bridge)
-        assert widget is not None
-        widget.close()
-
-    def test_dpi_stage_editor(self, qapp, mock_bridge):
-        """Test DPIStageEditor instantiation."""
-        from apps.gui.widgets.dpi_editor import DPIStageEditor
-
-        mock_bridge.get_dpi.return_value = (800, 800)
-        widget = DPIStageEditor(bridge=mock_bridge)
-        assert widget is not None
-        widget.close()
-
-    def test_zone_editor_widget(self, qapp, mock_bridge):
-        """Test ZoneEditorWidget instantiation."""
-        from apps.gui.widgets.zone_editor import ZoneEditorWidget
-
-        mock_bridge.discover_devices.return_value = []
-        widget = ZoneEditorWidget(bridge=mock_bridge)
-        assert widget is not None
-        widget.close()
-
-    def test_macro_editor_widget(self, qapp):
-        """Test MacroEditorWidget instantiation."""
-        from apps.gui.widgets.macro_editor import MacroEditorWidget
-
-        widget = MacroEditorWidget()
-        assert widget is not None
-        widget.close()
-
-    def test_binding_editor_widget(self, qapp):
-        """Test BindingEditorWidget instantiation."""
-        from apps.gui.widgets.binding_editor import BindingEditorWidget
-
-        widget = BindingEditorWidget()
-        assert widget is not None
-        widget.close()
-
-    def test_app_matcher_widget(self, qapp):
-        """Test AppMatcherWidget instantiation."""
-        from apps.gui.widgets.app_matcher import AppMatcherWidget
-
-        widget = AppMatcherWidget()
-        assert widget is not None
-        widget.close()
-
-    def test_razer_controls_widget(self, qapp, mock_bridge):
-        """Test RazerControlsWidget instantiation."""
-        from apps.gui.widgets.razer_controls import RazerControlsWidget
-
-        mock_bridge.discover_devices.return_value = []
-        widget = RazerControlsWidget(bridge=mock_bridge)
-        assert widget is not None
-        widget.close()
+class TestWidgetInstantiation:
+    """Tests that widgets can be instantiated with stubbed dependencies."""
+
+    @pytest.mark.parametrize(
+        ("module", "name", "kwargs"),
+        [
+            ("device_list", "DeviceListWidget", lambda: {"registry": _StubRegistry()}),
+            ("profile_panel", "ProfilePanel", dict),
+            ("hotkey_editor", "HotkeyEditorWidget", dict),
+            ("battery_monitor", "BatteryMonitorWidget", lambda: {"bridge": _StubBridge()}),
+            ("dpi_editor", "DPIStageEditor", lambda: {"bridge": _StubBridge()}),
+            ("zone_editor", "ZoneEditorWidget", lambda: {"bridge": _StubBridge()}),
+            ("macro_editor", "MacroEditorWidget", dict),
+            ("binding_editor", "BindingEditorWidget", dict),
+            ("app_matcher", "AppMatcherWidget", dict),
+            ("razer_controls", "RazerControlsWidget", lambda: {"bridge": _StubBridge()}),
+        ],
+    )
+    def test_widget_instantiates(self, widget_parent, module, name, kwargs):
+        """Test each widget builds under a parent with stubbed dependencies."""
+        widget_cls = getattr(importlib.import_module(f"apps.gui.widgets.{module}"), name)
+
+        with patch("apps.gui.widgets.profile_panel.ProfileLoader", return_value=_StubLoader()):
+            widget = widget_cls(**kwargs(), parent=widget_parent)
+        assert widget.parent() is widget_parent
 
 
 class TestThemeApplication:
     """Tests for theme application."""
 
-    @pytest.fixture
-    def qapp(self):
-        """Create QApplication for theme tests."""
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_apply_dark_theme(self, qapp):
         """Test applying dark theme to application."""
         from apps.gui.theme import apply_dark_theme
@@ -367,15 +287,6 @@ class TestThemeApplication:
 class TestHotkeyCapture:
     """Tests for HotkeyCapture widget."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_hotkey_capture_instantiation(self, qapp):
         """Test HotkeyCapture can be created."""
         from apps.gui.widgets.hotkey_editor import HotkeyCapture
@@ -413,9 +324,6 @@ class TestHotkeyCapture:
 
     def test_mouse_press_starts_capture(self, qapp):
         """Test clicking the widget starts capture mode."""
-        from PySide6.QtCore import QPointF, Qt
-        from PySide6.QtGui import QMouseEvent
-
         from apps.gui.widgets.hotkey_editor import HotkeyCapture
         from crates.profile_schema import HotkeyBinding
 
@@ -439,9 +347,6 @@ class TestHotkeyCapture:
 
     def test_focus_out_stops_capture(self, qapp):
         """Test focus loss stops capture mode."""
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QFocusEvent
-
         from apps.gui.widgets.hotkey_editor import HotkeyCapture
         from crates.profile_schema import HotkeyBinding
 
@@ -473,9 +378,6 @@ class TestHotkeyCapture:
         """Test pressing Escape cancels capture."""
         from unittest.mock import MagicMock
 
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QKeyEvent
-
         from apps.gui.widgets.hotkey_editor import HotkeyCapture
         from crates.profile_schema import HotkeyBinding
 
@@ -495,9 +397,6 @@ class TestHotkeyCapture:
         """Test pressing only modifiers keeps capturing."""
         from unittest.mock import MagicMock
 
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QKeyEvent
-
         from apps.gui.widgets.hotkey_editor import HotkeyCapture
         from crates.profile_schema import HotkeyBinding
 
@@ -517,9 +416,6 @@ class TestHotkeyCapture:
         """Test capturing F-key with modifiers."""
         from unittest.mock import MagicMock
 
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QKeyEvent
-
         from apps.gui.widgets.hotkey_editor import HotkeyCapture
         from crates.profile_schema import HotkeyBinding
 
@@ -542,9 +438,6 @@ class TestHotkeyCapture:
         """Test capturing number key with modifiers."""
         from unittest.mock import MagicMock
 
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QKeyEvent
-
         from apps.gui.widgets.hotkey_editor import HotkeyCapture
         from crates.profile_schema import HotkeyBinding
 
@@ -569,9 +462,6 @@ class TestHotkeyCapture:
         """Test capturing letter key with Alt modifier."""
         from unittest.mock import MagicMock
 
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QKeyEvent
-
         from apps.gui.widgets.hotkey_editor import HotkeyCapture
         from crates.profile_schema import HotkeyBinding
 
@@ -593,15 +483,6 @@ class TestHotkeyCapture:
 class TestHotkeyEditorWidget:
     """Tests for HotkeyEditorWidget methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_widget_instantiation(self, qapp):
         """Test HotkeyEditorWidget can be created."""
         from unittest.mock import patch
@@ -653,8 +534,6 @@ class TestHotkeyEditorWidget:
         """Test _on_enabled_changed updates binding."""
         from unittest.mock import patch
 
-        from PySide6.QtCore import Qt
-
         with (
             patch("apps.gui.widgets.hotkey_editor.SettingsManager"),
             patch("apps.gui.widgets.hotkey_editor.ProfileLoader") as MockLoader,
@@ -698,8 +577,6 @@ class TestHotkeyEditorWidget:
         """Test _on_hotkey_changed with duplicate binding."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QMessageBox
-
         from crates.profile_schema import HotkeyBinding
 
         with (
@@ -731,8 +608,6 @@ class TestHotkeyEditorWidget:
         """Test _reset_defaults when user confirms."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QMessageBox
-
         with (
             patch("apps.gui.widgets.hotkey_editor.SettingsManager") as MockSettings,
             patch("apps.gui.widgets.hotkey_editor.ProfileLoader") as MockLoader,
@@ -759,8 +634,6 @@ class TestHotkeyEditorWidget:
         """Test _reset_defaults when user cancels."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QMessageBox
-
         with (
             patch("apps.gui.widgets.hotkey_editor.SettingsManager") as MockSettings,
             patch("apps.gui.widgets.hotkey_editor.ProfileLoader") as MockLoader,
@@ -784,8 +657,6 @@ class TestHotkeyEditorWidget:
         """Test _save_settings success path."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QMessageBox
-
         from crates.profile_schema import HotkeyBinding
 
         with (
@@ -818,8 +689,6 @@ class TestHotkeyEditorWidget:
         """Test _save_settings failure path."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QMessageBox
-
         from crates.profile_schema import HotkeyBinding
 
         with (
@@ -849,15 +718,6 @@ class TestHotkeyEditorWidget:
 class TestHotkeyEditorDialog:
     """Tests for HotkeyEditorDialog."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_dialog_instantiation(self, qapp):
         """Test HotkeyEditorDialog can be created."""
         from unittest.mock import patch
@@ -879,15 +739,6 @@ class TestHotkeyEditorDialog:
 class TestDeviceListMethods:
     """Tests for DeviceListWidget methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_refresh_empty(self, qapp):
         """Test refresh with no devices."""
         from apps.gui.widgets.device_list import DeviceListWidget
@@ -1086,15 +937,6 @@ class TestDeviceListMethods:
 class TestMacroEditorMethods:
     """Tests for MacroEditorWidget methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_add_macro(self, qapp):
         """Test adding a new macro."""
         from apps.gui.widgets.macro_editor import MacroEditorWidget
@@ -1145,8 +987,6 @@ class TestMacroEditorMethods:
         """Test deleting a macro."""
         from unittest.mock import patch
 
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.macro_editor import MacroEditorWidget
         from crates.profile_schema import MacroAction
 
@@ -1239,8 +1079,6 @@ class TestMacroEditorMethods:
         """Test adding a step."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.macro_editor import MacroEditorWidget
         from crates.profile_schema import MacroAction, MacroStep, MacroStepType
 
@@ -1313,15 +1151,6 @@ class TestMacroEditorMethods:
 class TestStepEditorDialog:
     """Tests for StepEditorDialog."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_new_step_dialog(self, qapp):
         """Test creating a new step dialog."""
         from apps.gui.widgets.macro_editor import StepEditorDialog
@@ -1486,15 +1315,6 @@ class TestRecordingDialogFullCoverage:
         ):
             yield
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_evdev(self):
         """Mock evdev module for tests."""
@@ -1564,8 +1384,6 @@ class TestRecordingDialogFullCoverage:
 
     def test_recording_dialog_start_recording_no_device(self, qapp, mock_evdev):
         """Test start recording with no valid device."""
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.macro_editor import RecordingDialog
 
         dialog = RecordingDialog()
@@ -1607,8 +1425,6 @@ class TestRecordingDialogFullCoverage:
 
     def test_recording_dialog_on_error(self, qapp, mock_evdev):
         """Test handling recording error."""
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.macro_editor import RecordingDialog
 
         dialog = RecordingDialog()
@@ -1638,19 +1454,8 @@ class TestRecordingDialogFullCoverage:
 class TestMacroEditorExtendedCoverage:
     """Extended tests for MacroEditorWidget coverage."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_edit_step(self, qapp):
         """Test editing a step."""
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.macro_editor import MacroEditorWidget
         from crates.profile_schema import MacroAction, MacroStep, MacroStepType
 
@@ -1729,8 +1534,6 @@ class TestMacroEditorExtendedCoverage:
 
     def test_toggle_recording_start(self, qapp):
         """Test toggle recording starts recording."""
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.macro_editor import MacroEditorWidget
         from crates.profile_schema import MacroAction
 
@@ -1765,8 +1568,6 @@ class TestMacroEditorExtendedCoverage:
 
     def test_test_macro(self, qapp):
         """Test showing macro test dialog."""
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.macro_editor import MacroEditorWidget
         from crates.profile_schema import MacroAction, MacroStep, MacroStepType
 
@@ -1794,8 +1595,6 @@ class TestMacroEditorExtendedCoverage:
 
     def test_test_macro_no_steps(self, qapp):
         """Test test macro with no steps does nothing."""
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.macro_editor import MacroEditorWidget
         from crates.profile_schema import MacroAction
 
@@ -1810,8 +1609,6 @@ class TestMacroEditorExtendedCoverage:
 
     def test_test_macro_no_macro(self, qapp):
         """Test test macro with no macro selected does nothing."""
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.macro_editor import MacroEditorWidget
 
         widget = MacroEditorWidget()
@@ -1826,15 +1623,6 @@ class TestMacroEditorExtendedCoverage:
 class TestMacroEditorFinalCoverage:
     """Final coverage tests for MacroEditorWidget."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_step_editor_custom_key(self, qapp):
         """Test StepEditorDialog with custom key not in dropdown (line 359)."""
         from apps.gui.widgets.macro_editor import StepEditorDialog
@@ -1959,8 +1747,6 @@ class TestMacroEditorFinalCoverage:
 
     def test_start_recording_with_steps(self, qapp):
         """Test _start_recording dialog accept with steps (lines 751-757)."""
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.macro_editor import MacroEditorWidget
         from crates.profile_schema import MacroAction, MacroStep, MacroStepType
 
@@ -1990,8 +1776,6 @@ class TestMacroEditorFinalCoverage:
 
     def test_start_recording_empty_result(self, qapp):
         """Test _start_recording dialog accept with no steps (lines 761-763)."""
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.macro_editor import MacroEditorWidget
         from crates.profile_schema import MacroAction
 
@@ -2017,15 +1801,6 @@ class TestMacroEditorFinalCoverage:
 class TestRecordingDialogCoverage:
     """Coverage tests for RecordingDialog."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_evdev(self):
         """Mock evdev module."""
@@ -2107,15 +1882,6 @@ class TestRecordingDialogCoverage:
 class TestNewProfileDialog:
     """Tests for NewProfileDialog."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_dialog_instantiation(self, qapp):
         """Test NewProfileDialog can be created."""
         from apps.gui.widgets.profile_panel import NewProfileDialog
@@ -2152,15 +1918,6 @@ class TestNewProfileDialog:
 class TestProfilePanelMethods:
     """Tests for ProfilePanel methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_loader(self):
         loader = MagicMock()
@@ -2242,9 +1999,6 @@ class TestProfilePanelMethods:
 
     def test_on_profile_selected_valid_row(self, qapp):
         """Test _on_profile_selected with valid row enables buttons."""
-        from PySide6.QtCore import Qt
-        from PySide6.QtWidgets import QListWidgetItem
-
         from apps.gui.widgets.profile_panel import ProfilePanel
 
         widget = ProfilePanel()
@@ -2286,8 +2040,6 @@ class TestProfilePanelMethods:
         """Test creating a profile via dialog."""
         from unittest.mock import patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.profile_panel import ProfilePanel
         from crates.profile_schema import Profile
 
@@ -2318,8 +2070,6 @@ class TestProfilePanelMethods:
         """Test cancelling profile creation."""
         from unittest.mock import patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.profile_panel import ProfilePanel
 
         widget = ProfilePanel()
@@ -2340,9 +2090,6 @@ class TestProfilePanelMethods:
         """Test deleting a profile when confirmed."""
         from unittest.mock import patch
 
-        from PySide6.QtCore import Qt
-        from PySide6.QtWidgets import QListWidgetItem, QMessageBox
-
         from apps.gui.widgets.profile_panel import ProfilePanel
 
         widget = ProfilePanel()
@@ -2366,9 +2113,6 @@ class TestProfilePanelMethods:
         """Test cancelling profile deletion."""
         from unittest.mock import patch
 
-        from PySide6.QtCore import Qt
-        from PySide6.QtWidgets import QListWidgetItem, QMessageBox
-
         from apps.gui.widgets.profile_panel import ProfilePanel
 
         widget = ProfilePanel()
@@ -2432,9 +2176,6 @@ class TestProfilePanelMethods:
 
     def test_activate_profile_no_loader(self, qapp):
         """Test activate does nothing without loader."""
-        from PySide6.QtCore import Qt
-        from PySide6.QtWidgets import QListWidgetItem
-
         from apps.gui.widgets.profile_panel import ProfilePanel
 
         widget = ProfilePanel()
@@ -2451,15 +2192,6 @@ class TestProfilePanelMethods:
 class TestNewProfileDialogExtended:
     """Extended tests for NewProfileDialog."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_dialog_window_title(self, qapp):
         """Test NewProfileDialog has correct window title."""
         from apps.gui.widgets.profile_panel import NewProfileDialog
@@ -2511,15 +2243,6 @@ class TestNewProfileDialogExtended:
 class TestProfilePanelImportExport:
     """Tests for ProfilePanel import/export methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_import_profile_cancelled(self, qapp):
         """Test import does nothing when file dialog cancelled."""
         from unittest.mock import patch
@@ -2658,8 +2381,6 @@ class TestProfilePanelImportExport:
         import json
         from unittest.mock import patch
 
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.profile_panel import ProfilePanel
         from crates.profile_schema import Layer, Profile
 
@@ -2706,8 +2427,6 @@ class TestProfilePanelImportExport:
         import json
         from unittest.mock import patch
 
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.profile_panel import ProfilePanel
         from crates.profile_schema import Layer, Profile
 
@@ -3029,15 +2748,6 @@ class TestProfilePanelImportExport:
 class TestDPIStageItem:
     """Tests for DPIStageItem widget."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_stage_item_instantiation(self, qapp):
         """Test DPIStageItem can be created."""
         from apps.gui.widgets.dpi_editor import DPIStageItem
@@ -3080,15 +2790,6 @@ class TestDPIStageItem:
 class TestDPIStageEditorMethods:
     """Tests for DPIStageEditor methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_bridge(self):
         bridge = MagicMock()
@@ -3122,15 +2823,6 @@ class TestDPIStageEditorMethods:
 class TestDPIStageItemCoverage:
     """Extended coverage tests for DPIStageItem."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_slider_rounding(self, qapp):
         """Test slider value is rounded to nearest 100."""
         from apps.gui.widgets.dpi_editor import DPIStageItem
@@ -3183,15 +2875,6 @@ class TestDPIStageItemCoverage:
 class TestDPIStageEditorCoverage:
     """Extended coverage tests for DPIStageEditor."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_bridge(self):
         bridge = MagicMock()
@@ -3283,8 +2966,6 @@ class TestDPIStageEditorCoverage:
 
     def test_add_stage_max_reached(self, qapp, mock_bridge, mock_device):
         """Test adding stage at maximum shows message."""
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.dpi_editor import DPIStageEditor
 
         editor = DPIStageEditor(bridge=mock_bridge)
@@ -3327,8 +3008,6 @@ class TestDPIStageEditorCoverage:
 
     def test_remove_stage_last_one(self, qapp, mock_bridge, mock_device):
         """Test cannot remove the last stage."""
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.dpi_editor import DPIStageEditor
         from crates.profile_schema import DPIConfig
 
@@ -3405,8 +3084,6 @@ class TestDPIStageEditorCoverage:
 
     def test_apply_to_device_success(self, qapp, mock_bridge, mock_device):
         """Test applying DPI to device successfully."""
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.dpi_editor import DPIStageEditor
 
         editor = DPIStageEditor(bridge=mock_bridge)
@@ -3419,8 +3096,6 @@ class TestDPIStageEditorCoverage:
 
     def test_apply_to_device_failure(self, qapp, mock_bridge, mock_device):
         """Test applying DPI to device with failure."""
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.dpi_editor import DPIStageEditor
 
         mock_bridge.set_dpi.return_value = False
@@ -3462,15 +3137,6 @@ class TestDPIStageEditorCoverage:
 class TestBindingEditorMethods:
     """Tests for BindingEditorWidget methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_load_profile(self, qapp):
         """Test loading a profile."""
         from apps.gui.widgets.binding_editor import BindingEditorWidget
@@ -3711,15 +3377,6 @@ class TestBindingEditorMethods:
 class TestLayerDialog:
     """Tests for LayerDialog."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_new_layer_dialog(self, qapp):
         """Test creating a new layer dialog."""
         from apps.gui.widgets.binding_editor import LayerDialog
@@ -3778,15 +3435,6 @@ class TestLayerDialog:
 class TestBindingDialog:
     """Tests for BindingDialog."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_new_binding_dialog(self, qapp):
         """Test creating a new binding dialog."""
         from apps.gui.widgets.binding_editor import BindingDialog
@@ -3873,15 +3521,6 @@ class TestBindingDialog:
 class TestMacroDialog:
     """Tests for MacroDialog."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_new_macro_dialog(self, qapp):
         """Test creating a new macro dialog."""
         from apps.gui.widgets.binding_editor import MacroDialog
@@ -3983,15 +3622,6 @@ class TestMacroDialog:
 class TestBindingEditorInteractive:
     """Tests for BindingEditorWidget interactive methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def widget_with_profile(self, qapp):
         from apps.gui.widgets.binding_editor import BindingEditorWidget
@@ -4022,8 +3652,6 @@ class TestBindingEditorInteractive:
         """Test adding a layer."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         widget = widget_with_profile
         initial_layers = len(widget.current_profile.layers)
 
@@ -4045,8 +3673,6 @@ class TestBindingEditorInteractive:
         """Test cancelling add layer."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         widget = widget_with_profile
         initial_layers = len(widget.current_profile.layers)
 
@@ -4064,8 +3690,6 @@ class TestBindingEditorInteractive:
         """Test editing a layer."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.profile_schema import Layer, Profile
 
@@ -4099,8 +3723,6 @@ class TestBindingEditorInteractive:
         """Test deleting a layer when confirmed."""
         from unittest.mock import patch
 
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.profile_schema import Layer, Profile
 
@@ -4129,8 +3751,6 @@ class TestBindingEditorInteractive:
         """Test cancelling layer deletion."""
         from unittest.mock import patch
 
-        from PySide6.QtWidgets import QMessageBox
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.profile_schema import Layer, Profile
 
@@ -4157,8 +3777,6 @@ class TestBindingEditorInteractive:
         """Test adding a binding."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         from crates.profile_schema import ActionType, Binding
 
         widget = widget_with_profile
@@ -4196,8 +3814,6 @@ class TestBindingEditorInteractive:
         """Test adding a macro."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         from crates.profile_schema import MacroAction
 
         widget = widget_with_profile
@@ -4242,15 +3858,6 @@ class TestBindingEditorInteractive:
 class TestBindingEditorCoverage:
     """Additional tests for BindingEditorWidget coverage."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_layer_dialog_custom_modifier_text(self, qapp):
         """Test LayerDialog with custom modifier text (line 101)."""
         from apps.gui.widgets.binding_editor import LayerDialog
@@ -4480,8 +4087,6 @@ class TestBindingEditorCoverage:
         """Test _edit_binding from double-click (lines 689-691)."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.profile_schema import ActionType, Binding, Layer, Profile
 
@@ -4510,8 +4115,6 @@ class TestBindingEditorCoverage:
         """Test _edit_selected_binding (lines 695-699)."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.profile_schema import ActionType, Binding, Layer, Profile
 
@@ -4539,8 +4142,6 @@ class TestBindingEditorCoverage:
         """Test _edit_binding_dialog with accept (lines 703-716)."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.profile_schema import ActionType, Binding, Layer, Profile
 
@@ -4588,8 +4189,6 @@ class TestBindingEditorCoverage:
         """Test _edit_macro from double-click (lines 747-749)."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.profile_schema import Layer, MacroAction, Profile
 
@@ -4617,8 +4216,6 @@ class TestBindingEditorCoverage:
         """Test _edit_selected_macro (lines 753-757)."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.profile_schema import Layer, MacroAction, Profile
 
@@ -4645,8 +4242,6 @@ class TestBindingEditorCoverage:
         """Test _edit_macro_dialog with accept (lines 761-773)."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.profile_schema import Layer, MacroAction, Profile
 
@@ -4797,9 +4392,6 @@ class TestBindingEditorCoverage:
     def test_on_binding_selected_no_layout(self, qapp):
         """Test _on_binding_selected with no layout (line 658-663)."""
 
-        from PySide6.QtCore import Qt
-        from PySide6.QtWidgets import QListWidgetItem
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.profile_schema import ActionType, Binding
 
@@ -4815,9 +4407,6 @@ class TestBindingEditorCoverage:
     def test_on_binding_selected_with_matching_button(self, qapp):
         """Test _on_binding_selected with matching button in layout (line 660-663)."""
 
-        from PySide6.QtCore import Qt
-        from PySide6.QtWidgets import QListWidgetItem
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.device_layouts.schema import ButtonShape, DeviceCategory, DeviceLayout
         from crates.profile_schema import ActionType, Binding
@@ -4861,8 +4450,6 @@ class TestBindingEditorCoverage:
         """Test _add_binding_for_input dialog flow (line 674-687)."""
         from unittest.mock import MagicMock, patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
         from crates.profile_schema import ActionType, Binding, Layer, Profile
 
@@ -4889,9 +4476,6 @@ class TestBindingEditorCoverage:
 
     def test_on_binding_selected_item_no_binding(self, qapp):
         """Test _on_binding_selected with item that has no binding data (line 655)."""
-        from PySide6.QtCore import Qt
-        from PySide6.QtWidgets import QListWidgetItem
-
         from apps.gui.widgets.binding_editor import BindingEditorWidget
 
         widget = BindingEditorWidget()
@@ -4977,15 +4561,6 @@ class TestBindingEditorCoverage:
 class TestAppMatcherMethods:
     """Tests for AppMatcherWidget methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_load_profile(self, qapp):
         """Test loading a profile."""
         from apps.gui.widgets.app_matcher import AppMatcherWidget
@@ -5094,8 +4669,6 @@ class TestAppMatcherMethods:
         """Test adding a pattern successfully."""
         from unittest.mock import patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.app_matcher import AppMatcherWidget
         from crates.profile_schema import Layer, Profile
 
@@ -5128,8 +4701,6 @@ class TestAppMatcherMethods:
         """Test adding a duplicate pattern shows warning."""
         from unittest.mock import patch
 
-        from PySide6.QtWidgets import QDialog, QMessageBox
-
         from apps.gui.widgets.app_matcher import AppMatcherWidget
         from crates.profile_schema import Layer, Profile
 
@@ -5162,8 +4733,6 @@ class TestAppMatcherMethods:
         """Test cancelling add pattern dialog."""
         from unittest.mock import patch
 
-        from PySide6.QtWidgets import QDialog
-
         from apps.gui.widgets.app_matcher import AppMatcherWidget
         from crates.profile_schema import Layer, Profile
 
@@ -5358,15 +4927,6 @@ class TestAppMatcherMethods:
 class TestAddPatternDialog:
     """Tests for AddPatternDialog."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_dialog_instantiation(self, qapp):
         """Test AddPatternDialog can be created."""
         from apps.gui.widgets.app_matcher import AddPatternDialog
@@ -5402,15 +4962,6 @@ class TestAddPatternDialog:
 class TestZoneEditorMethods:
     """Tests for ZoneEditorWidget methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_bridge(self):
         bridge = MagicMock()
@@ -5491,15 +5042,6 @@ class TestZoneEditorMethods:
 class TestZoneColorButton:
     """Tests for ZoneColorButton."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_button_instantiation(self, qapp):
         """Test ZoneColorButton can be created."""
         from apps.gui.widgets.zone_editor import ZoneColorButton
@@ -5539,15 +5081,6 @@ class TestZoneColorButton:
 class TestZoneItem:
     """Tests for ZoneItem."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_zone_item_instantiation(self, qapp):
         """Test ZoneItem can be created."""
         from apps.gui.widgets.zone_editor import ZoneItem
@@ -5604,15 +5137,6 @@ class TestZoneItem:
 class TestZoneEditorCoverage:
     """Extended coverage tests for ZoneEditorWidget."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_bridge(self):
         bridge = MagicMock()
@@ -5700,9 +5224,6 @@ class TestZoneEditorCoverage:
 
     def test_fill_all_zones(self, qapp, mock_bridge, mock_matrix_device):
         """Test filling all zones with a color."""
-        from PySide6.QtGui import QColor
-        from PySide6.QtWidgets import QColorDialog
-
         from apps.gui.widgets.zone_editor import ZoneEditorWidget
 
         widget = ZoneEditorWidget(bridge=mock_bridge)
@@ -5719,9 +5240,6 @@ class TestZoneEditorCoverage:
 
     def test_fill_all_zones_cancel(self, qapp, mock_bridge, mock_matrix_device):
         """Test canceling fill dialog does nothing."""
-        from PySide6.QtGui import QColor
-        from PySide6.QtWidgets import QColorDialog
-
         from apps.gui.widgets.zone_editor import ZoneEditorWidget
 
         widget = ZoneEditorWidget(bridge=mock_bridge)
@@ -5802,15 +5320,6 @@ class TestZoneEditorCoverage:
 class TestZoneItemCoverage:
     """Extended coverage tests for ZoneItem."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_zone_item_color_changed_signal(self, qapp):
         """Test ZoneItem emits color_changed signal."""
         from apps.gui.widgets.zone_editor import ZoneItem
@@ -5838,20 +5347,8 @@ class TestZoneItemCoverage:
 class TestZoneColorButtonCoverage:
     """Extended coverage tests for ZoneColorButton."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_pick_color_accepted(self, qapp):
         """Test color picker when color is accepted."""
-        from PySide6.QtGui import QColor
-        from PySide6.QtWidgets import QColorDialog
-
         from apps.gui.widgets.zone_editor import ZoneColorButton
 
         btn = ZoneColorButton((100, 100, 100))
@@ -5870,9 +5367,6 @@ class TestZoneColorButtonCoverage:
 
     def test_pick_color_cancelled(self, qapp):
         """Test color picker when cancelled."""
-        from PySide6.QtGui import QColor
-        from PySide6.QtWidgets import QColorDialog
-
         from apps.gui.widgets.zone_editor import ZoneColorButton
 
         btn = ZoneColorButton((100, 100, 100))
@@ -5894,15 +5388,6 @@ class TestZoneColorButtonCoverage:
 class TestBatteryMonitorMethods:
     """Tests for BatteryMonitorWidget methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_bridge(self):
         bridge = MagicMock()
@@ -6038,15 +5523,6 @@ class TestBatteryMonitorMethods:
 class TestBatteryDeviceCard:
     """Tests for BatteryDeviceCard widget."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_device(self):
         device = MagicMock()
@@ -6135,15 +5611,6 @@ class TestBatteryDeviceCard:
 class TestSetupWizard:
     """Tests for SetupWizard dialog."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_wizard_instantiation(self, qapp):
         """Test SetupWizard can be created."""
         from apps.gui.widgets.setup_wizard import SetupWizard
@@ -6419,7 +5886,7 @@ class TestSetupWizard:
                 with patch("apps.gui.widgets.setup_wizard.subprocess.run") as mock_run:
                     mock_registry.return_value.get_razer_devices.return_value = []
                     mock_loader.return_value.list_profiles.return_value = []
-                    mock_loader.return_value.save_profile.return_value = True
+                    mock_loader.return_value.save_and_activate.return_value = True
                     wizard = SetupWizard()
 
                     wizard.name_input.setText("Test Profile")
@@ -6429,9 +5896,8 @@ class TestSetupWizard:
 
                     wizard._finish_setup()
 
-                    # Should have saved the profile
-                    mock_loader.return_value.save_profile.assert_called_once()
-                    mock_loader.return_value.set_active_profile.assert_called_once()
+                    # Should have saved and activated the profile
+                    mock_loader.return_value.save_and_activate.assert_called_once()
                     # Should have started daemon
                     assert mock_run.call_count >= 1
                     wizard.close()
@@ -6445,14 +5911,14 @@ class TestSetupWizard:
                 with patch("apps.gui.widgets.setup_wizard.subprocess.run"):
                     mock_registry.return_value.get_razer_devices.return_value = []
                     mock_loader.return_value.list_profiles.return_value = []
-                    mock_loader.return_value.save_profile.return_value = True
+                    mock_loader.return_value.save_and_activate.return_value = True
                     wizard = SetupWizard()
 
                     wizard.name_input.setText("")
                     wizard._finish_setup()
 
                     # Profile should be saved (with default name)
-                    mock_loader.return_value.save_profile.assert_called_once()
+                    mock_loader.return_value.save_and_activate.assert_called_once()
                     wizard.close()
 
     def test_wizard_go_next_from_device_page(self, qapp):
@@ -6607,15 +6073,6 @@ class TestMainWindowImport:
 class TestRazerControlsWidgetMethods:
     """Tests for RazerControlsWidget methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_bridge(self):
         bridge = MagicMock()
@@ -6654,15 +6111,6 @@ class TestRazerControlsWidgetMethods:
 class TestColorButtonMethods:
     """Tests for ColorButton methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     def test_get_color(self, qapp):
         """Test getting color value."""
         from apps.gui.widgets.razer_controls import ColorButton
@@ -6735,15 +6183,6 @@ class TestColorButtonMethods:
 class TestRazerControlsFullCoverage:
     """Extended tests for RazerControlsWidget coverage."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_bridge(self):
         bridge = MagicMock()
@@ -6864,6 +6303,29 @@ class TestRazerControlsFullCoverage:
         assert widget.brightness_label.text() == "75%"
         widget.close()
 
+    def test_on_brightness_changed_previews_on_device(self, qapp, mock_bridge, mock_device):
+        """Test slider drags queue a preview that the debounce timer flushes."""
+        from apps.gui.widgets.razer_controls import RazerControlsWidget
+
+        mock_device.has_brightness = True
+        mock_device.brightness = 50
+        mock_bridge.discover_devices.return_value = [mock_device]
+        mock_bridge.get_device.return_value = mock_device
+
+        widget = RazerControlsWidget(bridge=mock_bridge)
+        widget.refresh_devices()
+        mock_bridge.queue_brightness.assert_not_called()
+
+        for value in (60, 70, 80):
+            widget.brightness_slider.setValue(value)
+        mock_bridge.queue_brightness.assert_called_with("DA123456", 80)
+        assert widget._preview_timer.isActive()
+        mock_bridge.flush_pending.assert_not_called()
+
+        widget._preview_timer.timeout.emit()
+        mock_bridge.flush_pending.assert_called_once()
+        widget.close()
+
     def test_on_effect_changed_static(self, qapp, mock_bridge):
         """Test effect change enables color button for Static."""
         from apps.gui.widgets.razer_controls import RazerControlsWidget
@@ -7014,15 +6476,6 @@ class TestRazerControlsFullCoverage:
 class TestMainWindowMethods:
     """Tests for MainWindow methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_deps(self):
         """Mock all MainWindow dependencies."""
@@ -7097,15 +6550,6 @@ class TestMainWindowMethods:
 class TestMainWindowProfileHandling:
     """Tests for MainWindow profile handling."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_deps(self):
         """Mock all MainWindow dependencies."""
@@ -7189,15 +6633,6 @@ class TestMainWindowProfileHandling:
 class TestMainWindowDaemonControls:
     """Tests for MainWindow daemon control methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_deps(self):
         """Mock all MainWindow dependencies."""
@@ -7329,15 +6764,6 @@ class TestMainWindowDaemonControls:
 class TestMainWindowSignalHandlers:
     """Tests for MainWindow signal handlers."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_deps(self):
         """Mock all MainWindow dependencies."""
@@ -7466,15 +6892,6 @@ class TestMainWindowSignalHandlers:
 class TestMainWindowDialogs:
     """Tests for MainWindow dialog methods."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_deps(self):
         """Mock all MainWindow dependencies."""
@@ -7550,15 +6967,6 @@ class TestMainWindowDialogs:
 class TestMainWindowCoverage:
     """Additional tests for MainWindow coverage."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_deps(self):
         """Mock all MainWindow dependencies."""
@@ -7731,7 +7139,6 @@ class TestMainWindowCoverage:
 
         with patch("apps.gui.main_window.subprocess.run") as mock_run:
             mock_run.side_effect = subprocess.CalledProcessError(1, "systemctl")
-            from PySide6.QtWidgets import QMessageBox
 
             with patch.object(QMessageBox, "warning") as mock_warning:
                 window._start_daemon()
@@ -7746,7 +7153,6 @@ class TestMainWindowCoverage:
 
         with patch("apps.gui.main_window.subprocess.run") as mock_run:
             mock_run.side_effect = FileNotFoundError("systemctl not found")
-            from PySide6.QtWidgets import QMessageBox
 
             with patch.object(QMessageBox, "warning") as mock_warning:
                 window._start_daemon()
@@ -7763,7 +7169,6 @@ class TestMainWindowCoverage:
 
         with patch("apps.gui.main_window.subprocess.run") as mock_run:
             mock_run.side_effect = Exception("Test error")
-            from PySide6.QtWidgets import QMessageBox
 
             with patch.object(QMessageBox, "warning") as mock_warning:
                 window._stop_daemon()
@@ -7778,7 +7183,6 @@ class TestMainWindowCoverage:
 
         with patch("apps.gui.main_window.subprocess.run") as mock_run:
             mock_run.side_effect = Exception("Test error")
-            from PySide6.QtWidgets import QMessageBox
 
             with patch.object(QMessageBox, "warning") as mock_warning:
                 window._restart_daemon()
@@ -7821,7 +7225,6 @@ class TestMainWindowCoverage:
 
         with patch("apps.gui.main_window.subprocess.run") as mock_run:
             mock_run.side_effect = Exception("Test error")
-            from PySide6.QtWidgets import QMessageBox
 
             with patch.object(QMessageBox, "warning") as mock_warning:
                 window._enable_autostart()
@@ -7836,7 +7239,6 @@ class TestMainWindowCoverage:
 
         with patch("apps.gui.main_window.subprocess.run") as mock_run:
             mock_run.side_effect = Exception("Test error")
-            from PySide6.QtWidgets import QMessageBox
 
             with patch.object(QMessageBox, "warning") as mock_warning:
                 window._disable_autostart()
@@ -7847,15 +7249,6 @@ class TestMainWindowCoverage:
 class TestMainWindowDeviceVisual:
     """Tests for MainWindow device visual handlers."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication([])
-        yield app
-
     @pytest.fixture
     def mock_deps(self):
         """Mock all MainWindow dependencies."""
@@ -7908,8 +7301,6 @@ class TestMainWindowDeviceVisual:
 
     def test_on_device_zone_clicked_color_cancelled(self, qapp, mock_deps):
         """Test _on_device_zone_clicked when color dialog cancelled."""
-        from PySide6.QtWidgets import QColorDialog
-
         from apps.gui.main_window import MainWindow
 
         window = MainWindow()
@@ -7931,8 +7322,6 @@ class TestMainWindowDeviceVisual:
 
     def test_on_device_zone_clicked_color_success(self, qapp, mock_deps):
         """Test _on_device_zone_clicked with valid color."""
-        from PySide6.QtWidgets import QColorDialog
-
         from apps.gui.main_window import MainWindow
 
         window = MainWindow()
@@ -7960,8 +7349,6 @@ class TestMainWindowDeviceVisual:
 
     def test_on_device_zone_clicked_color_exception(self, qapp, mock_deps):
         """Test _on_device_zone_clicked handles device exception."""
-        from PySide6.QtWidgets import QColorDialog
-
         from apps.gui.main_window import MainWindow
 
         window = MainWindow()
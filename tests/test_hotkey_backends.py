@@ -1,9 +1,12 @@
 """Tests for hotkey backends."""
 
+import logging
 import os
+import threading
 from unittest.mock import MagicMock, patch
 
 from apps.tray.hotkey_backends import (
+    _MODIFIER_BITS,
     PortalGlobalShortcuts,
     X11Hotkeys,
     to_portal_format,
@@ -709,17 +712,31 @@ class TestX11Hotkeys:
         backend = X11Hotkeys(lambda x: None)
         from pynput.keyboard import KeyCode
 
+        backend._current_keys = {"ctrl"}
+        backend._mod_mask = _MODIFIER_BITS["ctrl"]
         key = KeyCode(char="a")
         backend._on_press(key)
         assert "a" in backend._current_keys
 
+    def test_on_press_skips_plain_keys_without_modifier(self):
+        """Plain keys with no modifier held should not be decoded."""
+        backend = X11Hotkeys(lambda x: None)
+
+        with patch.object(backend, "_normalize_key", return_value=None) as normalize:
+            key = MagicMock()
+            backend._on_press(key)
+
+        normalize.assert_called_once_with(key, chars=False)
+        assert backend._current_keys == set()
+
     def test_on_press_triggers_callback(self):
         """_on_press should trigger callback when shortcut matches."""
         callback = MagicMock()
         backend = X11Hotkeys(callback)
         binding = HotkeyBinding(modifiers=["ctrl"], key="a", enabled=True)
-        backend._shortcuts = [("profile_0", binding)]
+        backend.register_shortcuts([("profile_0", binding)])
         backend._current_keys = {"ctrl"}
+        backend._mod_mask = _MODIFIER_BITS["ctrl"]
 
         from pynput.keyboard import KeyCode
 
@@ -729,13 +746,106 @@ class TestX11Hotkeys:
         callback.assert_called_once_with("profile_0")
         assert "profile_0" in backend._triggered
 
+    def test_on_press_requires_exact_modifiers(self):
+        """_on_press should only match when the held modifiers are exactly the binding's."""
+        callback = MagicMock()
+        backend = X11Hotkeys(callback)
+        binding = HotkeyBinding(modifiers=["ctrl"], key="a", enabled=True)
+        backend.register_shortcuts([("profile_0", binding)])
+        backend._current_keys = {"ctrl", "alt"}
+        backend._mod_mask = _MODIFIER_BITS["ctrl"] | _MODIFIER_BITS["alt"]
+
+        with patch.object(backend, "_normalize_key", return_value="a"):
+            backend._on_press(MagicMock())
+
+        callback.assert_not_called()
+
+    def test_on_press_tracks_modifier_mask(self):
+        """Modifier presses should set their bit once and release should clear it."""
+        callback = MagicMock()
+        backend = X11Hotkeys(callback)
+        backend.register_shortcuts([("profile_0", HotkeyBinding(modifiers=["ctrl"], key="a"))])
+
+        with patch.object(backend, "_normalize_key", return_value="a"):
+            backend._on_press(MagicMock())
+        callback.assert_not_called()
+
+        with patch.object(backend, "_normalize_key", return_value="ctrl"):
+            backend._on_press(MagicMock())
+            backend._on_press(MagicMock())  # auto-repeat
+        assert backend._mod_mask == _MODIFIER_BITS["ctrl"]
+
+        with patch.object(backend, "_normalize_key", return_value="a"):
+            backend._on_press(MagicMock())
+        callback.assert_called_once_with("profile_0")
+
+        with patch.object(backend, "_normalize_key", return_value="ctrl"):
+            backend._on_release(MagicMock())
+        assert backend._mod_mask == 0
+
+    def test_unmapped_modifier_binding_never_fires(self):
+        """A binding with an unmapped modifier should not fire on any chord."""
+        callback = MagicMock()
+        backend = X11Hotkeys(callback)
+        backend.register_shortcuts(
+            [
+                ("profile_0", HotkeyBinding(modifiers=["super"], key="f1")),
+                ("profile_1", HotkeyBinding(modifiers=["ctrl", "hyper"], key="x")),
+            ]
+        )
+
+        def tap(*names):
+            for name in names:
+                with patch.object(backend, "_normalize_key", return_value=name):
+                    backend._on_press(MagicMock())
+            for name in reversed(names):
+                with patch.object(backend, "_normalize_key", return_value=name):
+                    backend._on_release(MagicMock())
+
+        tap("super", "f1")
+        tap("f1")
+        tap("ctrl", "x")
+        tap("ctrl", "hyper", "x")
+
+        callback.assert_not_called()
+        assert backend._mod_mask == 0
+        assert backend._current_keys == set()
+
+    def test_register_shortcuts_skips_disabled(self):
+        """Disabled or empty bindings should not be indexed."""
+        backend = X11Hotkeys(lambda x: None)
+        backend.register_shortcuts(
+            [
+                ("profile_0", HotkeyBinding(modifiers=["ctrl"], key="1", enabled=False)),
+                ("profile_1", HotkeyBinding(modifiers=["ctrl"], key="", enabled=True)),
+                ("profile_2", HotkeyBinding(modifiers=["ctrl", "shift"], key="3")),
+            ]
+        )
+        ctrl_shift = _MODIFIER_BITS["ctrl"] | _MODIFIER_BITS["shift"]
+        assert backend._binding_index == {(ctrl_shift, "3"): "profile_2"}
+
+    def test_register_shortcuts_skips_unknown_modifiers(self, caplog):
+        """Bindings with modifiers outside the mask table should be skipped, not weakened."""
+        backend = X11Hotkeys(lambda x: None)
+        with caplog.at_level(logging.WARNING, logger="apps.tray.hotkey_backends"):
+            backend.register_shortcuts(
+                [
+                    ("profile_0", HotkeyBinding(modifiers=["super"], key="f1")),
+                    ("profile_1", HotkeyBinding(modifiers=["ctrl", "hyper"], key="x")),
+                ]
+            )
+        assert backend._binding_index == {}
+        assert "profile_0" in caplog.text
+        assert "hyper" in caplog.text
+
     def test_on_press_no_double_trigger(self):
         """_on_press should not trigger same shortcut twice."""
         callback = MagicMock()
         backend = X11Hotkeys(callback)
         binding = HotkeyBinding(modifiers=["ctrl"], key="a", enabled=True)
-        backend._shortcuts = [("profile_0", binding)]
+        backend.register_shortcuts([("profile_0", binding)])
         backend._current_keys = {"ctrl"}
+        backend._mod_mask = _MODIFIER_BITS["ctrl"]
         backend._triggered = {"profile_0"}  # Already triggered
 
         from pynput.keyboard import KeyCode
@@ -762,7 +872,7 @@ class TestX11Hotkeys:
         """_on_release should clear triggered state for inactive shortcuts."""
         backend = X11Hotkeys(lambda x: None)
         binding = HotkeyBinding(modifiers=["ctrl"], key="a", enabled=True)
-        backend._shortcuts = [("profile_0", binding)]
+        backend.register_shortcuts([("profile_0", binding)])
         backend._current_keys = {"ctrl", "a"}
         backend._triggered = {"profile_0"}
 
@@ -819,7 +929,93 @@ class TestHotkeyListener:
             listener = HotkeyListener(callback)
 
             listener._on_shortcut_activated("profile_3")
-            callback.assert_called_once_with(3)
+            # Activation only queues the index; the worker runs the callback
+            callback.assert_not_called()
+            assert listener._switch_queue.get_nowait() == 3
+
+    def test_worker_dispatches_queued_switches(self):
+        """Started listener should run queued switches on its worker thread."""
+        with patch.dict(os.environ, {"XDG_SESSION_TYPE": "x11"}):
+            called = threading.Event()
+            seen = []
+
+            def callback(index):
+                seen.append((index, threading.current_thread().name))
+                called.set()
+
+            listener = HotkeyListener(callback)
+            with patch.object(listener._backend, "start"), patch.object(listener._backend, "stop"):
+                listener.start()
+                listener._on_shortcut_activated("profile_2")
+                assert called.wait(timeout=2.0)
+                listener.stop()
+
+            assert seen == [(2, "hotkey-dispatch")]
+            assert listener._worker is None
+
+    def test_worker_survives_callback_error(self):
+        """A failing switch callback should not kill the dispatch worker."""
+        with patch.dict(os.environ, {"XDG_SESSION_TYPE": "x11"}):
+            done = threading.Event()
+            calls = []
+
+            def callback(index):
+                calls.append(index)
+                if index == 0:
+                    raise RuntimeError("switch failed")
+                done.set()
+
+            listener = HotkeyListener(callback)
+            with patch.object(listener._backend, "start"), patch.object(listener._backend, "stop"):
+                listener.start()
+                listener._on_shortcut_activated("profile_0")
+                listener._on_shortcut_activated("profile_1")
+                assert done.wait(timeout=2.0)
+                listener.stop()
+
+            assert calls == [0, 1]
+
+    def test_restart_reuses_busy_worker(self, caplog):
+        """A worker still running a switch after stop() should be reused, not doubled."""
+        with patch.dict(os.environ, {"XDG_SESSION_TYPE": "x11"}):
+            entered = threading.Event()
+            release = threading.Event()
+            done = threading.Event()
+            calls = []
+
+            def callback(index):
+                calls.append(index)
+                if index == 0:
+                    entered.set()
+                    release.wait(timeout=2.0)
+                else:
+                    done.set()
+
+            listener = HotkeyListener(callback)
+            with patch.object(listener._backend, "start"), patch.object(listener._backend, "stop"):
+                listener.start()
+                worker = listener._worker
+                listener._on_shortcut_activated("profile_0")
+                assert entered.wait(timeout=2.0)
+
+                # Simulate the join timing out while the switch is still running
+                with patch.object(worker, "join"):
+                    with caplog.at_level(logging.WARNING, logger="apps.tray.hotkeys"):
+                        listener.stop()
+                assert "still busy" in caplog.text
+                assert listener._worker is worker
+
+                listener.start()
+                assert listener._worker is worker
+                release.set()
+                listener._on_shortcut_activated("profile_1")
+                assert done.wait(timeout=2.0)
+
+                listener.stop()
+
+            assert calls == [0, 1]
+            assert listener._worker is None
+            assert not worker.is_alive()
 
     def test_on_shortcut_activated_invalid(self):
         """Should handle invalid action IDs gracefully."""
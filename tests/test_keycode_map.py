@@ -6,6 +6,7 @@ from evdev import ecodes
 from crates.keycode_map import (
     EVDEV_TO_SCHEMA,
     KEY_CATEGORIES,
+    SCHEMA_TO_UINPUT,
     evdev_code_to_schema,
     evdev_event_to_schema,
     get_all_evdev_keys,
@@ -334,29 +335,25 @@ class TestEdgeCases:
         # Either shows suggestions or --list hint
         assert "Did you mean" in msg or "--list" in msg
 
-    def test_evdev_event_to_schema_list_code_name(self):
-        """Test evdev_event_to_schema when code_name is a list."""
-        from unittest.mock import patch
+    def test_returned_names_are_interned(self):
+        """Test schema names come back as interned strings."""
+        import sys
 
-        import crates.keycode_map.mapping as mapping_module
+        assert evdev_event_to_schema(ecodes.EV_KEY, ecodes.KEY_5) is sys.intern("5")
+        assert evdev_event_to_schema(ecodes.EV_KEY, ecodes.KEY_PROG1) is sys.intern("KEY_PROG1")
+        unmapped = "".join(["KEY_", "PROG2"])
+        assert evdev_code_to_schema(unmapped) is sys.intern("KEY_PROG2")
+
+    def test_evdev_event_to_schema_aliased_code(self):
+        """Test evdev_event_to_schema for codes evdev reports under several names."""
+        # evdev lists BTN_LEFT as (BTN_LEFT, BTN_MOUSE) and KEY_MUTE as
+        # (KEY_MIN_INTERESTING, KEY_MUTE); the mapped name must win
+        assert evdev_event_to_schema(ecodes.EV_KEY, ecodes.BTN_LEFT) == "MOUSE_LEFT"
+        assert evdev_event_to_schema(ecodes.EV_KEY, ecodes.KEY_MUTE) == "MUTE"
 
-        # Mock the ecodes module's BTN dict to return a list
-        original_btn = ecodes.BTN
-        try:
-            # Create a modified BTN dict that returns a list for BTN_LEFT
-            class MockBTN(dict):
-                def get(self, key, default=None):
-                    if key == ecodes.BTN_LEFT:
-                        return ["BTN_LEFT", "BTN_MOUSE"]
-                    return super().get(key, default)
-
-            mock_btn = MockBTN(original_btn)
-            with patch.object(mapping_module.ecodes, "BTN", mock_btn):
-                result = evdev_event_to_schema(ecodes.EV_KEY, ecodes.BTN_LEFT)
-                # Should extract first element and map to schema
-                assert result == "MOUSE_LEFT"
-        finally:
-            pass  # ecodes.BTN is restored by patch context manager
+    def test_evdev_event_to_schema_unmapped_code(self):
+        """Test evdev_event_to_schema falls back to the evdev name for unmapped keys."""
+        assert evdev_event_to_schema(ecodes.EV_KEY, ecodes.KEY_PROG1) == "KEY_PROG1"
 
     def test_evdev_event_to_schema_button_event(self):
         """Test evdev_event_to_schema with button codes."""
@@ -414,12 +411,35 @@ class TestEdgeCases:
         import crates.keycode_map.mapping as mapping_module
 
         # Mock SCHEMA_TO_UINPUT to not contain our test key
-        with patch.dict(mapping_module.SCHEMA_TO_UINPUT, clear=True):
+        schema_to_evdev_code.cache_clear()
+        with patch.dict(mapping_module._build_uinput_maps()[0], clear=True):
             # KEY_A should be findable via getattr(ecodes, evdev_name)
             # even when not in SCHEMA_TO_UINPUT
             code = schema_to_evdev_code("KEY_A")
             # Should still find it via getattr fallback
             assert code == ecodes.KEY_A
+        schema_to_evdev_code.cache_clear()
+
+    def test_schema_to_evdev_code_is_memoized(self):
+        """Test repeated schema_to_evdev_code lookups are served from the cache."""
+        schema_to_evdev_code.cache_clear()
+        assert schema_to_evdev_code("F13") == ecodes.KEY_F13
+        assert schema_to_evdev_code("F13") == ecodes.KEY_F13
+        info = schema_to_evdev_code.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_schema_to_uinput_is_lazy_mapping(self):
+        """Test SCHEMA_TO_UINPUT behaves like a read-only mapping over the built table."""
+        import crates.keycode_map.mapping as mapping_module
+
+        table = mapping_module._build_uinput_maps()[0]
+        assert SCHEMA_TO_UINPUT["A"] == ecodes.KEY_A
+        assert "MOUSE_LEFT" in SCHEMA_TO_UINPUT
+        assert len(SCHEMA_TO_UINPUT) == len(table)
+        assert dict(SCHEMA_TO_UINPUT) == table
+        with pytest.raises(TypeError):
+            SCHEMA_TO_UINPUT["A"] = 0  # type: ignore[index]
 
     def test_is_valid_key_schema_to_evdev_path(self):
         """Test is_valid_key hits SCHEMA_TO_EVDEV check."""
@@ -428,7 +448,7 @@ class TestEdgeCases:
         import crates.keycode_map.mapping as mapping_module
 
         # Create a scenario where key is in SCHEMA_TO_EVDEV but not SCHEMA_TO_UINPUT
-        with patch.dict(mapping_module.SCHEMA_TO_UINPUT, clear=True):
+        with patch.dict(mapping_module._build_uinput_maps()[0], clear=True):
             # CTRL should be in SCHEMA_TO_EVDEV still
             result = is_valid_key("CTRL")
             assert result is True
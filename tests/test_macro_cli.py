@@ -5,6 +5,7 @@ import json
 import tempfile
 from io import StringIO
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -27,17 +28,20 @@ from tools.macro_cli import (
 
 
 @pytest.fixture
-def temp_config():
+def temp_config(tmp_path):
     """Create a temporary config directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_dir = Path(tmpdir)
-        loader = ProfileLoader(config_dir=config_dir)
-        yield config_dir, loader
+    return tmp_path, ProfileLoader(config_dir=tmp_path)
 
 
 @pytest.fixture
+def macro_json(tmp_path):
+    """Path for a macro file that is cleaned up with tmp_path."""
+    return tmp_path / "macro.json"
+
+
+@pytest.fixture(scope="module")
 def sample_macro():
-    """Create a sample macro."""
+    """Create a sample macro, shared read-only by the module."""
     return MacroAction(
         id="test-macro",
         name="Test Macro",
@@ -75,38 +79,31 @@ class TestFindKeyboardDevice:
             result = find_keyboard_device()
             assert result is None
 
-    def test_find_keyboard_with_keyboard(self):
+    def test_find_keyboard_with_keyboard(self, monkeypatch):
         """Test finding keyboard device."""
-        mock_device = MagicMock()
-        mock_device.capabilities.return_value = {
-            1: [30, 44]  # EV_KEY with KEY_A (30) and KEY_Z (44)
-        }
+        device = SimpleNamespace(capabilities=lambda: {1: [30, 44]})  # EV_KEY: KEY_A, KEY_Z
 
-        with patch("tools.macro_cli.list_devices", return_value=["/dev/input/event0"]):
-            with patch("tools.macro_cli.InputDevice", return_value=mock_device):
-                with patch("tools.macro_cli.ecodes") as mock_ecodes:
-                    mock_ecodes.EV_KEY = 1
-                    mock_ecodes.KEY_A = 30
-                    mock_ecodes.KEY_Z = 44
-                    result = find_keyboard_device()
-                    assert result == "/dev/input/event0"
+        monkeypatch.setattr("tools.macro_cli.list_devices", lambda: ["/dev/input/event0"])
+        monkeypatch.setattr("tools.macro_cli.InputDevice", lambda path: device)
+        monkeypatch.setattr("tools.macro_cli.ecodes", SimpleNamespace(EV_KEY=1, KEY_A=30, KEY_Z=44))
+
+        assert find_keyboard_device() == "/dev/input/event0"
 
 
 class TestCmdList:
     """Tests for cmd_list command."""
 
-    def test_list_no_profile(self, temp_config):
+    def test_list_no_profile(self, temp_config, capsys):
         """Test listing when no active profile."""
         config_dir, _ = temp_config
         args = argparse.Namespace(config_dir=config_dir)
 
-        with patch("sys.stdout", new=StringIO()) as mock_out:
-            result = cmd_list(args)
+        result = cmd_list(args)
 
         assert result == 1
-        assert "No active profile" in mock_out.getvalue()
+        assert "No active profile" in capsys.readouterr().out
 
-    def test_list_no_macros(self, temp_config):
+    def test_list_no_macros(self, temp_config, capsys):
         """Test listing when profile has no macros."""
         config_dir, loader = temp_config
         profile = Profile(id="empty", name="Empty Profile", input_devices=[], macros=[])
@@ -115,22 +112,20 @@ class TestCmdList:
 
         args = argparse.Namespace(config_dir=config_dir)
 
-        with patch("sys.stdout", new=StringIO()) as mock_out:
-            result = cmd_list(args)
+        result = cmd_list(args)
 
         assert result == 0
-        assert "no macros defined" in mock_out.getvalue()
+        assert "no macros defined" in capsys.readouterr().out
 
-    def test_list_with_macros(self, temp_config, profile_with_macro):
+    def test_list_with_macros(self, temp_config, profile_with_macro, capsys):
         """Test listing macros."""
         config_dir, _ = temp_config
         args = argparse.Namespace(config_dir=config_dir)
 
-        with patch("sys.stdout", new=StringIO()) as mock_out:
-            result = cmd_list(args)
+        result = cmd_list(args)
 
         assert result == 0
-        output = mock_out.getvalue()
+        output = capsys.readouterr().out
         assert "test-macro" in output
         assert "Test Macro" in output
         assert "1 macro(s) found" in output
@@ -139,38 +134,35 @@ class TestCmdList:
 class TestCmdShow:
     """Tests for cmd_show command."""
 
-    def test_show_no_profile(self, temp_config):
+    def test_show_no_profile(self, temp_config, capsys):
         """Test showing when no active profile."""
         config_dir, _ = temp_config
         args = argparse.Namespace(config_dir=config_dir, macro_id="test")
 
-        with patch("sys.stdout", new=StringIO()) as mock_out:
-            result = cmd_show(args)
+        result = cmd_show(args)
 
         assert result == 1
-        assert "No active profile" in mock_out.getvalue()
+        assert "No active profile" in capsys.readouterr().out
 
-    def test_show_macro_not_found(self, temp_config, profile_with_macro):
+    def test_show_macro_not_found(self, temp_config, profile_with_macro, capsys):
         """Test showing macro that doesn't exist."""
         config_dir, _ = temp_config
         args = argparse.Namespace(config_dir=config_dir, macro_id="nonexistent")
 
-        with patch("sys.stdout", new=StringIO()) as mock_out:
-            result = cmd_show(args)
+        result = cmd_show(args)
 
         assert result == 1
-        assert "not found" in mock_out.getvalue()
+        assert "not found" in capsys.readouterr().out
 
-    def test_show_macro(self, temp_config, profile_with_macro):
+    def test_show_macro(self, temp_config, profile_with_macro, capsys):
         """Test showing macro details."""
         config_dir, _ = temp_config
         args = argparse.Namespace(config_dir=config_dir, macro_id="test-macro")
 
-        with patch("sys.stdout", new=StringIO()) as mock_out:
-            result = cmd_show(args)
+        result = cmd_show(args)
 
         assert result == 0
-        output = mock_out.getvalue()
+        output = capsys.readouterr().out
         assert "Test Macro" in output
         assert "test-macro" in output
         assert "Repeat: 2x" in output
@@ -180,45 +172,40 @@ class TestCmdShow:
 class TestCmdAdd:
     """Tests for cmd_add command."""
 
-    def test_add_no_profile(self, temp_config):
+    def test_add_no_profile(self, temp_config, capsys):
         """Test adding when no active profile."""
         config_dir, _ = temp_config
         args = argparse.Namespace(config_dir=config_dir, file="test.json", force=False)
 
-        with patch("sys.stdout", new=StringIO()) as mock_out:
-            result = cmd_add(args)
+        result = cmd_add(args)
 
         assert result == 1
-        assert "No active profile" in mock_out.getvalue()
+        assert "No active profile" in capsys.readouterr().out
 
-    def test_add_file_not_found(self, temp_config, profile_with_macro):
+    def test_add_file_not_found(self, temp_config, profile_with_macro, capsys):
         """Test adding when file doesn't exist."""
         config_dir, _ = temp_config
         args = argparse.Namespace(config_dir=config_dir, file="/nonexistent.json", force=False)
 
-        with patch("sys.stdout", new=StringIO()) as mock_out:
-            result = cmd_add(args)
+        result = cmd_add(args)
 
         assert result == 1
-        assert "File not found" in mock_out.getvalue()
+        assert "File not found" in capsys.readouterr().out
 
-    def test_add_invalid_json(self, temp_config, profile_with_macro):
+    def test_add_invalid_json(self, temp_config, profile_with_macro, macro_json, capsys):
         """Test adding with invalid JSON file."""
         config_dir, _ = temp_config
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("not valid json")
-            f.flush()
+        macro_json.write_text("not valid json")
 
-            args = argparse.Namespace(config_dir=config_dir, file=f.name, force=False)
+        args = argparse.Namespace(config_dir=config_dir, file=str(macro_json), force=False)
 
-            with patch("sys.stdout", new=StringIO()) as mock_out:
-                result = cmd_add(args)
+        result = cmd_add(args)
 
-            assert result == 1
-            assert "Invalid macro file" in mock_out.getvalue()
+        assert result == 1
+        assert "Invalid macro file" in capsys.readouterr().out
 
-    def test_add_macro(self, temp_config):
+    def test_add_macro(self, temp_config, macro_json, capsys):
         """Test adding a macro."""
         config_dir, loader = temp_config
 
@@ -234,24 +221,21 @@ class TestCmdAdd:
             "steps": [{"type": "key_press", "key": "X"}],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(macro_data, f)
-            f.flush()
+        macro_json.write_text(json.dumps(macro_data))
 
-            args = argparse.Namespace(config_dir=config_dir, file=f.name, force=False)
+        args = argparse.Namespace(config_dir=config_dir, file=str(macro_json), force=False)
 
-            with patch("sys.stdout", new=StringIO()) as mock_out:
-                result = cmd_add(args)
+        result = cmd_add(args)
 
-            assert result == 0
-            assert "Added macro 'new-macro'" in mock_out.getvalue()
+        assert result == 0
+        assert "Added macro 'new-macro'" in capsys.readouterr().out
 
         # Verify macro was added
         updated = loader.load_profile("test")
         assert len(updated.macros) == 1
         assert updated.macros[0].id == "new-macro"
 
-    def test_add_duplicate_no_force(self, temp_config, profile_with_macro):
+    def test_add_duplicate_no_force(self, temp_config, profile_with_macro, macro_json, capsys):
         """Test adding duplicate macro without force."""
         config_dir, _ = temp_config
 
@@ -261,19 +245,16 @@ class TestCmdAdd:
             "steps": [{"type": "key_press", "key": "X"}],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(macro_data, f)
-            f.flush()
+        macro_json.write_text(json.dumps(macro_data))
 
-            args = argparse.Namespace(config_dir=config_dir, file=f.name, force=False)
+        args = argparse.Namespace(config_dir=config_dir, file=str(macro_json), force=False)
 
-            with patch("sys.stdout", new=StringIO()) as mock_out:
-                result = cmd_add(args)
+        result = cmd_add(args)
 
-            assert result == 1
-            assert "already exists" in mock_out.getvalue()
+        assert result == 1
+        assert "already exists" in capsys.readouterr().out
 
-    def test_add_duplicate_with_force(self, temp_config, profile_with_macro):
+    def test_add_duplicate_with_force(self, temp_config, profile_with_macro, macro_json, capsys):
         """Test adding duplicate macro with force."""
         config_dir, loader = temp_config
 
@@ -283,17 +264,14 @@ class TestCmdAdd:
             "steps": [{"type": "key_press", "key": "X"}],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(macro_data, f)
-            f.flush()
+        macro_json.write_text(json.dumps(macro_data))
 
-            args = argparse.Namespace(config_dir=config_dir, file=f.name, force=True)
+        args = argparse.Namespace(config_dir=config_dir, file=str(macro_json), force=True)
 
-            with patch("sys.stdout", new=StringIO()) as mock_out:
-                result = cmd_add(args)
+        result = cmd_add(args)
 
-            assert result == 0
-            assert "Added macro" in mock_out.getvalue()
+        assert result == 0
+        assert "Added macro" in capsys.readouterr().out
 
         # Verify macro was replaced
         updated = loader.load_profile("macro-profile")
@@ -304,38 +282,35 @@ class TestCmdAdd:
 class TestCmdRemove:
     """Tests for cmd_remove command."""
 
-    def test_remove_no_profile(self, temp_config):
+    def test_remove_no_profile(self, temp_config, capsys):
         """Test removing when no active profile."""
         config_dir, _ = temp_config
         args = argparse.Namespace(config_dir=config_dir, macro_id="test")
 
-        with patch("sys.stdout", new=StringIO()) as mock_out:
-            result = cmd_remove(args)
+        result = cmd_remove(args)
 
         assert result == 1
-        assert "No active profile" in mock_out.getvalue()
+        assert "No active profile" in capsys.readouterr().out
 
-    def test_remove_not_found(self, temp_config, profile_with_macro):
+    def test_remove_not_found(self, temp_config, profile_with_macro, capsys):
         """Test removing macro that doesn't exist."""
         config_dir, _ = temp_config
         args = argparse.Namespace(config_dir=config_dir, macro_id="nonexistent")
 
-        with patch("sys.stdout", new=StringIO()) as mock_out:
-            result = cmd_remove(args)
+        result = cmd_remove(args)
 
         assert result == 1
-        assert "not found" in mock_out.getvalue()
+        assert "not found" in capsys.readouterr().out
 
-    def test_remove_macro(self, temp_config, profile_with_macro):
+    def test_remove_macro(self, temp_config, profile_with_macro, capsys):
         """Test removing a macro."""
         config_dir, loader = temp_config
         args = argparse.Namespace(config_dir=config_dir, macro_id="test-macro")
 
-        with patch("sys.stdout", new=StringIO()) as mock_out:
-            result = cmd_remove(args)
+        result = cmd_remove(args)
 
         assert result == 0
-        assert "Removed macro 'test-macro'" in mock_out.getvalue()
+        assert "Removed macro 'test-macro'" in capsys.readouterr().out
 
         # Verify macro was removed
         updated = loader.load_profile("macro-profile")
@@ -634,19 +609,17 @@ class TestCmdPlay:
         assert result == 1
         assert "File not found" in mock_out.getvalue()
 
-    def test_play_invalid_json(self):
+    def test_play_invalid_json(self, macro_json):
         """Test play with invalid JSON file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("not valid json")
-            f.flush()
+        macro_json.write_text("not valid json")
 
-            args = argparse.Namespace(file=f.name)
-            with patch("sys.stdout", new=StringIO()) as mock_out:
-                result = cmd_play(args)
-            assert result == 1
-            assert "Invalid macro file" in mock_out.getvalue()
+        args = argparse.Namespace(file=str(macro_json))
+        with patch("sys.stdout", new=StringIO()) as mock_out:
+            result = cmd_play(args)
+        assert result == 1
+        assert "Invalid macro file" in mock_out.getvalue()
 
-    def test_play_success(self):
+    def test_play_success(self, macro_json):
         """Test successful macro playback."""
         macro_data = {
             "id": "test",
@@ -655,24 +628,22 @@ class TestCmdPlay:
             "repeat_count": 1,
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(macro_data, f)
-            f.flush()
+        macro_json.write_text(json.dumps(macro_data))
 
-            mock_player = MagicMock()
-            mock_player.play.return_value = True
+        mock_player = MagicMock()
+        mock_player.play.return_value = True
 
-            args = argparse.Namespace(file=f.name, speed=1.0, yes=True, verbose=False)
+        args = argparse.Namespace(file=str(macro_json), speed=1.0, yes=True, verbose=False)
 
-            with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
-                with patch("sys.stdout", new=StringIO()) as mock_out:
-                    result = cmd_play(args)
+        with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
+            with patch("sys.stdout", new=StringIO()) as mock_out:
+                result = cmd_play(args)
 
-            assert result == 0
-            assert "Done" in mock_out.getvalue()
-            mock_player.close.assert_called_once()
+        assert result == 0
+        assert "Done" in mock_out.getvalue()
+        mock_player.close.assert_called_once()
 
-    def test_play_cancelled(self):
+    def test_play_cancelled(self, macro_json):
         """Test macro playback cancelled."""
         macro_data = {
             "id": "test",
@@ -680,23 +651,21 @@ class TestCmdPlay:
             "steps": [{"type": "key_press", "key": "A"}],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(macro_data, f)
-            f.flush()
+        macro_json.write_text(json.dumps(macro_data))
 
-            mock_player = MagicMock()
-            mock_player.play.return_value = False
+        mock_player = MagicMock()
+        mock_player.play.return_value = False
 
-            args = argparse.Namespace(file=f.name, speed=1.0, yes=True, verbose=False)
+        args = argparse.Namespace(file=str(macro_json), speed=1.0, yes=True, verbose=False)
 
-            with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
-                with patch("sys.stdout", new=StringIO()) as mock_out:
-                    result = cmd_play(args)
+        with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
+            with patch("sys.stdout", new=StringIO()) as mock_out:
+                result = cmd_play(args)
 
-            assert result == 1
-            assert "Cancelled" in mock_out.getvalue()
+        assert result == 1
+        assert "Cancelled" in mock_out.getvalue()
 
-    def test_play_with_speed(self):
+    def test_play_with_speed(self, macro_json):
         """Test playback with speed modifier."""
         macro_data = {
             "id": "test",
@@ -704,23 +673,21 @@ class TestCmdPlay:
             "steps": [{"type": "key_press", "key": "A"}],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(macro_data, f)
-            f.flush()
+        macro_json.write_text(json.dumps(macro_data))
 
-            mock_player = MagicMock()
-            mock_player.play.return_value = True
+        mock_player = MagicMock()
+        mock_player.play.return_value = True
 
-            args = argparse.Namespace(file=f.name, speed=2.0, yes=True, verbose=False)
+        args = argparse.Namespace(file=str(macro_json), speed=2.0, yes=True, verbose=False)
 
-            with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
-                with patch("sys.stdout", new=StringIO()) as mock_out:
-                    result = cmd_play(args)
+        with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
+            with patch("sys.stdout", new=StringIO()) as mock_out:
+                result = cmd_play(args)
 
-            assert result == 0
-            assert "Speed: 2.0x" in mock_out.getvalue()
+        assert result == 0
+        assert "Speed: 2.0x" in mock_out.getvalue()
 
-    def test_play_keyboard_interrupt(self):
+    def test_play_keyboard_interrupt(self, macro_json):
         """Test playback interrupted by user."""
         macro_data = {
             "id": "test",
@@ -728,23 +695,21 @@ class TestCmdPlay:
             "steps": [{"type": "key_press", "key": "A"}],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(macro_data, f)
-            f.flush()
+        macro_json.write_text(json.dumps(macro_data))
 
-            mock_player = MagicMock()
-            mock_player.play.side_effect = KeyboardInterrupt()
+        mock_player = MagicMock()
+        mock_player.play.side_effect = KeyboardInterrupt()
 
-            args = argparse.Namespace(file=f.name, speed=1.0, yes=True, verbose=False)
+        args = argparse.Namespace(file=str(macro_json), speed=1.0, yes=True, verbose=False)
 
-            with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
-                with patch("sys.stdout", new=StringIO()):
-                    result = cmd_play(args)
+        with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
+            with patch("sys.stdout", new=StringIO()):
+                result = cmd_play(args)
 
-            assert result == 1
-            mock_player.cancel.assert_called_once()
+        assert result == 1
+        mock_player.cancel.assert_called_once()
 
-    def test_play_confirmation_cancelled(self):
+    def test_play_confirmation_cancelled(self, macro_json):
         """Test playback cancelled at confirmation."""
         macro_data = {
             "id": "test",
@@ -752,20 +717,18 @@ class TestCmdPlay:
             "steps": [{"type": "key_press", "key": "A"}],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(macro_data, f)
-            f.flush()
+        macro_json.write_text(json.dumps(macro_data))
 
-            args = argparse.Namespace(file=f.name, speed=1.0, yes=False, verbose=False)
+        args = argparse.Namespace(file=str(macro_json), speed=1.0, yes=False, verbose=False)
 
-            with patch("builtins.input", side_effect=KeyboardInterrupt()):
-                with patch("sys.stdout", new=StringIO()) as mock_out:
-                    result = cmd_play(args)
+        with patch("builtins.input", side_effect=KeyboardInterrupt()):
+            with patch("sys.stdout", new=StringIO()) as mock_out:
+                result = cmd_play(args)
 
-            assert result == 0
-            assert "Cancelled" in mock_out.getvalue()
+        assert result == 0
+        assert "Cancelled" in mock_out.getvalue()
 
-    def test_play_with_verbose(self):
+    def test_play_with_verbose(self, macro_json):
         """Test playback with verbose output."""
         macro_data = {
             "id": "test",
@@ -773,28 +736,26 @@ class TestCmdPlay:
             "steps": [{"type": "key_press", "key": "A"}],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(macro_data, f)
-            f.flush()
+        macro_json.write_text(json.dumps(macro_data))
 
-            mock_player = MagicMock()
-            mock_player.play.return_value = True
+        mock_player = MagicMock()
+        mock_player.play.return_value = True
 
-            args = argparse.Namespace(file=f.name, speed=1.0, yes=True, verbose=True)
+        args = argparse.Namespace(file=str(macro_json), speed=1.0, yes=True, verbose=True)
 
-            with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
-                with patch("sys.stdout", new=StringIO()):
-                    result = cmd_play(args)
+        with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
+            with patch("sys.stdout", new=StringIO()):
+                result = cmd_play(args)
 
-            assert result == 0
-            # Verify callback was set
-            mock_player.set_step_callback.assert_called_once()
+        assert result == 0
+        # Verify callback was set
+        mock_player.set_step_callback.assert_called_once()
 
 
 class TestCmdAddSaveFailure:
     """Tests for cmd_add save failure (lines 302-303)."""
 
-    def test_add_save_failure(self, temp_config):
+    def test_add_save_failure(self, temp_config, macro_json):
         """Test adding when save fails."""
         config_dir, loader = temp_config
 
@@ -804,19 +765,17 @@ class TestCmdAddSaveFailure:
 
         macro_data = {"id": "new", "name": "New", "steps": [{"type": "key_press", "key": "X"}]}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(macro_data, f)
-            f.flush()
+        macro_json.write_text(json.dumps(macro_data))
 
-            args = argparse.Namespace(config_dir=config_dir, file=f.name, force=False)
+        args = argparse.Namespace(config_dir=config_dir, file=str(macro_json), force=False)
 
-            with patch.object(loader, "save_profile", return_value=False):
-                with patch("tools.macro_cli.ProfileLoader", return_value=loader):
-                    with patch("sys.stdout", new=StringIO()) as mock_out:
-                        result = cmd_add(args)
+        with patch.object(loader, "save_profile", return_value=False):
+            with patch("tools.macro_cli.ProfileLoader", return_value=loader):
+                with patch("sys.stdout", new=StringIO()) as mock_out:
+                    result = cmd_add(args)
 
-            assert result == 1
-            assert "Failed to save profile" in mock_out.getvalue()
+        assert result == 1
+        assert "Failed to save profile" in mock_out.getvalue()
 
 
 class TestCmdRemoveSaveFailure:
@@ -1273,7 +1232,7 @@ class TestFormatStepFallback:
 class TestCmdPlayVerboseCallback:
     """Test verbose callback is actually invoked during play."""
 
-    def test_play_verbose_callback_invoked(self):
+    def test_play_verbose_callback_invoked(self, macro_json):
         """Test verbose callback prints step info when invoked."""
         macro_data = {
             "id": "test",
@@ -1281,32 +1240,30 @@ class TestCmdPlayVerboseCallback:
             "steps": [{"type": "key_press", "key": "A"}],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(macro_data, f)
-            f.flush()
+        macro_json.write_text(json.dumps(macro_data))
 
-            captured_callback = None
+        captured_callback = None
 
-            def capture_callback(cb):
-                nonlocal captured_callback
-                captured_callback = cb
+        def capture_callback(cb):
+            nonlocal captured_callback
+            captured_callback = cb
 
-            mock_player = MagicMock()
-            mock_player.play.return_value = True
-            mock_player.set_step_callback.side_effect = capture_callback
+        mock_player = MagicMock()
+        mock_player.play.return_value = True
+        mock_player.set_step_callback.side_effect = capture_callback
 
-            args = argparse.Namespace(file=f.name, speed=1.0, yes=True, verbose=True)
+        args = argparse.Namespace(file=str(macro_json), speed=1.0, yes=True, verbose=True)
 
-            with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
-                with patch("sys.stdout", new=StringIO()):
-                    result = cmd_play(args)
+        with patch("tools.macro_cli.MacroPlayer", return_value=mock_player):
+            with patch("sys.stdout", new=StringIO()):
+                result = cmd_play(args)
 
-                    # Now invoke the callback to test lines 186-187
-                    if captured_callback:
-                        step = MacroStep(type=MacroStepType.KEY_PRESS, key="A")
-                        captured_callback(step, 0)
+                # Now invoke the callback to test lines 186-187
+                if captured_callback:
+                    step = MacroStep(type=MacroStepType.KEY_PRESS, key="A")
+                    captured_callback(step, 0)
 
-            assert result == 0
+        assert result == 0
 
 
 class TestMain:
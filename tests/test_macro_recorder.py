@@ -18,8 +18,26 @@ from services.macro_engine.recorder import (
 
 def make_key_event(code: int, value: int, timestamp: float = 0) -> InputEvent:
     """Create a key event."""
-    event = InputEvent(int(timestamp), int((timestamp % 1) * 1000000), ecodes.EV_KEY, code, value)
-    return event
+    sec = int(timestamp)
+    return InputEvent(sec, round((timestamp - sec) * 1_000_000), ecodes.EV_KEY, code, value)
+
+
+def idle_select(rlist, wlist, xlist, timeout):
+    """select.select stand-in for a device with no pending input."""
+    time.sleep(timeout)
+    return [], [], []
+
+
+@pytest.fixture
+def mock_select():
+    """Patch the recorder's select.select; idle unless a test sets side_effect."""
+    with patch("services.macro_engine.recorder.select.select", side_effect=idle_select) as mock:
+        yield mock
+
+
+def ready_once(device):
+    """select.select results: the device is readable once, then times out."""
+    return [([device.fd], [], []), ([], [], [])]
 
 
 @pytest.fixture
@@ -160,6 +178,51 @@ class TestRecordEvent:
         assert result is True
         assert recorder.get_event_count() == 1
 
+    def test_record_events_burst(self, recorder):
+        """Test a burst records only key down/up events in order."""
+        recorder.start()
+        burst = [
+            make_key_event(ecodes.KEY_A, 1),
+            InputEvent(0, 0, ecodes.EV_SYN, ecodes.SYN_REPORT, 0),
+            make_key_event(ecodes.KEY_A, 2),
+            make_key_event(ecodes.KEY_A, 0),
+        ]
+
+        assert recorder.record_events(burst) == 2
+        assert [(e.value, e.key_name) for e in recorder._events] == [(1, "A"), (0, "A")]
+
+    def test_timestamp_relative_to_start(self, recorder):
+        """Test event timestamps are monotonic seconds since start."""
+        with patch("services.macro_engine.recorder.time.monotonic", side_effect=[500.0, 500.25]):
+            recorder.start()
+            recorder.record_event(make_key_event(ecodes.KEY_A, 1))
+
+        assert recorder._events[0].timestamp == 0.25
+
+    def test_burst_keeps_per_event_delays(self, recorder):
+        """Test events read in one burst keep their own kernel timing."""
+        with patch("services.macro_engine.recorder.time.monotonic", side_effect=[500.0, 500.5]):
+            recorder.start()
+            recorder.record_events(
+                [
+                    make_key_event(ecodes.KEY_A, 1, 10.0),
+                    make_key_event(ecodes.KEY_A, 0, 10.05),
+                    make_key_event(ecodes.KEY_B, 1, 10.3),
+                    make_key_event(ecodes.KEY_B, 0, 10.35),
+                ]
+            )
+
+        stamps = [e.timestamp for e in recorder._events]
+        assert stamps == pytest.approx([0.5, 0.55, 0.8, 0.85])
+
+        steps = recorder.stop().steps
+        assert [s.type for s in steps] == [
+            MacroStepType.KEY_PRESS,
+            MacroStepType.DELAY,
+            MacroStepType.KEY_PRESS,
+        ]
+        assert steps[1].delay_ms == 250
+
 
 class TestEventCallback:
     """Tests for event callback."""
@@ -303,6 +366,28 @@ class TestBuildMacro:
         delay_steps = [s for s in macro.steps if s.type == MacroStepType.DELAY]
         assert len(delay_steps) == 0
 
+    def test_short_gaps_accumulate(self):
+        """Test gaps below min_delay_ms add up into a single delay."""
+        recorder = MacroRecorder(min_delay_ms=100, merge_press_release=False)
+        recorder.start()
+        recorder._events = [
+            RecordedEvent(timestamp=1.0, code=ecodes.KEY_A, value=1, key_name="A"),
+            RecordedEvent(timestamp=1.06, code=ecodes.KEY_A, value=0, key_name="A"),
+            RecordedEvent(timestamp=1.12, code=ecodes.KEY_B, value=1, key_name="B"),
+            RecordedEvent(timestamp=1.18, code=ecodes.KEY_B, value=0, key_name="B"),
+        ]
+        macro = recorder.stop()
+
+        types = [s.type for s in macro.steps]
+        assert types == [
+            MacroStepType.KEY_DOWN,
+            MacroStepType.KEY_UP,
+            MacroStepType.DELAY,
+            MacroStepType.KEY_DOWN,
+            MacroStepType.KEY_UP,
+        ]
+        assert macro.steps[2].delay_ms == 120
+
     def test_max_delay_cap(self):
         """Test delays are capped at max_delay_ms."""
         recorder = MacroRecorder(max_delay_ms=1000)
@@ -360,10 +445,9 @@ class TestDeviceMacroRecorder:
         assert recorder.stop_key == "ESC"
 
     @patch("services.macro_engine.recorder.InputDevice")
-    def test_record_from_device_timeout(self, mock_input_device):
+    def test_record_from_device_timeout(self, mock_input_device, mock_select):
         """Test recording stops on timeout."""
         mock_device = MagicMock()
-        mock_device.read_one.side_effect = BlockingIOError()
         mock_input_device.return_value = mock_device
 
         recorder = DeviceMacroRecorder("/dev/input/event0")
@@ -377,10 +461,9 @@ class TestDeviceMacroRecorder:
         mock_device.ungrab.assert_called_once()
 
     @patch("services.macro_engine.recorder.InputDevice")
-    def test_record_from_device_grabs_and_ungrabs(self, mock_input_device):
+    def test_record_from_device_grabs_and_ungrabs(self, mock_input_device, mock_select):
         """Test device is grabbed and ungrabbed."""
         mock_device = MagicMock()
-        mock_device.read_one.side_effect = BlockingIOError()
         mock_input_device.return_value = mock_device
 
         recorder = DeviceMacroRecorder("/dev/input/event0")
@@ -390,10 +473,9 @@ class TestDeviceMacroRecorder:
         mock_device.ungrab.assert_called_once()
 
     @patch("services.macro_engine.recorder.InputDevice")
-    def test_record_from_device_with_callback(self, mock_input_device):
+    def test_record_from_device_with_callback(self, mock_input_device, mock_select):
         """Test callback is set when provided."""
         mock_device = MagicMock()
-        mock_device.read_one.side_effect = BlockingIOError()
         mock_input_device.return_value = mock_device
 
         callback = MagicMock()
@@ -414,23 +496,20 @@ class TestRecordEventEdgeCases:
         result = recorder.record_event(event)
         assert result is False
 
-    def test_list_code_name_uses_first(self, recorder):
-        """Test code_name list uses first element (line 98)."""
+    def test_aliased_code_uses_mapped_name(self, recorder):
+        """Test a code with several evdev names records its schema name."""
         recorder.start()
 
-        # Mock BTN.get to return a list (evdev actually returns tuples)
-        with patch.dict(ecodes.BTN, {ecodes.BTN_LEFT: ["BTN_LEFT", "BTN_MOUSE"]}):
-            event = make_key_event(ecodes.BTN_LEFT, 1)
-            result = recorder.record_event(event)
-            assert result is True
-            assert recorder.get_event_count() == 1
+        # BTN_LEFT is also BTN_MOUSE in evdev
+        assert recorder.record_event(make_key_event(ecodes.BTN_LEFT, 1)) is True
+        assert recorder._events[0].key_name == "MOUSE_LEFT"
 
 
 class TestDeviceRecordingLoop:
     """Tests for the device reading loop in record_from_device."""
 
     @patch("services.macro_engine.recorder.InputDevice")
-    def test_reads_events_and_records(self, mock_input_device):
+    def test_reads_events_and_records(self, mock_input_device, mock_select):
         """Test reading events from device and recording them (lines 264-278)."""
         mock_device = MagicMock()
 
@@ -438,36 +517,25 @@ class TestDeviceRecordingLoop:
         key_a_down = InputEvent(1, 0, ecodes.EV_KEY, ecodes.KEY_A, 1)
         key_a_up = InputEvent(1, 50000, ecodes.EV_KEY, ecodes.KEY_A, 0)
 
-        # read_one() succeeds first, then BlockingIOError for rest
-        read_one_count = [0]
-
-        def read_one_side_effect():
-            read_one_count[0] += 1
-            if read_one_count[0] == 1:
-                return key_a_down  # Has data
-            raise BlockingIOError()
-
-        # read() returns our events
-        mock_device.read_one.side_effect = read_one_side_effect
+        mock_select.side_effect = ready_once(mock_device)
         mock_device.read.return_value = [key_a_down, key_a_up]
         mock_input_device.return_value = mock_device
 
         recorder = DeviceMacroRecorder("/dev/input/event0")
         recorder.record_from_device(timeout=0.05)
 
-        # Should have recorded the key events
-        assert recorder.get_event_count() >= 1
+        # Both events in the burst are recorded
+        assert recorder.get_event_count() == 2
 
     @patch("services.macro_engine.recorder.InputDevice")
-    def test_stop_key_stops_recording(self, mock_input_device):
+    def test_stop_key_stops_recording(self, mock_input_device, mock_select):
         """Test pressing stop key stops recording (line 276)."""
         mock_device = MagicMock()
 
         # Create F12 key down event (default stop key)
         f12_down = InputEvent(1, 0, ecodes.EV_KEY, ecodes.KEY_F12, 1)
 
-        # read_one() succeeds to indicate data available
-        mock_device.read_one.return_value = f12_down
+        mock_select.side_effect = ready_once(mock_device)
         mock_device.read.return_value = [f12_down]
         mock_input_device.return_value = mock_device
 
@@ -478,7 +546,7 @@ class TestDeviceRecordingLoop:
         mock_device.ungrab.assert_called_once()
 
     @patch("services.macro_engine.recorder.InputDevice")
-    def test_skips_non_key_events_in_loop(self, mock_input_device):
+    def test_skips_non_key_events_in_loop(self, mock_input_device, mock_select):
         """Test non-EV_KEY events are skipped in reading loop (line 265-266)."""
         mock_device = MagicMock()
 
@@ -486,16 +554,7 @@ class TestDeviceRecordingLoop:
         rel_event = InputEvent(1, 0, ecodes.EV_REL, ecodes.REL_X, 10)
         key_event = InputEvent(1, 50000, ecodes.EV_KEY, ecodes.KEY_A, 1)
 
-        # read_one succeeds first then blocks
-        read_one_count = [0]
-
-        def read_one_side_effect():
-            read_one_count[0] += 1
-            if read_one_count[0] == 1:
-                return rel_event
-            raise BlockingIOError()
-
-        mock_device.read_one.side_effect = read_one_side_effect
+        mock_select.side_effect = ready_once(mock_device)
         mock_device.read.return_value = [rel_event, key_event]
         mock_input_device.return_value = mock_device
 
@@ -506,23 +565,22 @@ class TestDeviceRecordingLoop:
         assert recorder.get_event_count() == 1
 
     @patch("services.macro_engine.recorder.InputDevice")
-    def test_stop_key_with_list_code_name(self, mock_input_device):
-        """Test stop key detection when code returns list (line 272-273)."""
+    def test_stop_key_mid_burst(self, mock_input_device, mock_select):
+        """Test events before the stop key in a burst are kept, later ones dropped."""
         mock_device = MagicMock()
-
-        # Use KEY_F12 which we can mock to return a list
-        f12_down = InputEvent(1, 0, ecodes.EV_KEY, ecodes.KEY_F12, 1)
-
-        mock_device.read_one.return_value = f12_down
-        mock_device.read.return_value = [f12_down]
+        mock_device.read.return_value = [
+            InputEvent(1, 0, ecodes.EV_KEY, ecodes.KEY_A, 1),
+            InputEvent(1, 0, ecodes.EV_KEY, ecodes.KEY_F12, 1),
+            InputEvent(1, 0, ecodes.EV_KEY, ecodes.KEY_B, 1),
+        ]
+        mock_select.side_effect = ready_once(mock_device)
         mock_input_device.return_value = mock_device
 
-        # Mock KEY.get to return a list (evdev normally returns tuples)
-        with patch.dict(ecodes.KEY, {ecodes.KEY_F12: ["KEY_F12", "KEY_F12_ALT"]}):
-            recorder = DeviceMacroRecorder("/dev/input/event0", stop_key="F12")
-            recorder.record_from_device(timeout=5.0)
+        recorder = DeviceMacroRecorder("/dev/input/event0", stop_key="f12")
+        assert recorder._stop_code == ecodes.KEY_F12
+        recorder.record_from_device(timeout=5.0)
 
-        # Should have stopped on F12
+        assert [e.key_name for e in recorder._events] == ["A"]
         mock_device.ungrab.assert_called_once()
 
 
@@ -530,10 +588,9 @@ class TestUngrabExceptionHandling:
     """Tests for exception handling in ungrab."""
 
     @patch("services.macro_engine.recorder.InputDevice")
-    def test_ungrab_exception_handled(self, mock_input_device):
+    def test_ungrab_exception_handled(self, mock_input_device, mock_select):
         """Test ungrab exception is caught and ignored (lines 284-285)."""
         mock_device = MagicMock()
-        mock_device.read_one.side_effect = BlockingIOError()
         mock_device.ungrab.side_effect = OSError("Device disconnected")
         mock_input_device.return_value = mock_device
 
@@ -1,6 +1,8 @@
 """Tests for OpenRazerBridge - D-Bus communication with OpenRazer daemon."""
 
-from unittest.mock import MagicMock, patch
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -18,7 +20,10 @@ from services.openrazer_bridge.bridge import (
 @pytest.fixture
 def mock_session_bus():
     """Create a mock SessionBus."""
-    with patch("services.openrazer_bridge.bridge.SessionBus") as mock:
+    with (
+        patch("pydbus.SessionBus") as mock,
+        patch.object(OpenRazerBridge, "_shared_bus", None),
+    ):
         bus_instance = MagicMock()
         mock.return_value = bus_instance
         yield bus_instance
@@ -33,10 +38,31 @@ def mock_daemon(mock_session_bus):
     return daemon
 
 
+# OpenRazer methods the bridge calls on a device proxy
+_DEVICE_METHODS = (
+    "Introspect getSerial getDeviceName getDeviceType getFirmware getBrightness getDPI maxDPI "
+    "getPollRate getBattery isCharging getLogoBrightness getScrollBrightness getMatrixDimensions "
+    "getDeviceMode setBrightness setDPI setPollRate setStatic setSpectrum setBreathSingle "
+    "setBreathDual setBreathRandom setWave setReactive setStarlight setRipple setNone "
+    "setLogoBrightness setLogoStatic setLogoSpectrum setLogoBreathSingle setLogoNone "
+    "setScrollBrightness setScrollStatic setScrollSpectrum setScrollBreathSingle setScrollNone "
+    "setKeyRow setCustom setDeviceMode"
+).split()
+
+
+def _make_device_stub() -> SimpleNamespace:
+    """Build a device proxy double with a plain Mock per OpenRazer method.
+
+    Unlike a bare MagicMock, a misspelled method name raises AttributeError
+    instead of silently creating a new child mock.
+    """
+    return SimpleNamespace(**{name: Mock() for name in _DEVICE_METHODS})
+
+
 @pytest.fixture
 def mock_device():
     """Create a mock device DBus object."""
-    device = MagicMock()
+    device = _make_device_stub()
     device.getSerial.return_value = "PM1234567890"
     device.getDeviceName.return_value = "Razer DeathAdder V2"
     device.getDeviceType.return_value = "mouse"
@@ -67,6 +93,15 @@ def sample_device():
     )
 
 
+@pytest.fixture
+def bridge(mock_session_bus, sample_device, mock_device):
+    """Create a bridge with sample_device cached and mock_device as its proxy."""
+    mock_session_bus.get.return_value = mock_device
+    bridge = OpenRazerBridge()
+    bridge._devices[sample_device.serial] = sample_device
+    return bridge
+
+
 # --- Test Classes ---
 
 
@@ -88,6 +123,18 @@ class TestRazerDevice:
         assert device.brightness == 100
         assert device.dpi == (800, 800)
 
+    def test_uses_slots(self):
+        """Test RazerDevice rejects attributes outside its declared fields."""
+        device = RazerDevice(
+            serial="TEST123",
+            name="Test Device",
+            device_type="mouse",
+            object_path="/org/razer/device/TEST123",
+        )
+        assert not hasattr(device, "__dict__")
+        with pytest.raises(AttributeError):
+            device.not_a_field = True
+
 
 class TestEnums:
     """Tests for bridge enums."""
@@ -119,6 +166,15 @@ class TestBridgeInit:
         assert bridge._bus is not None
         assert bridge._daemon is None
 
+    def test_bridges_share_one_bus(self, mock_session_bus):
+        """Test every bridge reuses the same session bus connection."""
+        with patch("pydbus.SessionBus", return_value=mock_session_bus) as bus_cls:
+            first = OpenRazerBridge()
+            second = OpenRazerBridge()
+
+        assert first._bus is second._bus is mock_session_bus
+        bus_cls.assert_called_once_with()
+
 
 class TestConnect:
     """Tests for connect method."""
@@ -209,65 +265,216 @@ class TestDiscoverDevices:
         assert device is not None
         assert device.serial == "PM1234567890"
 
+    def test_discover_multiple_devices_preserves_order(self, mock_session_bus):
+        """Test concurrent discovery returns devices in daemon order."""
+        serials = ["SERIAL_A", "SERIAL_B", "SERIAL_C"]
+        daemon = MagicMock()
+        daemon.getDevices.return_value = serials
+
+        def make_device(serial):
+            dev = MagicMock()
+            dev.getSerial.return_value = serial
+            dev.getDeviceName.return_value = f"Device {serial}"
+            dev.getDeviceType.return_value = "mouse"
+            return dev
+
+        proxies = {f"/org/razer/device/{serial}": make_device(serial) for serial in serials}
+
+        def get_side_effect(interface, path):
+            if path == "/org/razer":
+                return daemon
+            return proxies[path]
+
+        mock_session_bus.get.side_effect = get_side_effect
+
+        bridge = OpenRazerBridge()
+        devices = bridge.discover_devices()
+
+        assert [d.serial for d in devices] == serials
+        assert set(bridge._devices) == set(serials)
+
 
 class TestGetDevice:
     """Tests for get_device method."""
 
-    def test_get_cached_device(self, mock_session_bus, sample_device):
+    def test_get_cached_device(self, bridge, sample_device):
         """Test getting a cached device."""
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         device = bridge.get_device("PM1234567890")
         assert device == sample_device
 
-    def test_get_unknown_device_triggers_discovery(self, mock_session_bus):
-        """Test getting unknown device triggers re-scan."""
+    def test_get_unknown_device_queries_daemon(self, mock_session_bus):
+        """Test getting unknown device asks the daemon once without a rescan."""
         daemon = MagicMock()
         daemon.getDevices.return_value = []
         mock_session_bus.get.return_value = daemon
 
         bridge = OpenRazerBridge()
-        device = bridge.get_device("UNKNOWN123")
+        with patch.object(bridge, "_get_device_info") as get_info:
+            device = bridge.get_device("UNKNOWN123")
 
         assert device is None
-        # Should have tried to discover
-        daemon.getDevices.assert_called()
+        daemon.getDevices.assert_called_once()
+        get_info.assert_not_called()
 
+    def test_get_new_device_loads_only_that_device(self, mock_session_bus, mock_device):
+        """Test a serial missing from the cache is introspected on its own."""
+        daemon = MagicMock()
+        daemon.getDevices.return_value = ["OTHER", "PM1234567890"]
+        mock_session_bus.get.side_effect = [daemon, mock_device]
 
-class TestBrightness:
-    """Tests for brightness control."""
+        bridge = OpenRazerBridge()
+        device = bridge.get_device("PM1234567890")
 
-    def test_set_brightness(self, mock_session_bus, sample_device, mock_device):
-        """Test setting brightness."""
+        assert device.serial == "PM1234567890"
+        assert bridge._devices == {"PM1234567890": device}
+        mock_session_bus.get.assert_called_with("org.razer", "/org/razer/device/PM1234567890")
+
+        # Later lookups are served from the cache
+        assert bridge.get_device("PM1234567890") is device
+        daemon.getDevices.assert_called_once()
+
+
+class TestProxyCache:
+    """Tests for DBus proxy caching."""
+
+    def test_proxy_reused_across_calls(self, mock_session_bus, sample_device, mock_device):
+        """Test setters reuse the cached proxy instead of calling bus.get again."""
         mock_session_bus.get.return_value = mock_device
 
         bridge = OpenRazerBridge()
         bridge._devices["PM1234567890"] = sample_device
 
+        bridge.set_brightness("PM1234567890", 50)
+        bridge.set_dpi("PM1234567890", 1600)
+
+        mock_session_bus.get.assert_called_once_with("org.razer", "/org/razer/device/PM1234567890")
+
+    def test_discover_clears_proxy_cache(self, mock_session_bus):
+        """Test rediscovery drops proxies for devices that may be gone."""
+        daemon = MagicMock()
+        daemon.getDevices.return_value = []
+        mock_session_bus.get.return_value = daemon
+
+        bridge = OpenRazerBridge()
+        bridge._proxies["/org/razer/device/OLD"] = MagicMock()
+        bridge.discover_devices()
+
+        assert bridge._proxies == {}
+
+
+class TestCoalescedWrites:
+    """Tests for queued/coalesced writes."""
+
+    def test_flush_sends_latest_value_only(self, bridge, mock_device):
+        """Test rapid queued writes collapse into one DBus call per property."""
+        for value in (10, 20, 30):
+            bridge.queue_brightness("PM1234567890", value)
+        bridge.queue_dpi("PM1234567890", 1600)
+        # Nothing reaches the bus until the caller flushes
+        mock_device.setBrightness.assert_not_called()
+
+        bridge.flush_pending()
+
+        mock_device.setBrightness.assert_called_once_with(30)
+        mock_device.setDPI.assert_called_once_with(1600, 1600)
+        assert bridge._pending == {}
+
+    def test_batch_updates_flushes_once_on_exit(self, bridge, mock_device):
+        """Test writes queued inside batch_updates are sent once when it exits."""
+        with bridge.batch_updates():
+            with bridge.batch_updates():
+                for value in range(10):
+                    bridge.queue_brightness("PM1234567890", value)
+                # A debounce flush landing mid-batch is held
+                bridge.flush_pending()
+            bridge.flush_pending()
+            mock_device.setBrightness.assert_not_called()
+
+        mock_device.setBrightness.assert_called_once_with(9)
+        assert bridge._pending == {}
+
+    def test_flush_with_nothing_pending(self, mock_session_bus):
+        """Test flush_pending is a no-op when nothing is queued."""
+        bridge = OpenRazerBridge()
+        bridge.flush_pending()  # Should not raise
+
+
+class TestApplyToDevices:
+    """Tests for applying one setter to several devices."""
+
+    def test_apply_to_devices(self, mock_session_bus, sample_device):
+        """Test every device receives the call and results map by serial."""
+        keyboard = MagicMock()
+        mouse = MagicMock()
+        mock_session_bus.get.side_effect = lambda _name, path: (
+            keyboard if path.endswith("KB1") else mouse
+        )
+
+        bridge = OpenRazerBridge()
+        bridge._devices["PM1234567890"] = sample_device
+        bridge._devices["KB1"] = RazerDevice(
+            serial="KB1",
+            name="Razer BlackWidow",
+            device_type="keyboard",
+            object_path="/org/razer/device/KB1",
+            has_lighting=True,
+        )
+        bridge._devices["NOLIGHT"] = RazerDevice(
+            serial="NOLIGHT", name="Headset", device_type="headset", object_path="/x"
+        )
+
+        results = bridge.apply_to_devices(
+            ["KB1", "PM1234567890", "NOLIGHT"], "set_static_color", 255, 0, 0
+        )
+
+        assert results == {"KB1": True, "PM1234567890": True, "NOLIGHT": False}
+        keyboard.setStatic.assert_called_once_with(255, 0, 0)
+        mouse.setStatic.assert_called_once_with(255, 0, 0)
+
+    def test_apply_to_devices_resolves_on_calling_thread(self, mock_session_bus, sample_device):
+        """Test cache misses are looked up before any worker starts."""
+        mock_session_bus.get.return_value = MagicMock()
+        bridge = OpenRazerBridge()
+        bridge._devices["PM1234567890"] = sample_device
+        lookups = []
+
+        def lookup(serial):
+            lookups.append((serial, threading.current_thread()))
+
+        with patch.object(bridge, "_lookup_device", side_effect=lookup):
+            results = bridge.apply_to_devices(["GONE", "PM1234567890"], "set_spectrum_effect")
+
+        assert results == {"GONE": False, "PM1234567890": True}
+        assert lookups == [("GONE", threading.main_thread())]
+        assert "/org/razer/device/PM1234567890" in bridge._proxies
+
+    def test_apply_to_no_devices(self, mock_session_bus):
+        """Test an empty serial list makes no calls."""
+        bridge = OpenRazerBridge()
+        assert bridge.apply_to_devices([], "set_spectrum_effect") == {}
+
+
+class TestBrightness:
+    """Tests for brightness control."""
+
+    def test_set_brightness(self, bridge, sample_device, mock_device):
+        """Test setting brightness."""
         result = bridge.set_brightness("PM1234567890", 50)
 
         assert result is True
         mock_device.setBrightness.assert_called_with(50)
         assert sample_device.brightness == 50
 
-    def test_set_brightness_no_capability(self, mock_session_bus, sample_device):
+    def test_set_brightness_no_capability(self, bridge, sample_device):
         """Test setting brightness on device without capability."""
         sample_device.has_brightness = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_brightness("PM1234567890", 50)
         assert result is False
 
-    def test_get_brightness(self, mock_session_bus, sample_device, mock_device):
+    def test_get_brightness(self, bridge, mock_device):
         """Test getting brightness."""
         mock_device.getBrightness.return_value = 80
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         brightness = bridge.get_brightness("PM1234567890")
 
@@ -277,37 +484,23 @@ class TestBrightness:
 class TestDPI:
     """Tests for DPI control."""
 
-    def test_set_dpi(self, mock_session_bus, sample_device, mock_device):
+    def test_set_dpi(self, bridge, sample_device, mock_device):
         """Test setting DPI."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_dpi("PM1234567890", 1600, 1600)
 
         assert result is True
         mock_device.setDPI.assert_called_with(1600, 1600)
         assert sample_device.dpi == (1600, 1600)
 
-    def test_set_dpi_single_value(self, mock_session_bus, sample_device, mock_device):
+    def test_set_dpi_single_value(self, bridge, mock_device):
         """Test setting DPI with single value uses same for X and Y."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         bridge.set_dpi("PM1234567890", 1600)
 
         mock_device.setDPI.assert_called_with(1600, 1600)
 
-    def test_get_dpi(self, mock_session_bus, sample_device, mock_device):
+    def test_get_dpi(self, bridge, mock_device):
         """Test getting DPI."""
         mock_device.getDPI.return_value = [1600, 1600]
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         dpi = bridge.get_dpi("PM1234567890")
 
@@ -317,34 +510,22 @@ class TestDPI:
 class TestPollRate:
     """Tests for poll rate control."""
 
-    def test_set_poll_rate(self, mock_session_bus, sample_device, mock_device):
+    def test_set_poll_rate(self, bridge, mock_device):
         """Test setting poll rate."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_poll_rate("PM1234567890", 500)
 
         assert result is True
         mock_device.setPollRate.assert_called_with(500)
 
-    def test_set_invalid_poll_rate(self, mock_session_bus, sample_device):
+    def test_set_invalid_poll_rate(self, bridge):
         """Test setting invalid poll rate."""
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_poll_rate("PM1234567890", 250)
 
         assert result is False
 
-    def test_get_poll_rate(self, mock_session_bus, sample_device, mock_device):
+    def test_get_poll_rate(self, bridge, mock_device):
         """Test getting poll rate."""
         mock_device.getPollRate.return_value = 1000
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         rate = bridge.get_poll_rate("PM1234567890")
 
@@ -354,113 +535,31 @@ class TestPollRate:
 class TestLightingEffects:
     """Tests for lighting effect control."""
 
-    def test_set_static_color(self, mock_session_bus, sample_device, mock_device):
-        """Test setting static color."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
-        result = bridge.set_static_color("PM1234567890", 255, 0, 0)
-
-        assert result is True
-        mock_device.setStatic.assert_called_with(255, 0, 0)
-
-    def test_set_spectrum_effect(self, mock_session_bus, sample_device, mock_device):
-        """Test setting spectrum effect."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
-        result = bridge.set_spectrum_effect("PM1234567890")
-
-        assert result is True
-        mock_device.setSpectrum.assert_called()
-
-    def test_set_breathing_effect(self, mock_session_bus, sample_device, mock_device):
-        """Test setting breathing effect."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
-        result = bridge.set_breathing_effect("PM1234567890", 0, 255, 0)
-
-        assert result is True
-        mock_device.setBreathSingle.assert_called_with(0, 255, 0)
-
-    def test_set_breathing_dual(self, mock_session_bus, sample_device, mock_device):
-        """Test setting dual color breathing."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
-        result = bridge.set_breathing_dual("PM1234567890", 255, 0, 0, 0, 0, 255)
-
-        assert result is True
-        mock_device.setBreathDual.assert_called_with(255, 0, 0, 0, 0, 255)
-
-    def test_set_breathing_random(self, mock_session_bus, sample_device, mock_device):
-        """Test setting random breathing."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
-        result = bridge.set_breathing_random("PM1234567890")
-
-        assert result is True
-        mock_device.setBreathRandom.assert_called()
-
-    def test_set_wave_effect(self, mock_session_bus, sample_device, mock_device):
-        """Test setting wave effect."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
-        result = bridge.set_wave_effect("PM1234567890", WaveDirection.LEFT)
-
-        assert result is True
-        mock_device.setWave.assert_called_with(1)
-
-    def test_set_reactive_effect(self, mock_session_bus, sample_device, mock_device):
-        """Test setting reactive effect."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
-        result = bridge.set_reactive_effect("PM1234567890", 255, 255, 0, ReactiveSpeed.SHORT)
-
-        assert result is True
-        mock_device.setReactive.assert_called_with(255, 255, 0, 1)
-
-    def test_set_starlight_effect(self, mock_session_bus, sample_device, mock_device):
-        """Test setting starlight effect."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
-        result = bridge.set_starlight_effect("PM1234567890", 0, 255, 255)
-
-        assert result is True
-        mock_device.setStarlight.assert_called()
-
-    def test_set_none_effect(self, mock_session_bus, sample_device, mock_device):
-        """Test turning off lighting."""
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
-        result = bridge.set_none_effect("PM1234567890")
+    @pytest.mark.parametrize(
+        ("method", "args", "dbus_method", "dbus_args"),
+        [
+            ("set_static_color", (255, 0, 0), "setStatic", (255, 0, 0)),
+            ("set_spectrum_effect", (), "setSpectrum", ()),
+            ("set_breathing_effect", (0, 255, 0), "setBreathSingle", (0, 255, 0)),
+            ("set_breathing_dual", (255, 0, 0, 0, 0, 255), "setBreathDual", (255, 0, 0, 0, 0, 255)),
+            ("set_breathing_random", (), "setBreathRandom", ()),
+            ("set_wave_effect", (WaveDirection.LEFT,), "setWave", (1,)),
+            (
+                "set_reactive_effect",
+                (255, 255, 0, ReactiveSpeed.SHORT),
+                "setReactive",
+                (255, 255, 0, 1),
+            ),
+            ("set_starlight_effect", (0, 255, 255), "setStarlight", (0, 255, 255, 2)),
+            ("set_none_effect", (), "setNone", ()),
+        ],
+    )
+    def test_set_effect(self, bridge, mock_device, method, args, dbus_method, dbus_args):
+        """Test each effect setter makes its DBus call with the expected arguments."""
+        result = getattr(bridge, method)("PM1234567890", *args)
 
         assert result is True
-        mock_device.setNone.assert_called()
+        getattr(mock_device, dbus_method).assert_called_once_with(*dbus_args)
 
 
 class TestLogoAndScroll:
@@ -573,13 +672,10 @@ class TestBattery:
         assert battery["level"] == 85
         assert battery["charging"] is True
 
-    def test_get_battery_no_capability(self, mock_session_bus, sample_device):
+    def test_get_battery_no_capability(self, bridge, sample_device):
         """Test getting battery on device without capability."""
         sample_device.has_battery = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         battery = bridge.get_battery("PM1234567890")
         assert battery is None
 
@@ -587,13 +683,9 @@ class TestBattery:
 class TestRefreshDevice:
     """Tests for device refresh."""
 
-    def test_refresh_device(self, mock_session_bus, sample_device, mock_device):
+    def test_refresh_device(self, bridge, mock_device):
         """Test refreshing device state."""
         mock_device.getBrightness.return_value = 90
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         device = bridge.refresh_device("PM1234567890")
 
@@ -636,31 +728,69 @@ class TestCapabilityDetection:
         assert "spectrum" in device.supported_effects
         assert "wave" in device.supported_effects
 
+    def test_introspection_skips_missing_getters(self, mock_session_bus):
+        """Test getters absent from the introspection XML are never called."""
+        mock_device = MagicMock()
+        mock_device.Introspect.return_value = """
+            <node>
+              <interface name="razer.device.lighting.logo">
+                <method name="getLogoBrightness"/>
+                <method name="setLogoStatic"/>
+              </interface>
+              <interface name="razer.device.dpi">
+                <method name="getDPI"/>
+              </interface>
+            </node>
+        """
+        mock_device.getLogoBrightness.return_value = 60.0
+        mock_device.getDPI.return_value = [1600, 1600]
+        mock_session_bus.get.return_value = mock_device
+
+        bridge = OpenRazerBridge()
+        device = RazerDevice(
+            serial="TEST123", name="Test", device_type="mouse", object_path="/test"
+        )
+        bridge._detect_capabilities(mock_device, device)
+
+        mock_device.getBrightness.assert_not_called()
+        mock_device.getBattery.assert_not_called()
+        mock_device.getPollRate.assert_not_called()
+        assert device.brightness == 60
+        assert device.has_logo is True
+        assert device.has_scroll is False
+        assert device.dpi == (1600, 1600)
+        assert device.has_battery is False
+        assert device.supported_effects == ["static"]
+
+    def test_introspection_failure_falls_back_to_probing(self, mock_session_bus):
+        """Test unparsable introspection data falls back to calling getters."""
+        mock_device = MagicMock()
+        mock_device.Introspect.side_effect = Exception("Introspection unavailable")
+        mock_device.getBrightness.return_value = 80
+
+        device = RazerDevice(
+            serial="TEST123", name="Test", device_type="mouse", object_path="/test"
+        )
+        OpenRazerBridge()._detect_capabilities(mock_device, device)
+
+        assert device.brightness == 80
+        assert device.has_brightness is True
+
 
 class TestErrorHandling:
     """Tests for error handling."""
 
-    def test_set_brightness_handles_error(self, mock_session_bus, sample_device):
+    def test_set_brightness_handles_error(self, bridge, mock_device):
         """Test set_brightness handles DBus errors."""
-        mock_device = MagicMock()
         mock_device.setBrightness.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_brightness("PM1234567890", 50)
 
         assert result is False
 
-    def test_get_dpi_handles_error(self, mock_session_bus, sample_device):
+    def test_get_dpi_handles_error(self, bridge, mock_device):
         """Test get_dpi handles DBus errors."""
-        mock_device = MagicMock()
         mock_device.getDPI.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.get_dpi("PM1234567890")
 
@@ -982,212 +1112,142 @@ class TestCapabilityDetectionExceptions:
 class TestEffectMethodErrors:
     """Tests for effect method error handling."""
 
-    def test_set_static_color_no_lighting(self, mock_session_bus, sample_device):
+    def test_set_static_color_no_lighting(self, bridge, sample_device):
         """Test set_static_color returns False without lighting (line 284)."""
         sample_device.has_lighting = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_static_color("PM1234567890", 255, 0, 0)
         assert result is False
 
-    def test_set_static_color_error(self, mock_session_bus, sample_device, mock_device):
+    def test_set_static_color_error(self, bridge, mock_device):
         """Test set_static_color handles error (lines 290-292)."""
         mock_device.setStatic.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_static_color("PM1234567890", 255, 0, 0)
         assert result is False
 
-    def test_set_dpi_no_capability(self, mock_session_bus, sample_device):
+    def test_set_dpi_no_capability(self, bridge, sample_device):
         """Test set_dpi returns False without capability (line 301)."""
         sample_device.has_dpi = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_dpi("PM1234567890", 1600)
         assert result is False
 
-    def test_set_dpi_error(self, mock_session_bus, sample_device, mock_device):
+    def test_set_dpi_error(self, bridge, mock_device):
         """Test set_dpi handles error (lines 308-310)."""
         mock_device.setDPI.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_dpi("PM1234567890", 1600)
         assert result is False
 
-    def test_set_spectrum_no_lighting(self, mock_session_bus, sample_device):
+    def test_set_spectrum_no_lighting(self, bridge, sample_device):
         """Test set_spectrum_effect returns False without lighting (line 316)."""
         sample_device.has_lighting = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_spectrum_effect("PM1234567890")
         assert result is False
 
-    def test_set_spectrum_error(self, mock_session_bus, sample_device, mock_device):
+    def test_set_spectrum_error(self, bridge, mock_device):
         """Test set_spectrum_effect handles error (lines 322-324)."""
         mock_device.setSpectrum.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_spectrum_effect("PM1234567890")
         assert result is False
 
-    def test_set_breathing_no_lighting(self, mock_session_bus, sample_device):
+    def test_set_breathing_no_lighting(self, bridge, sample_device):
         """Test set_breathing_effect returns False without lighting (line 330)."""
         sample_device.has_lighting = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_breathing_effect("PM1234567890", 255, 0, 0)
         assert result is False
 
-    def test_set_breathing_error(self, mock_session_bus, sample_device, mock_device):
+    def test_set_breathing_error(self, bridge, mock_device):
         """Test set_breathing_effect handles error (lines 336-338)."""
         mock_device.setBreathSingle.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_breathing_effect("PM1234567890", 255, 0, 0)
         assert result is False
 
-    def test_set_breathing_dual_no_lighting(self, mock_session_bus, sample_device):
+    def test_set_breathing_dual_no_lighting(self, bridge, sample_device):
         """Test set_breathing_dual returns False without lighting (line 346)."""
         sample_device.has_lighting = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_breathing_dual("PM1234567890", 255, 0, 0, 0, 255, 0)
         assert result is False
 
-    def test_set_breathing_dual_error(self, mock_session_bus, sample_device, mock_device):
+    def test_set_breathing_dual_error(self, bridge, mock_device):
         """Test set_breathing_dual handles error (lines 352-354)."""
         mock_device.setBreathDual.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_breathing_dual("PM1234567890", 255, 0, 0, 0, 255, 0)
         assert result is False
 
-    def test_set_breathing_random_no_lighting(self, mock_session_bus, sample_device):
+    def test_set_breathing_random_no_lighting(self, bridge, sample_device):
         """Test set_breathing_random returns False without lighting (line 360)."""
         sample_device.has_lighting = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_breathing_random("PM1234567890")
         assert result is False
 
-    def test_set_breathing_random_error(self, mock_session_bus, sample_device, mock_device):
+    def test_set_breathing_random_error(self, bridge, mock_device):
         """Test set_breathing_random handles error (lines 366-368)."""
         mock_device.setBreathRandom.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_breathing_random("PM1234567890")
         assert result is False
 
-    def test_set_wave_no_lighting(self, mock_session_bus, sample_device):
+    def test_set_wave_no_lighting(self, bridge, sample_device):
         """Test set_wave_effect returns False without lighting (line 374)."""
         sample_device.has_lighting = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_wave_effect("PM1234567890")
         assert result is False
 
-    def test_set_wave_error(self, mock_session_bus, sample_device, mock_device):
+    def test_set_wave_error(self, bridge, mock_device):
         """Test set_wave_effect handles error (lines 380-382)."""
         mock_device.setWave.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_wave_effect("PM1234567890")
         assert result is False
 
-    def test_set_reactive_no_lighting(self, mock_session_bus, sample_device):
+    def test_set_reactive_no_lighting(self, bridge, sample_device):
         """Test set_reactive_effect returns False without lighting (line 390)."""
         sample_device.has_lighting = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_reactive_effect("PM1234567890", 255, 0, 0)
         assert result is False
 
-    def test_set_reactive_error(self, mock_session_bus, sample_device, mock_device):
+    def test_set_reactive_error(self, bridge, mock_device):
         """Test set_reactive_effect handles error (lines 396-398)."""
         mock_device.setReactive.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_reactive_effect("PM1234567890", 255, 0, 0)
         assert result is False
 
-    def test_set_starlight_no_lighting(self, mock_session_bus, sample_device):
+    def test_set_starlight_no_lighting(self, bridge, sample_device):
         """Test set_starlight_effect returns False without lighting (line 411)."""
         sample_device.has_lighting = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_starlight_effect("PM1234567890")
         assert result is False
 
-    def test_set_starlight_error(self, mock_session_bus, sample_device, mock_device):
+    def test_set_starlight_error(self, bridge, mock_device):
         """Test set_starlight_effect handles error (lines 417-419)."""
         mock_device.setStarlight.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_starlight_effect("PM1234567890")
         assert result is False
 
-    def test_set_none_no_lighting(self, mock_session_bus, sample_device):
+    def test_set_none_no_lighting(self, bridge, sample_device):
         """Test set_none_effect returns False without lighting (line 425)."""
         sample_device.has_lighting = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_none_effect("PM1234567890")
         assert result is False
 
-    def test_set_none_error(self, mock_session_bus, sample_device, mock_device):
+    def test_set_none_error(self, bridge, mock_device):
         """Test set_none_effect handles error (lines 431-433)."""
         mock_device.setNone.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_none_effect("PM1234567890")
         assert result is False
@@ -1196,75 +1256,51 @@ class TestEffectMethodErrors:
 class TestPollRateErrors:
     """Tests for poll rate error handling."""
 
-    def test_set_poll_rate_no_capability(self, mock_session_bus, sample_device):
+    def test_set_poll_rate_no_capability(self, bridge, sample_device):
         """Test set_poll_rate returns False without capability (line 439)."""
         sample_device.has_poll_rate = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.set_poll_rate("PM1234567890", 500)
         assert result is False
 
-    def test_set_poll_rate_error(self, mock_session_bus, sample_device, mock_device):
+    def test_set_poll_rate_error(self, bridge, mock_device):
         """Test set_poll_rate handles error (lines 450-452)."""
         mock_device.setPollRate.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.set_poll_rate("PM1234567890", 500)
         assert result is False
 
-    def test_get_poll_rate_no_capability(self, mock_session_bus, sample_device):
+    def test_get_poll_rate_no_capability(self, bridge, sample_device):
         """Test get_poll_rate returns None without capability (line 458)."""
         sample_device.has_poll_rate = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.get_poll_rate("PM1234567890")
         assert result is None
 
-    def test_get_poll_rate_error(self, mock_session_bus, sample_device, mock_device):
+    def test_get_poll_rate_error(self, bridge, mock_device):
         """Test get_poll_rate handles error (lines 465-467)."""
         mock_device.getPollRate.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.get_poll_rate("PM1234567890")
         assert result is None
 
-    def test_get_dpi_no_capability(self, mock_session_bus, sample_device):
+    def test_get_dpi_no_capability(self, bridge, sample_device):
         """Test get_dpi returns None without capability (line 473)."""
         sample_device.has_dpi = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.get_dpi("PM1234567890")
         assert result is None
 
-    def test_get_brightness_no_capability(self, mock_session_bus, sample_device):
+    def test_get_brightness_no_capability(self, bridge, sample_device):
         """Test get_brightness returns None without capability (line 488)."""
         sample_device.has_brightness = False
 
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
-
         result = bridge.get_brightness("PM1234567890")
         assert result is None
 
-    def test_get_brightness_error(self, mock_session_bus, sample_device, mock_device):
+    def test_get_brightness_error(self, bridge, mock_device):
         """Test get_brightness handles error (lines 495-497)."""
         mock_device.getBrightness.side_effect = Exception("DBus error")
-        mock_session_bus.get.return_value = mock_device
-
-        bridge = OpenRazerBridge()
-        bridge._devices["PM1234567890"] = sample_device
 
         result = bridge.get_brightness("PM1234567890")
         assert result is None
@@ -1510,11 +1546,24 @@ class TestMatrixMethods:
         bridge = OpenRazerBridge()
         bridge._devices["PM1234567890"] = matrix_device
 
-        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
-        result = bridge.set_key_row("PM1234567890", 0, colors)
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 256)]
+        result = bridge.set_key_row("PM1234567890", 2, colors)
 
         assert result is True
-        mock_device.setKeyRow.assert_called_once()
+        # Row index, then each channel masked to a byte
+        mock_device.setKeyRow.assert_called_once_with(b"\x02\xff\x00\x00\x00\xff\x00\x00\x00\x00")
+
+    def test_set_key_row_rejects_malformed_colors(
+        self, mock_session_bus, matrix_device, mock_device
+    ):
+        """Test colors that are not RGB triples fail instead of shifting later keys."""
+        mock_session_bus.get.return_value = mock_device
+        bridge = OpenRazerBridge()
+        bridge._devices["PM1234567890"] = matrix_device
+
+        assert bridge.set_key_row("PM1234567890", 0, [(255, 0, 0, 255), (0, 255, 0)]) is False
+        assert bridge.set_key_row("PM1234567890", 0, [(255, 0), (0, 255, 0)]) is False
+        mock_device.setKeyRow.assert_not_called()
 
     def test_set_key_row_error(self, mock_session_bus, matrix_device, mock_device):
         """Test set_key_row handles error (lines 608-610)."""
@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from crates.profile_schema import Profile, ProfileLoader
 from crates.profile_schema.schema import (
@@ -315,6 +316,21 @@ class TestProfileLoader:
                 # Restore permissions for cleanup
                 loader.profiles_dir.chmod(0o755)
 
+    def test_save_and_activate(self):
+        """Test save_and_activate only activates a profile that was saved."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            loader = ProfileLoader(config_dir=Path(tmpdir))
+            profile = Profile(id="first", name="First", input_devices=[])
+
+            assert loader.save_and_activate(profile) is True
+            assert loader.get_active_profile_id() == "first"
+            assert loader.load_active_profile() == profile
+
+            other = Profile(id="second", name="Second", input_devices=[])
+            with patch.object(loader, "save_profile", return_value=False):
+                assert loader.save_and_activate(other) is False
+            assert loader.get_active_profile_id() == "first"
+
     def test_save_global_macros_handles_write_error(self):
         """Test save_global_macros handles write errors gracefully."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1,6 +1,6 @@
 """Tests for RemapEngine - core remapping logic."""
 
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 from evdev import InputEvent, ecodes
@@ -191,6 +191,34 @@ class TestRemapEngineInit:
         assert "test_macro" in engine._macros
         assert engine._macros["test_macro"].name == "Test Macro"
 
+    def test_init_resolves_output_codes(self, simple_profile, macro_profile):
+        """Test bindings are stored with their evdev output codes resolved."""
+        engine = RemapEngine(simple_profile)
+        base = engine._bindings["base"]
+        assert base[ecodes.BTN_SIDE].output_codes == (ecodes.KEY_A,)
+        assert base[ecodes.BTN_EXTRA].output_codes == (ecodes.KEY_LEFTCTRL, ecodes.KEY_C)
+        assert base[ecodes.BTN_FORWARD].output_codes == ()
+        assert base[ecodes.BTN_BACK].output_codes == (ecodes.BTN_BACK,)
+        assert base[ecodes.BTN_EXTRA].release_codes == (ecodes.KEY_C, ecodes.KEY_LEFTCTRL)
+
+        engine = RemapEngine(macro_profile)
+        resolved = engine._bindings["base"][ecodes.BTN_SIDE]
+        assert resolved.macro is engine._macros["test_macro"]
+        assert "test_macro" in engine._compiled_macros
+
+    def test_hot_path_skips_schema_lookups(self, simple_profile, macro_profile, mock_uinput):
+        """Test processing events never resolves schema names again."""
+        from unittest.mock import patch
+
+        engines = [RemapEngine(simple_profile), RemapEngine(macro_profile)]
+        with patch("services.remap_daemon.engine.schema_to_evdev_code") as lookup:
+            for engine in engines:
+                engine.set_uinput(mock_uinput)
+                for code in (ecodes.BTN_SIDE, ecodes.BTN_EXTRA, ecodes.BTN_BACK):
+                    engine.process_event(make_key_event(code, 1))
+                    engine.process_event(make_key_event(code, 0))
+        lookup.assert_not_called()
+
     def test_init_with_layers(self, hypershift_profile):
         """Test initialization with multiple layers."""
         engine = RemapEngine(hypershift_profile)
@@ -232,6 +260,19 @@ class TestKeyBinding:
         # Should emit KEY_A up
         mock_uinput.write.assert_called_with(ecodes.EV_KEY, ecodes.KEY_A, 0)
 
+    def test_unbound_key_skips_binding_lookup(self, hypershift_profile, mock_uinput):
+        """Test keys no layer remaps take the fast path without a table lookup."""
+        engine = RemapEngine(hypershift_profile)
+        engine.set_uinput(mock_uinput)
+        assert engine._interesting == {ecodes.BTN_SIDE, ecodes.BTN_EXTRA}
+
+        engine._active_table = MagicMock()
+        assert engine.process_event(make_key_event(ecodes.KEY_Q, 1)) is False
+        assert engine.state.is_pressed(ecodes.KEY_Q)
+        assert engine.process_event(make_key_event(ecodes.KEY_Q, 0)) is False
+        assert not engine.state.is_pressed(ecodes.KEY_Q)
+        engine._active_table.get.assert_not_called()
+
     def test_unbound_key_passthrough(self, simple_profile, mock_uinput):
         """Test unbound key passes through."""
         engine = RemapEngine(simple_profile)
@@ -281,6 +322,121 @@ class TestChordBinding:
         assert calls[0] == call(ecodes.EV_KEY, ecodes.KEY_C, 0)
         assert calls[1] == call(ecodes.EV_KEY, ecodes.KEY_LEFTCTRL, 0)
 
+    def test_no_output_before_set_uinput(self, simple_profile):
+        """Test bindings still track state when no uinput is attached."""
+        engine = RemapEngine(simple_profile)
+
+        assert engine.process_event(make_key_event(ecodes.BTN_EXTRA, 1)) is True
+        assert engine.state.output_held == {ecodes.KEY_LEFTCTRL, ecodes.KEY_C}
+
+    def test_chord_frame_written_in_one_syscall(self, simple_profile):
+        """Test a real uinput fd receives the whole chord frame in one write."""
+        import os
+        import struct
+
+        read_fd, write_fd = os.pipe()
+        try:
+            uinput = MagicMock()
+            uinput.fd = write_fd
+            engine = RemapEngine(simple_profile)
+            engine.set_uinput(uinput)
+
+            engine.process_event(make_key_event(ecodes.BTN_EXTRA, 1))
+            data = os.read(read_fd, 4096)
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        event = struct.Struct("llHHi")
+        events = [event.unpack_from(data, off)[2:] for off in range(0, len(data), event.size)]
+        assert events == [
+            (ecodes.EV_KEY, ecodes.KEY_LEFTCTRL, 1),
+            (ecodes.EV_KEY, ecodes.KEY_C, 1),
+            (ecodes.EV_SYN, ecodes.SYN_REPORT, 0),
+        ]
+        uinput.write.assert_not_called()
+
+    def test_failed_frame_write_is_not_resent(self, simple_profile):
+        """Test a frame whose write fails is dropped, not replayed on the next syn."""
+        import os
+        import struct
+
+        read_fd, write_fd = os.pipe()
+        try:
+            uinput = MagicMock()
+            uinput.fd = write_fd
+            engine = RemapEngine(simple_profile)
+            engine.set_uinput(uinput)
+
+            with patch("services.remap_daemon.engine.os.write", side_effect=OSError("gone")):
+                with pytest.raises(OSError):
+                    engine.process_event(make_key_event(ecodes.BTN_SIDE, 1))
+
+            engine.passthrough_event(InputEvent(0, 0, ecodes.EV_REL, ecodes.REL_X, 3))
+            engine.passthrough_event(InputEvent(0, 0, ecodes.EV_SYN, ecodes.SYN_REPORT, 0))
+            data = os.read(read_fd, 4096)
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        event = struct.Struct("llHHi")
+        events = [event.unpack_from(data, off)[2:] for off in range(0, len(data), event.size)]
+        assert events == [
+            (ecodes.EV_REL, ecodes.REL_X, 3),
+            (ecodes.EV_SYN, ecodes.SYN_REPORT, 0),
+        ]
+
+    def test_passthrough_frame_written_on_syn(self, simple_profile):
+        """Test passthrough events are flushed together by the source SYN_REPORT."""
+        import os
+        import struct
+
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        try:
+            uinput = MagicMock()
+            uinput.fd = write_fd
+            engine = RemapEngine(simple_profile)
+            engine.set_uinput(uinput)
+
+            engine.passthrough_event(InputEvent(0, 0, ecodes.EV_REL, ecodes.REL_X, 3))
+            engine.passthrough_event(InputEvent(0, 0, ecodes.EV_REL, ecodes.REL_Y, -2))
+            with pytest.raises(BlockingIOError):
+                os.read(read_fd, 4096)
+
+            engine.passthrough_event(InputEvent(0, 0, ecodes.EV_SYN, ecodes.SYN_REPORT, 0))
+            data = os.read(read_fd, 4096)
+
+            # A SYN with nothing queued is not written at all
+            engine.passthrough_event(InputEvent(0, 0, ecodes.EV_SYN, ecodes.SYN_REPORT, 0))
+            with pytest.raises(BlockingIOError):
+                os.read(read_fd, 4096)
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        event = struct.Struct("llHHi")
+        events = [event.unpack_from(data, off)[2:] for off in range(0, len(data), event.size)]
+        assert events == [
+            (ecodes.EV_REL, ecodes.REL_X, 3),
+            (ecodes.EV_REL, ecodes.REL_Y, -2),
+            (ecodes.EV_SYN, ecodes.SYN_REPORT, 0),
+        ]
+
+    def test_chord_syncs_once_per_edge(self, simple_profile, mock_uinput):
+        """Test a chord's writes are grouped into a single input frame."""
+        engine = RemapEngine(simple_profile)
+        engine.set_uinput(mock_uinput)
+
+        engine.process_event(make_key_event(ecodes.BTN_EXTRA, 1))
+        assert mock_uinput.write.call_count == 2
+        mock_uinput.syn.assert_called_once_with()
+
+        mock_uinput.reset_mock()
+        engine.process_event(make_key_event(ecodes.BTN_EXTRA, 0))
+        assert mock_uinput.write.call_count == 2
+        mock_uinput.syn.assert_called_once_with()
+
 
 class TestDisabledBinding:
     """Tests for disabled bindings."""
@@ -392,6 +548,19 @@ class TestStateManagement:
         engine.process_event(make_key_event(ecodes.BTN_SIDE, 0))
         assert ecodes.BTN_SIDE not in engine.state.physical_pressed
 
+    def test_pressed_bitmap_tracks_each_code(self, simple_profile, mock_uinput):
+        """Test the pressed bitmap sets and clears individual code bits."""
+        engine = RemapEngine(simple_profile)
+        engine.set_uinput(mock_uinput)
+
+        for code in (ecodes.KEY_Q, ecodes.KEY_W, ecodes.KEY_MAX):
+            engine.process_event(make_key_event(code, 1))
+        engine.process_event(make_key_event(ecodes.KEY_W, 0))
+
+        assert engine.state.is_pressed(ecodes.KEY_Q)
+        assert not engine.state.is_pressed(ecodes.KEY_W)
+        assert engine.state.physical_pressed == {ecodes.KEY_Q, ecodes.KEY_MAX}
+
     def test_tracks_active_bindings(self, simple_profile, mock_uinput):
         """Test tracks active bindings."""
         engine = RemapEngine(simple_profile)
@@ -434,6 +603,26 @@ class TestReleaseAllKeys:
         assert len(engine.state.active_bindings) == 0
         assert len(engine.state.output_held) == 0
 
+    def test_releases_in_one_frame(self, simple_profile, mock_uinput):
+        """Test every held key is released with a single syn, chords in reverse."""
+        engine = RemapEngine(simple_profile)
+        engine.set_uinput(mock_uinput)
+
+        engine.process_event(make_key_event(ecodes.BTN_SIDE, 1))
+        engine.process_event(make_key_event(ecodes.BTN_EXTRA, 1))
+        engine.state.output_held.add(ecodes.KEY_X)
+        mock_uinput.reset_mock()
+
+        engine.release_all_keys()
+
+        assert mock_uinput.write.call_args_list == [
+            call(ecodes.EV_KEY, ecodes.KEY_A, 0),
+            call(ecodes.EV_KEY, ecodes.KEY_C, 0),
+            call(ecodes.EV_KEY, ecodes.KEY_LEFTCTRL, 0),
+            call(ecodes.EV_KEY, ecodes.KEY_X, 0),
+        ]
+        mock_uinput.syn.assert_called_once()
+
 
 class TestReloadProfile:
     """Tests for profile reloading."""
@@ -453,6 +642,24 @@ class TestReloadProfile:
         assert len(engine.state.active_bindings) == 0
         assert engine.state.active_layer == "base"
 
+    def test_reload_reuses_state_object(self, hypershift_profile, empty_profile, mock_uinput):
+        """Test reload resets the existing KeyState in place."""
+        engine = RemapEngine(hypershift_profile)
+        engine.set_uinput(mock_uinput)
+        state = engine.state
+        bits = state.pressed_bits
+
+        engine.process_event(make_key_event(ecodes.BTN_EXTRA, 1))
+        engine.process_event(make_key_event(ecodes.KEY_Q, 1))
+        engine.reload_profile(empty_profile)
+
+        assert engine.state is state
+        assert state.pressed_bits is bits
+        assert state.physical_pressed == set()
+        assert state.active_layer == "base"
+        assert state.layer_modifier_held is None
+        assert engine._active_table is engine._bindings["base"]
+
 
 class TestNonKeyEvents:
     """Tests for non-key events."""
@@ -470,6 +677,34 @@ class TestNonKeyEvents:
         mock_uinput.write.assert_not_called()
 
 
+class TestProcessEvents:
+    """Tests for batch event processing."""
+
+    def test_batch_matches_per_event_handling(self, simple_profile, mock_uinput):
+        """Test a batch remaps bound keys and forwards everything else in order."""
+        engine = RemapEngine(simple_profile)
+        engine.set_uinput(mock_uinput)
+
+        engine.process_events(
+            [
+                InputEvent(0, 0, ecodes.EV_REL, ecodes.REL_X, 10),
+                make_key_event(ecodes.BTN_SIDE, 1),
+                make_key_event(ecodes.KEY_Z, 1),
+                InputEvent(0, 0, ecodes.EV_SYN, ecodes.SYN_REPORT, 0),
+            ]
+        )
+
+        assert mock_uinput.write.call_args_list == [
+            call(ecodes.EV_REL, ecodes.REL_X, 10),
+            call(ecodes.EV_KEY, ecodes.KEY_A, 1),
+            call(ecodes.EV_KEY, ecodes.KEY_Z, 1),
+        ]
+        # One syn for the remapped press, one for the device's SYN_REPORT
+        assert mock_uinput.syn.call_count == 2
+        assert ecodes.BTN_SIDE in engine.state.active_bindings
+        assert engine.state.is_pressed(ecodes.KEY_Z)
+
+
 class TestKeyRepeat:
     """Tests for key repeat events."""
 
@@ -746,6 +981,107 @@ class TestMacroStepTypes:
         assert a_pressed
         assert b_pressed
 
+    def test_compiled_text_uses_frames_not_sleeps(self, mock_uinput):
+        """Test text steps compile to frames and only sleep when asked."""
+        from unittest.mock import patch
+
+        from services.remap_daemon.engine import _OP_SLEEP, _OP_SYN, _OP_WRITE
+
+        macro = MacroAction(
+            id="text",
+            name="Text",
+            steps=[MacroStep(type=MacroStepType.TEXT, text="aB")],
+        )
+        profile = Profile(id="t", name="T", macros=[macro], layers=[Layer(id="base", name="B")])
+        engine = RemapEngine(profile)
+        engine.set_uinput(mock_uinput)
+
+        assert engine._compiled_macros["text"] == (
+            (_OP_WRITE, ecodes.KEY_A, 1),
+            (_OP_SYN, 0, 0),
+            (_OP_WRITE, ecodes.KEY_A, 0),
+            (_OP_WRITE, ecodes.KEY_LEFTSHIFT, 1),
+            (_OP_WRITE, ecodes.KEY_B, 1),
+            (_OP_SYN, 0, 0),
+            (_OP_WRITE, ecodes.KEY_B, 0),
+            (_OP_WRITE, ecodes.KEY_LEFTSHIFT, 0),
+            (_OP_SYN, 0, 0),
+        )
+        with patch("services.remap_daemon.engine.time.sleep") as sleep:
+            engine._execute_macro(macro)
+        sleep.assert_not_called()
+        assert mock_uinput.write.call_count == 6
+        assert mock_uinput.syn.call_count == 3
+
+        macro.steps[0].delay_ms = 5
+        assert sum(op == _OP_SLEEP for op, _, _ in engine._compile_macro(macro)) == 2
+
+    def test_compiled_macro_batches_distinct_keys(self, simple_profile):
+        """Test delay-free key steps share a frame until a key repeats or a delay."""
+        from services.remap_daemon.engine import _OP_SLEEP, _OP_SYN, _OP_WRITE
+
+        engine = RemapEngine(simple_profile)
+        macro = MacroAction(
+            id="m",
+            name="M",
+            steps=[
+                MacroStep(type=MacroStepType.KEY_DOWN, key="CTRL"),
+                MacroStep(type=MacroStepType.KEY_PRESS, key="C"),
+                MacroStep(type=MacroStepType.DELAY, delay_ms=20),
+                MacroStep(type=MacroStepType.KEY_UP, key="CTRL"),
+                MacroStep(type=MacroStepType.KEY_PRESS, key="NOT_A_KEY"),
+            ],
+        )
+
+        assert engine._compile_macro(macro) == (
+            (_OP_WRITE, ecodes.KEY_LEFTCTRL, 1),
+            (_OP_WRITE, ecodes.KEY_C, 1),
+            (_OP_SYN, 0, 0),
+            (_OP_WRITE, ecodes.KEY_C, 0),
+            (_OP_SYN, 0, 0),
+            (_OP_SLEEP, 0.02, 0),
+            (_OP_WRITE, ecodes.KEY_LEFTCTRL, 0),
+            (_OP_SYN, 0, 0),
+        )
+
+    def test_macro_delays_merge_and_track_deadline(self, simple_profile):
+        """Test adjacent delays merge and each sleep only covers the residual."""
+        from unittest.mock import patch
+
+        from services.remap_daemon.engine import _OP_SLEEP
+
+        engine = RemapEngine(simple_profile)
+        macro = MacroAction(
+            id="m",
+            name="M",
+            steps=[
+                MacroStep(type=MacroStepType.KEY_PRESS, key="A"),
+                MacroStep(type=MacroStepType.DELAY, delay_ms=10),
+                MacroStep(type=MacroStepType.DELAY, delay_ms=20),
+            ],
+        )
+        ops = engine._compile_macro(macro)
+        assert [op for op in ops if op[0] == _OP_SLEEP] == [(_OP_SLEEP, 0.03, 0)]
+
+        engine._compiled_macros["m"] = ops
+        # Writes took 10ms, so only the remaining 20ms is slept
+        clock = iter([100.0, 100.01])
+        with (
+            patch("services.remap_daemon.engine.time.perf_counter", lambda: next(clock)),
+            patch("services.remap_daemon.engine.time.sleep") as sleep,
+        ):
+            engine._execute_macro(macro)
+        sleep.assert_called_once()
+        assert sleep.call_args[0][0] == pytest.approx(0.02)
+
+    def test_char_table_precomputed(self, simple_profile):
+        """Test the text char table carries the shift code for uppercase only."""
+        engine = RemapEngine(simple_profile)
+        assert engine._char_table["a"] == (ecodes.KEY_A, 0)
+        assert engine._char_table["A"] == (ecodes.KEY_A, ecodes.KEY_LEFTSHIFT)
+        assert engine._char_table["\n"] == (ecodes.KEY_ENTER, 0)
+        assert "@" not in engine._char_table
+
     def test_macro_text_with_uppercase(self, mock_uinput):
         """Test TEXT macro with uppercase letters (lines 356-366)."""
         profile = Profile(
@@ -982,6 +1318,23 @@ class TestReleaseAllKeysOutputHeld:
 class TestLayerFallback:
     """Tests for layer binding fallback behavior."""
 
+    def test_layer_tables_merge_base_bindings(self, hypershift_profile):
+        """Test each layer table already contains the base fallbacks."""
+        hypershift_profile.layers[0].bindings.append(
+            Binding(input_code="BTN_BACK", action_type=ActionType.KEY, output_keys=["C"])
+        )
+        engine = RemapEngine(hypershift_profile)
+
+        shift = engine._bindings["shift"]
+        assert shift[ecodes.BTN_BACK] is engine._bindings["base"][ecodes.BTN_BACK]
+        assert shift[ecodes.BTN_SIDE].output_codes == (ecodes.KEY_B,)
+        assert engine._active_table is engine._bindings["base"]
+
+        engine.process_event(make_key_event(ecodes.BTN_EXTRA, 1))
+        assert engine._active_table is shift
+        engine.process_event(make_key_event(ecodes.BTN_EXTRA, 0))
+        assert engine._active_table is engine._bindings["base"]
+
     def test_fallback_to_base_layer(self, mock_uinput):
         """Test binding falls back to base layer (line 248)."""
         profile = Profile(
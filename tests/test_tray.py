@@ -438,10 +438,11 @@ class TestX11Hotkeys:
 
         callback = MagicMock()
         backend = X11Hotkeys(callback)
-        backend._shortcuts = [
-            ("profile_0", HotkeyBinding(key="1", modifiers=["ctrl"], enabled=True))
-        ]
+        backend.register_shortcuts(
+            [("profile_0", HotkeyBinding(key="1", modifiers=["ctrl"], enabled=True))]
+        )
         backend._current_keys = {"ctrl"}
+        backend._mod_mask = 1  # ctrl
 
         # Mock key press
         with patch.object(backend, "_normalize_key", return_value="1"):
@@ -457,9 +458,9 @@ class TestX11Hotkeys:
 
         callback = MagicMock()
         backend = X11Hotkeys(callback)
-        backend._shortcuts = [
-            ("profile_0", HotkeyBinding(key="1", modifiers=["ctrl"], enabled=True))
-        ]
+        backend.register_shortcuts(
+            [("profile_0", HotkeyBinding(key="1", modifiers=["ctrl"], enabled=True))]
+        )
         backend._current_keys = set()
 
         with patch.object(backend, "_normalize_key", return_value="a"):
@@ -474,10 +475,11 @@ class TestX11Hotkeys:
 
         callback = MagicMock()
         backend = X11Hotkeys(callback)
-        backend._shortcuts = [
-            ("profile_0", HotkeyBinding(key="1", modifiers=["ctrl"], enabled=True))
-        ]
+        backend.register_shortcuts(
+            [("profile_0", HotkeyBinding(key="1", modifiers=["ctrl"], enabled=True))]
+        )
         backend._current_keys = {"ctrl", "1"}
+        backend._mod_mask = 1  # ctrl
         backend._triggered = {"profile_0"}
 
         with patch.object(backend, "_normalize_key", return_value="1"):
@@ -491,7 +493,7 @@ class TestX11Hotkeys:
 
         callback = MagicMock()
         backend = X11Hotkeys(callback)
-        backend._shortcuts = []
+        backend.register_shortcuts([])
 
         with patch.object(backend, "_normalize_key", return_value=None):
             backend._on_press(MagicMock())
@@ -505,7 +507,7 @@ class TestX11Hotkeys:
         callback = MagicMock()
         backend = X11Hotkeys(callback)
         backend._current_keys = {"ctrl", "a"}
-        backend._shortcuts = []
+        backend.register_shortcuts([])
 
         with patch.object(backend, "_normalize_key", return_value="a"):
             backend._on_release(MagicMock())
@@ -521,9 +523,9 @@ class TestX11Hotkeys:
         backend = X11Hotkeys(callback)
         backend._current_keys = {"ctrl", "1"}
         backend._triggered = {"profile_0"}
-        backend._shortcuts = [
-            ("profile_0", HotkeyBinding(key="1", modifiers=["ctrl"], enabled=True))
-        ]
+        backend.register_shortcuts(
+            [("profile_0", HotkeyBinding(key="1", modifiers=["ctrl"], enabled=True))]
+        )
 
         with patch.object(backend, "_normalize_key", return_value="1"):
             backend._on_release(MagicMock())
@@ -537,7 +539,7 @@ class TestX11Hotkeys:
         callback = MagicMock()
         backend = X11Hotkeys(callback)
         backend._current_keys = {"ctrl"}
-        backend._shortcuts = []
+        backend.register_shortcuts([])
 
         with patch.object(backend, "_normalize_key", return_value=None):
             backend._on_release(MagicMock())
@@ -637,7 +639,8 @@ class TestHotkeyListener:
                 listener = HotkeyListener(callback)
                 listener._on_shortcut_activated("profile_3")
 
-                callback.assert_called_once_with(3)
+                callback.assert_not_called()
+                assert listener._switch_queue.get_nowait() == 3
 
     def test_on_shortcut_activated_invalid_action(self):
         """Test _on_shortcut_activated ignores invalid action_id."""
@@ -669,6 +672,22 @@ class TestHotkeyListener:
 
                 callback.assert_not_called()
 
+    def test_on_shortcut_activated_uses_precomputed_index(self):
+        """Test action IDs map to indexes for every cached binding."""
+        from apps.tray.hotkeys import HotkeyListener
+
+        with patch("apps.tray.hotkeys.PortalGlobalShortcuts") as mock_portal:
+            with patch("apps.tray.hotkeys.X11Hotkeys") as mock_x11:
+                mock_portal.return_value.is_available.return_value = False
+                mock_x11.return_value.is_available.return_value = False
+
+                listener = HotkeyListener(MagicMock())
+                count = len(listener.get_bindings())
+                assert listener._action_index == {f"profile_{i}": i for i in range(count)}
+
+                listener._on_shortcut_activated(f"profile_{count}")
+                assert listener._switch_queue.empty()
+
     def test_build_shortcuts(self):
         """Test _build_shortcuts creates shortcut list."""
         from apps.tray.hotkeys import HotkeyListener
@@ -713,7 +732,7 @@ class TestHotkeyListener:
                 listener = HotkeyListener(callback, sm)
                 result = listener.get_bindings()
 
-                assert result == bindings
+                assert result == tuple(bindings)
 
     def test_reload_bindings(self):
         """Test reload_bindings reloads from disk."""
@@ -737,6 +756,27 @@ class TestHotkeyListener:
                 sm.load.assert_called_once()
                 mock_backend.register_shortcuts.assert_called()
 
+    def test_reload_bindings_refreshes_cache(self):
+        """Test reload_bindings picks up bindings changed on disk."""
+        from apps.tray.hotkeys import HotkeyListener
+        from crates.profile_schema import HotkeyBinding, SettingsManager
+
+        with patch("apps.tray.hotkeys.PortalGlobalShortcuts") as mock_portal:
+            with patch("apps.tray.hotkeys.X11Hotkeys") as mock_x11:
+                mock_portal.return_value.is_available.return_value = False
+                mock_x11.return_value.is_available.return_value = False
+
+                sm = MagicMock(spec=SettingsManager)
+                sm.settings.hotkeys.profile_hotkeys = []
+                listener = HotkeyListener(MagicMock(), sm)
+                assert listener.get_bindings() == ()
+
+                binding = HotkeyBinding(key="1", modifiers=["ctrl"], enabled=True)
+                sm.settings.hotkeys.profile_hotkeys = [binding]
+                listener.reload_bindings()
+
+                assert listener.get_bindings() == (binding,)
+
     def test_start_no_backend(self):
         """Test start does nothing without backend."""
         from apps.tray.hotkeys import HotkeyListener